@@ -0,0 +1,79 @@
+"""Cleaning-pipeline benchmark — per-rule timings on real page text.
+
+Runs the default cleaning rules over every page of an extraction result and
+prints the pipeline's per-rule stats, then times the encoding step's bulk
+surrogate cleaner against the original per-character ``encode`` loop.  A
+lone surrogate is planted on every tenth page so the slow path is exercised.
+
+    python -m benchmarks.bench_cleaning [extracted.json] [--copies N]
+
+Without arguments the input is ``output/extracted_text.json``; ``--copies``
+repeats its pages to simulate a longer report.
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from src.app_config import OUTPUT_DIR
+from src.extract import CleaningPipeline, _drop_unencodable, default_cleaning_rules
+from src.extraction_io import load_extraction
+
+
+def _per_char_drop(text: str) -> tuple[str, int]:
+    """The pre-regex implementation, kept as the reference."""
+    kept = []
+    for ch in text:
+        try:
+            ch.encode("utf-8")
+            kept.append(ch)
+        except UnicodeEncodeError:
+            pass
+    return "".join(kept), len(text) - len(kept)
+
+
+def load_pages(path: Path, copies: int) -> list[str]:
+    pages = load_extraction(path)["pages"]
+    if hasattr(pages, "page_dicts"):
+        pages = pages.page_dicts()
+    texts = [p["text"] or "" for p in pages] * copies
+    return [t + "\ud800" if i % 10 == 0 else t for i, t in enumerate(texts)]
+
+
+def _time(fn, texts: list[str]) -> float:
+    start = time.perf_counter()
+    for text in texts:
+        fn(text)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the cleaning pipeline")
+    parser.add_argument("input", nargs="?", type=Path, default=OUTPUT_DIR / "extracted_text.json")
+    parser.add_argument("--copies", type=int, default=3, help="Repeat the pages this many times")
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        parser.error(f"{args.input} not found; run `python -m src.cli extract` first")
+
+    logging.getLogger("src.extract").setLevel(logging.ERROR)  # one warning per planted surrogate
+    texts = load_pages(args.input, args.copies)
+    print(f"{len(texts)} pages, {sum(map(len, texts)):,} characters")
+
+    pipeline = CleaningPipeline(default_cleaning_rules(set(), {}))
+    for page_number, text in enumerate(texts, start=1):
+        pipeline.clean(page_number, text)
+    print(f"\n{'rule':16} {'lines dropped':>14} {'ms':>9}")
+    for name, stats in pipeline.stats.items():
+        print(f"{name:16} {stats['lines_dropped']:>14} {stats['seconds'] * 1000:>9.2f}")
+
+    if [_drop_unencodable(t) for t in texts] != [_per_char_drop(t) for t in texts]:
+        raise SystemExit("bulk cleaner output differs from the per-character loop")
+    per_char = _time(_per_char_drop, texts)
+    bulk = _time(_drop_unencodable, texts)
+    print(f"\nsurrogate cleanup: per-char {per_char:.1f} ms, bulk {bulk:.1f} ms ({per_char / bulk:.0f}x)")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,272 @@
+"""Extraction scaling benchmark over synthetic PDFs.
+
+Generates PDFs with fitz — 50 to 2000 pages, in three variants (``outline``,
+``contents`` page, ``no_outline``), each page carrying a nav bar, a top
+hyperlink, an arrow link, body text and periodic headings — and times every
+section-detection tier and every cleaning step separately.
+
+    python -m benchmarks.bench_extraction [--pages 50 200 1000 2000]
+        [--variants outline contents no_outline] [--repeat 3]
+        [--output output/bench_extraction.json]
+        [--compare baseline.json [--threshold 1.25]]
+
+Each stage is timed in isolation (fresh layout cache, fitz text as the raw
+page text) and the best of ``--repeat`` runs is kept.  ``--compare`` loads a
+previous results file and exits non-zero if any stage got slower than
+``threshold ×`` its baseline time; stages under ``--floor-ms`` in both runs
+are ignored as noise.  Keep a baseline by saving a run with
+``--output benchmarks/baseline_extraction.json``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import fitz
+
+from src.app_config import OUTPUT_DIR
+from src.extract import (
+    LayoutCache,
+    _build_nav_bar_lines,
+    _encoding_cleanup,
+    _find_contents_page_index,
+    _font_heuristic_sections,
+    _get_top_hyperlink_texts,
+    _parse_contents_page,
+    _remove_arrow_links,
+    _remove_nav_bars,
+    _remove_top_hyperlinks,
+    _sections_from_toc,
+    compute_end_pages,
+)
+
+VARIANTS = ("outline", "contents", "no_outline")
+_CHAPTER_EVERY = 10  # pages per chapter heading
+_SUBSECTION_EVERY = 3  # pages per sub-heading
+
+
+# ── synthetic PDFs ─────────────────────────────────────────────────────────
+
+
+def build_pdf(
+    path: Path,
+    pages: int,
+    variant: str = "outline",
+    *,
+    chapter_every: int = _CHAPTER_EVERY,
+    subsection_every: int = _SUBSECTION_EVERY,
+    filler_lines: int = 12,
+    nav_link: bool = True,
+) -> Path:
+    """Write a synthetic report of *pages* pages in the given *variant*.
+
+    Every body page carries a nav bar (hyperlinked unless ``nav_link`` is
+    false), body text, an arrow link and *filler_lines* numeric lines; a
+    ``Chapter N Overview`` heading opens every *chapter_every* pages and a
+    smaller ``Segment Analysis`` heading every *subsection_every* pages
+    (``0`` disables them).  ``tests/conftest.py`` builds its fixtures with
+    this too, so the benchmarks and the tests share one document shape.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant '{variant}'; expected one of {VARIANTS}")
+
+    doc = fitz.open()
+    toc: list[list] = []
+    body_start = 2 if variant == "contents" else 0  # cover + Contents page
+    for i in range(body_start):
+        doc.new_page()
+
+    for i in range(body_start, pages):
+        page = doc.new_page()
+        n = i - body_start
+        page.insert_text((72, 40), "Home  About  Investors", fontsize=9)
+        if nav_link:
+            page.insert_link({"kind": fitz.LINK_URI, "from": fitz.Rect(72, 30, 200, 45), "uri": "https://example.com"})
+        y = 100
+        if chapter_every and n % chapter_every == 0:
+            title = f"Chapter {n // chapter_every + 1} Overview"
+            page.insert_text((72, y), title, fontsize=28, fontname="hebo")
+            toc.append([1, title, i + 1])
+            y += 50
+        elif subsection_every and n % subsection_every == 0:
+            title = f"Segment Analysis {i + 1}"
+            page.insert_text((72, y), title, fontsize=20, fontname="hebo")
+            toc.append([2, title, i + 1])
+            y += 35
+        page.insert_text((72, y), f"Body text on page {i + 1}. Revenue grew {i}% year on year.", fontsize=11)
+        page.insert_text((72, y + 20), "→ Read more online", fontsize=11)
+        page.insert_text((72, y + 40), f"Operating margin was {10 + i}.5% in the period.", fontsize=11)
+        for line in range(filler_lines):
+            page.insert_text(
+                (72, y + 60 + line * 16),
+                f"Revenue in segment {line} grew {i % 17}.{line}% while margins held at {20 + line}% on page {i + 1}.",
+                fontsize=10,
+            )
+
+    if variant == "contents":
+        contents = doc[1]
+        contents.insert_text((72, 60), "Contents", fontsize=20)
+        chapters = [entry for entry in toc if entry[0] == 1][:30]
+        for row, (_, title, page_number) in enumerate(chapters):
+            contents.insert_text((72, 100 + row * 20), f"{title} ........ {page_number}", fontsize=11)
+    elif variant == "outline":
+        doc.set_toc(toc)
+
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+# ── timing ─────────────────────────────────────────────────────────────────
+
+
+def _best_ms(fn, repeat: int):
+    """Run *fn* ``repeat`` times; return ``(best_ms, last_result)``."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 3), result
+
+
+def bench_pdf(path: Path, repeat: int) -> dict:
+    """Time every detection tier and cleaning step on one PDF."""
+    timings: dict[str, float] = {}
+    timings["open"], fitz_doc = _best_ms(lambda: fitz.open(str(path)), 1)
+    try:
+        total = len(fitz_doc)
+        timings["text_fitz"], texts = _best_ms(lambda: [fitz_doc[i].get_text() for i in range(total)], repeat)
+        raw_pages = [{"page_number": i + 1, "text": t} for i, t in enumerate(texts)]
+
+        # Section detection — every tier, whether or not it would be chosen.
+        timings["tier1_toc"], _ = _best_ms(lambda: _sections_from_toc(fitz_doc.get_toc()), repeat)
+
+        def tier2():
+            idx = _find_contents_page_index(raw_pages)
+            return _parse_contents_page(fitz_doc[idx]) if idx is not None else []
+
+        timings["tier2_contents"], _ = _best_ms(tier2, repeat)
+        timings["tier3_font"], font_sections = _best_ms(
+            lambda: _font_heuristic_sections(fitz_doc, total, LayoutCache(fitz_doc)), repeat
+        )
+        timings["end_pages"], _ = _best_ms(lambda: compute_end_pages(font_sections, total), repeat)
+
+        # Cleaning — document-wide inputs, then each step on its own.
+        timings["nav_bar_stats"], nav_lines = _best_ms(lambda: _build_nav_bar_lines(raw_pages, total), repeat)
+        timings["top_link_scan"], top_map = _best_ms(
+            lambda: _get_top_hyperlink_texts(fitz_doc, total, LayoutCache(fitz_doc)), repeat
+        )
+        timings["clean_nav_bars"], _ = _best_ms(lambda: _remove_nav_bars(texts, nav_lines), repeat)
+        timings["clean_arrow_links"], _ = _best_ms(lambda: _remove_arrow_links(texts), repeat)
+        timings["clean_top_hyperlinks"], _ = _best_ms(lambda: _remove_top_hyperlinks(raw_pages, top_map), repeat)
+        timings["clean_encoding"], _ = _best_ms(lambda: _encoding_cleanup(texts, raw_pages), repeat)
+    finally:
+        fitz_doc.close()
+
+    return {"pages": total, "font_sections": len(font_sections), "timings_ms": timings}
+
+
+def run_suite(sizes: list[int], variants: list[str], repeat: int, pdf_dir: Path) -> dict:
+    results = []
+    for variant in variants:
+        for pages in sizes:
+            path = pdf_dir / f"{variant}_{pages}.pdf"
+            if not path.exists():
+                build_pdf(path, pages, variant)
+            entry = bench_pdf(path, repeat)
+            entry["variant"] = variant
+            results.append(entry)
+            total_ms = sum(entry["timings_ms"].values())
+            print(f"  {variant:10} {pages:>5} pages  {total_ms:>9.1f} ms", file=sys.stderr)
+    return {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "pymupdf": fitz.VersionBind,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+# ── baseline comparison ────────────────────────────────────────────────────
+
+
+def compare(current: dict, baseline: dict, threshold: float, floor_ms: float) -> list[dict]:
+    """Stages slower than ``threshold ×`` the baseline, matched by
+    ``(variant, pages, stage)``."""
+    base = {(r["variant"], r["pages"]): r["timings_ms"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = base.get((result["variant"], result["pages"]))
+        if before is None:
+            continue
+        for stage, ms in result["timings_ms"].items():
+            old = before.get(stage)
+            if old is None or max(ms, old) < floor_ms:
+                continue
+            if ms > old * threshold:
+                regressions.append(
+                    {
+                        "variant": result["variant"],
+                        "pages": result["pages"],
+                        "stage": stage,
+                        "baseline_ms": old,
+                        "current_ms": ms,
+                        "ratio": round(ms / old, 2) if old else float("inf"),
+                    }
+                )
+    return regressions
+
+
+def _print_table(report: dict) -> None:
+    stages = list(report["results"][0]["timings_ms"]) if report["results"] else []
+    print(f"{'variant':10} {'pages':>5} " + " ".join(f"{s:>14}" for s in stages))
+    for result in report["results"]:
+        cells = " ".join(f"{result['timings_ms'][s]:>14.2f}" for s in stages)
+        print(f"{result['variant']:10} {result['pages']:>5} {cells}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark extraction stages on synthetic PDFs")
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 200, 1000, 2000], help="PDF sizes")
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage (best is kept)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR / "bench_extraction.json")
+    parser.add_argument("--pdf-dir", type=Path, default=None, help="Keep generated PDFs here (default: temp dir)")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio flagged as a regression")
+    parser.add_argument("--floor-ms", type=float, default=1.0, help="Ignore stages faster than this in both runs")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_dir = args.pdf_dir or Path(tmp)
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+        report = run_suite(args.pages, args.variants, args.repeat, pdf_dir)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _print_table(report)
+    print(f"Results written → {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold, args.floor_ms)
+        if not regressions:
+            print(f"No regressions against {args.compare} (threshold {args.threshold}x)")
+            return
+        print(f"{len(regressions)} regression(s) against {args.compare}:")
+        for r in regressions:
+            print(
+                f"  {r['variant']:10} {r['pages']:>5} {r['stage']:22} "
+                f"{r['baseline_ms']:>9.2f} → {r['current_ms']:>9.2f} ms ({r['ratio']}x)"
+            )
+        sys.exit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
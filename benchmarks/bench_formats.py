@@ -0,0 +1,84 @@
+"""On-disk format comparison — size, write time and load time.
+
+Saves one extraction result in every format ``extraction_io`` supports and
+times a full load of each (``load_extraction`` + touching every page).
+
+    python -m benchmarks.bench_formats [extracted.json] [--repeat N]
+
+Without arguments the input is ``output/extracted_text.json``.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.app_config import OUTPUT_DIR
+from src.extraction_io import PACKED_SUFFIX, encode_packed, load_extraction, save_extraction, zstandard
+from src.page_store import PAGE_STORE_SUFFIX
+
+
+def _time(fn, repeat: int) -> float:
+    """Best-of-*repeat* wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _load_all(path: Path) -> None:
+    result = load_extraction(path)
+    pages = result["pages"]
+    if hasattr(pages, "page_dicts"):
+        pages.page_dicts()
+        pages.close()
+
+
+def run_bench(result: dict, repeat: int = 5) -> list[dict]:
+    variants = [("json (indent=2)", ".json", None), ("ndjson", ".ndjson", None), ("page store", PAGE_STORE_SUFFIX, None)]
+    codecs = ["none", "zlib"] + (["zstd"] if zstandard is not None else [])
+    variants += [(f"packed/{codec}", PACKED_SUFFIX, codec) for codec in codecs]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, suffix, codec in variants:
+            path = Path(tmp) / f"{name.replace('/', '_').split()[0]}{suffix}"
+            if codec is None:
+                write = lambda: save_extraction(result, path)  # noqa: E731
+            else:
+                write = lambda: path.write_bytes(encode_packed(result, codec=codec))  # noqa: E731
+            write_ms = _time(write, repeat)
+            rows.append(
+                {
+                    "format": name,
+                    "bytes": path.stat().st_size,
+                    "write_ms": round(write_ms, 2),
+                    "load_ms": round(_time(lambda: _load_all(path), repeat), 2),
+                }
+            )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare extraction output formats")
+    parser.add_argument("input", nargs="?", type=Path, default=OUTPUT_DIR / "extracted_text.json")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    if not args.input.exists():
+        parser.error(f"{args.input} not found; run `python -m src.cli extract` first")
+
+    rows = run_bench(load_extraction(args.input), repeat=args.repeat)
+    baseline = rows[0]["bytes"]
+    print(f"{'format':18} {'bytes':>10} {'ratio':>6} {'write ms':>9} {'load ms':>8}")
+    for row in rows:
+        print(
+            f"{row['format']:18} {row['bytes']:>10} {row['bytes'] / baseline:>6.2f} "
+            f"{row['write_ms']:>9.2f} {row['load_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
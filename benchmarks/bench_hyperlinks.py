@@ -0,0 +1,80 @@
+"""Top-hyperlink line removal — nested substring scan vs ``SnippetIndex``.
+
+Builds synthetic link-heavy pages (hundreds of top-of-page link spans, a
+navigation block repeating their words, and ordinary body text), runs the
+original ``any(tok in sn for sn in snippets)`` scan and the indexed
+``_remove_top_hyperlinks``, checks the outputs are identical, and prints the
+timings.
+
+    python -m benchmarks.bench_hyperlinks [--links 50 200 800] [--pages 20]
+"""
+
+import argparse
+import random
+import time
+
+from src.extract import _remove_top_hyperlinks
+
+_WORDS = (
+    "revenue order intake turbines offshore onshore service margin guidance capital "
+    "sustainability governance risk shareholders board remuneration strategy outlook "
+    "investors careers contact news media about home sitemap"
+).split()
+
+
+def _nested_scan(raw_pages: list[dict], top_map: dict[int, set[str]]) -> list[str]:
+    """The pre-index implementation, kept as the reference."""
+    cleaned = []
+    for page in raw_pages:
+        snippets = top_map.get(page["page_number"], set())
+        if not snippets:
+            cleaned.append(page["text"] or "")
+            continue
+        filtered = []
+        for ln in (page["text"] or "").split("\n"):
+            tokens = ln.split()
+            if tokens and all(any(tok in sn for sn in snippets) for tok in tokens):
+                continue
+            filtered.append(ln)
+        cleaned.append("\n".join(filtered))
+    return cleaned
+
+
+def build_pages(n_links: int, n_pages: int, seed: int = 0) -> tuple[list[dict], dict[int, set[str]]]:
+    rng = random.Random(seed)
+    raw_pages, top_map = [], {}
+    for pn in range(1, n_pages + 1):
+        snippets = {f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS)} {i}" for i in range(n_links)}
+        nav = [" ".join(rng.sample(sorted(snippets), 3)) for _ in range(n_links // 4)]
+        body = [" ".join(rng.choices(_WORDS, k=12)) + f" {rng.randint(0, 999)}%" for _ in range(60)]
+        raw_pages.append({"page_number": pn, "text": "\n".join(nav + body)})
+        top_map[pn] = snippets
+    return raw_pages, top_map
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark top-hyperlink line removal")
+    parser.add_argument("--links", type=int, nargs="+", default=[50, 200, 800], help="Link spans per page")
+    parser.add_argument("--pages", type=int, default=20, help="Pages per run")
+    args = parser.parse_args()
+
+    print(f"{'links/page':>10} {'nested ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for n_links in args.links:
+        raw_pages, top_map = build_pages(n_links, args.pages)
+        expected = _nested_scan(raw_pages, top_map)
+        if _remove_top_hyperlinks(raw_pages, top_map) != expected:
+            raise SystemExit(f"output mismatch at {n_links} links/page")
+
+        nested = _time(lambda: _nested_scan(raw_pages, top_map))
+        indexed = _time(lambda: _remove_top_hyperlinks(raw_pages, top_map))
+        print(f"{n_links:>10} {nested:>10.1f} {indexed:>11.1f} {nested / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,69 @@
+"""Peak-memory benchmark — does extraction RSS stay flat as page count grows?
+
+Builds synthetic PDFs (see ``bench_extraction.build_pdf``) and extracts each
+one in a fresh Python process, once per memory target, reading the peak RSS
+the extractor records in ``metadata.stats``.  A separate process per run
+keeps one run's peak from hiding the next.
+
+    python -m benchmarks.bench_memory [--pages 100 300 600]
+        [--targets 0 64] [--engine pdfplumber] [--pdf-dir DIR]
+
+Target ``0`` is the default mode; any other value is a low-memory run with
+that ``EXTRACTION_MEMORY_TARGET_MB``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_extraction import build_pdf
+
+_CHILD = """
+import json, sys
+from src.extract import PDFExtractor
+result = PDFExtractor(text_engine=sys.argv[2], memory_target_mb=int(sys.argv[3])).extract(sys.argv[1])
+print(json.dumps(result["metadata"]["stats"]))
+"""
+
+
+def measure(pdf: Path, engine: str, target_mb: int) -> dict:
+    """Extract *pdf* in a child process; return its ``metadata.stats``."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(pdf), engine, str(target_mb)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure extraction peak RSS against page count")
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 300, 600], help="PDF sizes")
+    parser.add_argument("--targets", type=int, nargs="+", default=[0, 64], help="Memory targets in MB (0 = off)")
+    parser.add_argument("--engine", default="pdfplumber", choices=["pdfplumber", "fitz", "auto"])
+    parser.add_argument("--pdf-dir", type=Path, default=None, help="Keep generated PDFs here (default: temp dir)")
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'target MB':>10} {'peak RSS MB':>12} {'reopens':>8} {'seconds':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_dir = args.pdf_dir or Path(tmp)
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+        for pages in args.pages:
+            pdf = pdf_dir / f"outline_{pages}.pdf"
+            if not pdf.exists():
+                build_pdf(pdf, pages, "outline")
+            for target in args.targets:
+                stats = measure(pdf, args.engine, target)
+                counters = stats["counters"]
+                print(
+                    f"{pages:>6} {target or 'off':>10} {counters.get('peak_rss_mb', 0):>12} "
+                    f"{counters.get('pdf_reopens', 0):>8} {stats['timings_ms']['total'] / 1000:>8.1f}"
+                )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,109 @@
+"""Text-engine parity report — what do the fast engines lose vs pdfplumber?
+
+Runs a full extraction of every PDF in the corpus with each text engine and
+diffs the cleaned page text against the ``pdfplumber`` baseline, page by page.
+
+    python -m benchmarks.engine_parity [pdf ...] [--output report.json]
+
+Without arguments the corpus is every PDF under ``tests/data/`` and ``data/``.
+"""
+
+import argparse
+import difflib
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from src.app_config import BASE_DIR, DATA_DIR, OUTPUT_DIR
+from src.extract import PDFExtractor
+
+# Pages whose similarity to the baseline falls below this are listed.
+_SIMILARITY_FLOOR = 0.98
+
+
+def default_corpus() -> list[Path]:
+    return sorted((BASE_DIR / "tests" / "data").glob("*.pdf")) + sorted(DATA_DIR.glob("*.pdf"))
+
+
+def page_similarity(baseline: str, candidate: str) -> float:
+    """Word-sequence similarity in ``[0, 1]``; whitespace differences are ignored."""
+    a, b = baseline.split(), candidate.split()
+    if not a and not b:
+        return 1.0
+    return difflib.SequenceMatcher(None, a, b, autojunk=False).ratio()
+
+
+def diff_engines(baseline: dict, candidate: dict) -> dict:
+    """Compare two extraction results of the same PDF."""
+    pages = []
+    lost: Counter = Counter()
+    gained: Counter = Counter()
+    for base_page, cand_page in zip(baseline["pages"], candidate["pages"]):
+        similarity = page_similarity(base_page["text"], cand_page["text"])
+        base_words, cand_words = Counter(base_page["text"].split()), Counter(cand_page["text"].split())
+        lost.update(base_words - cand_words)
+        gained.update(cand_words - base_words)
+        pages.append({"page_number": base_page["page_number"], "similarity": round(similarity, 4)})
+
+    similarities = [p["similarity"] for p in pages] or [1.0]
+    return {
+        "mean_similarity": round(sum(similarities) / len(similarities), 4),
+        "min_similarity": min(similarities),
+        "pages_below_floor": [p for p in pages if p["similarity"] < _SIMILARITY_FLOOR],
+        "words_lost": sum(lost.values()),
+        "words_gained": sum(gained.values()),
+        "top_lost_words": lost.most_common(10),
+        "sections_identical": baseline["sections"] == candidate["sections"],
+    }
+
+
+def run_report(pdfs: list[Path]) -> list[dict]:
+    report = []
+    for pdf in pdfs:
+        results, timings = {}, {}
+        for engine in ("pdfplumber", "fitz", "auto"):
+            start = time.perf_counter()
+            results[engine] = PDFExtractor(text_engine=engine).extract(str(pdf))
+            timings[engine] = round(time.perf_counter() - start, 3)
+
+        entry = {"pdf": pdf.name, "pages": results["pdfplumber"]["metadata"]["total_pages"], "seconds": timings}
+        for engine in ("fitz", "auto"):
+            entry[engine] = diff_engines(results["pdfplumber"], results[engine])
+        report.append(entry)
+    return report
+
+
+def _print_table(report: list[dict]) -> None:
+    print(f"{'PDF':40} {'pages':>5} {'engine':>6} {'speedup':>8} {'mean sim':>9} {'min sim':>8} {'lost':>6} {'sections':>9}")
+    for entry in report:
+        base_seconds = entry["seconds"]["pdfplumber"]
+        for engine in ("fitz", "auto"):
+            diff = entry[engine]
+            speedup = base_seconds / entry["seconds"][engine] if entry["seconds"][engine] else float("inf")
+            print(
+                f"{entry['pdf'][:40]:40} {entry['pages']:>5} {engine:>6} {speedup:>7.1f}x "
+                f"{diff['mean_similarity']:>9.4f} {diff['min_similarity']:>8.4f} {diff['words_lost']:>6} "
+                f"{'same' if diff['sections_identical'] else 'DIFF':>9}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff page text between extraction engines")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="PDFs to compare (default: test corpus)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_DIR / "engine_parity.json", help="Report JSON path")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or default_corpus()
+    if not pdfs:
+        parser.error("no PDFs found; pass paths explicitly")
+
+    report = run_report(pdfs)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    _print_table(report)
+    print(f"Report written → {args.output}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -7,7 +7,6 @@ pipeline functions.
 import json
 import os
 import sys
-import tempfile
 
 import streamlit as st
 from dotenv import load_dotenv
@@ -21,7 +20,7 @@ load_dotenv()
 
 from src.bootstrapper import bootstrap  # noqa: E402
 from src.app_config import DATA_DIR, DEFAULT_PDF  # noqa: E402
-from src.extract import run_extraction  # noqa: E402
+from src.extraction_job import ExtractionJob  # noqa: E402
 from src.pipeline import run_pipeline  # noqa: E402
 
 bootstrap()
@@ -36,11 +35,21 @@ bootstrap()
 def _build_section_tree(sections: list[dict]) -> list[dict]:
     """Convert a flat section list into a nested tree.
 
-    Each node is ``{"section": <dict>, "children": [<node>, …]}``.
-    A section at level N+1 becomes a child of the nearest preceding level-N
+    Each node is ``{"section": <dict>, "children": [<node>, …]}``.  Sections
+    from ``compute_end_pages`` carry ``parent_id`` and are linked directly;
+    older extraction files without ids fall back to the level stack, where a
+    section at level N+1 becomes a child of the nearest preceding level-N
     node.
     """
-    root: list[dict] = []
+    if all("id" in sec for sec in sections):
+        nodes = {sec["id"]: {"section": sec, "children": []} for sec in sections}
+        root: list[dict] = []
+        for sec in sections:
+            parent = nodes.get(sec.get("parent_id"))
+            (parent["children"] if parent else root).append(nodes[sec["id"]])
+        return root
+
+    root = []
     stack: list[dict] = [{"children": root}]  # virtual root
 
     for sec in sections:
@@ -131,6 +140,35 @@ def _get_checked_sections(tree: list[dict]) -> list[dict]:
     return result
 
 
+def _render_extraction_job(job: ExtractionJob) -> None:
+    """Progress bar + cancel button for a running extraction; publishes the
+    detected sections, then the full result, into session state."""
+    milestone = (id(job), job.state, job.sections is not None)
+    if job.sections is not None:
+        st.session_state["sections"] = job.sections
+    if job.state == "done":
+        st.session_state["extracted_data"] = job.result
+        st.session_state["sections"] = job.result.get("sections", [])
+
+    if job.running:
+        progress = job.progress
+        st.progress(progress.fraction if progress else 0.0, text=progress.message if progress else "Opening PDF …")
+        if job.sections is not None:
+            st.caption("Sections detected — you can select them in the Generate tab while cleaning finishes.")
+        st.button("Cancel extraction", on_click=job.cancel)
+    elif job.state == "done":
+        st.success("Extraction complete!")
+    elif job.state == "cancelled":
+        st.warning("Extraction cancelled.")
+    elif job.state == "failed":
+        st.error(f"Extraction failed: {job.error}")
+
+    seen = st.session_state.get("extraction_job_seen")
+    st.session_state["extraction_job_seen"] = milestone
+    if seen is not None and seen != milestone:
+        st.rerun()  # full rerun so the other tabs see the new sections / result
+
+
 # Emoji mapping shared by Tab 4.
 _STATUS_EMOJI = {
     "TRACED": "✅",
@@ -222,27 +260,32 @@ with tab_extract:
     extract_btn = st.button("Extract", disabled=not extract_possible)
 
     if extract_btn:
-        if using_default:
-            pdf_path = str(DEFAULT_PDF)
-        else:
-            tmp = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-            tmp.write(uploaded_file.getvalue())
-            tmp.close()
-            pdf_path = tmp.name
-
-        try:
-            with st.status("Extracting …", expanded=True) as status:
-                st.write("Opening PDF …")
-                result = run_extraction(file_path=pdf_path)
-                st.session_state["extracted_data"] = result
-                st.session_state["sections"] = result.get("sections", [])
-                # Clear downstream state so stale results don't linger.
-                for key in ("selected_sections", "page_overrides", "script", "verification", "word_count"):
-                    st.session_state.pop(key, None)
-                status.update(label="Extraction complete!", state="complete")
-        finally:
-            if not using_default:
-                os.unlink(pdf_path)
+        # An upload is extracted straight from memory — fitz and pdfplumber
+        # share its buffer, so it is never written to a temporary file.
+        pdf_source = str(DEFAULT_PDF) if using_default else uploaded_file
+
+        previous = st.session_state.get("extraction_job")
+        if previous is not None:
+            previous.cancel()
+        # Clear downstream state so stale results don't linger.
+        for key in (
+            "extracted_data",
+            "sections",
+            "selected_sections",
+            "page_overrides",
+            "script",
+            "verification",
+            "word_count",
+        ):
+            st.session_state.pop(key, None)
+        st.session_state["extraction_job"] = ExtractionJob(pdf_source).start()
+        st.session_state["extraction_job_seen"] = None
+
+    job = st.session_state.get("extraction_job")
+    if job is not None:
+        # Polls the background job without rerunning the other tabs; a full
+        # rerun happens only when sections arrive or the job ends.
+        st.fragment(run_every=0.5 if job.running else None)(_render_extraction_job)(job)
 
     # Show detected sections table when available.
     if "sections" in st.session_state and st.session_state["sections"]:
@@ -263,10 +306,13 @@ with tab_extract:
 # TAB 2 — Generate
 # ══════════════════════════════════════════════════════════════════════════════
 with tab_generate:
-    if "extracted_data" not in st.session_state or st.session_state["extracted_data"] is None:
+    extraction_ready = st.session_state.get("extracted_data") is not None
+    if not extraction_ready and not st.session_state.get("sections"):
         st.info("Run extraction first (Tab 1) before generating a podcast.")
     else:
         st.header("Select sections")
+        if not extraction_ready:
+            st.info("Page text is still being extracted — select sections now; Generate unlocks when it finishes.")
 
         sections = st.session_state.get("sections", [])
         tree = _build_section_tree(sections) if sections else []
@@ -287,14 +333,14 @@ with tab_generate:
                 title = sec["title"]
                 val = st.session_state["page_overrides"].get(title, "")
                 new_val = st.text_input(
-                    f"{title}:", value=val, placeholder='e.g. "12-15"', key=f"override_{title}"
+                    f"{title}:", value=val, placeholder='e.g. "12-15,40,50-52"', key=f"override_{title}"
                 )
                 st.session_state["page_overrides"][title] = new_val
 
         if not checked:
             st.warning("Select at least one section before generating.")
 
-        gen_btn = st.button("Generate", disabled=not checked)
+        gen_btn = st.button("Generate", disabled=not checked or not extraction_ready)
         if gen_btn:
             overrides = st.session_state.get("page_overrides", {})
             selected = [
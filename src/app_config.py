@@ -28,6 +28,20 @@ MAX_LLM_CALLS: int = int(os.getenv("MAX_LLM_CALLS", "30"))
 # ── Podcast ────────────────────────────────────────────────────────────────
 TARGET_WORD_COUNT: int = int(os.getenv("TARGET_WORD_COUNT", "2000"))
 
+# ── Token budget ───────────────────────────────────────────────────────────
+# Context window of MODEL_NAME, in tokens.  Source text is trimmed to what
+# fits beside each prompt, and a selection that cannot fit even trimmed is
+# refused before the first LLM call.
+MODEL_CONTEXT_TOKENS: int = int(os.getenv("MODEL_CONTEXT_TOKENS", "128000"))
+# Source-text tokens per prompt, for every agent; SOURCE_TOKEN_BUDGET_<AGENT>
+# (e.g. SOURCE_TOKEN_BUDGET_EVALUATOR) overrides it for one agent.  0 means
+# "as much as fits in MODEL_CONTEXT_TOKENS".
+SOURCE_TOKEN_BUDGET: int = int(os.getenv("SOURCE_TOKEN_BUDGET", "0"))
+SOURCE_TOKEN_BUDGETS: dict[str, int] = {
+    agent: int(os.getenv(f"SOURCE_TOKEN_BUDGET_{agent.upper()}", str(SOURCE_TOKEN_BUDGET)))
+    for agent in ("key_points", "generator", "evaluator", "improver", "claims", "coverage")
+}
+
 # ── Extraction ─────────────────────────────────────────────────────────────
 # Lines appearing on more than this many pages are treated as nav bars.
 # 0 means "auto: floor(total_pages / 2)" — calculated at runtime.
@@ -35,6 +49,26 @@ MAX_PAGE_APPEARANCES: int = int(os.getenv("MAX_PAGE_APPEARANCES", "0"))
 HEADING_FONT_SIZE: float = float(os.getenv("HEADING_FONT_SIZE", "18"))
 MAJOR_SECTION_FONT_SIZE: float = float(os.getenv("MAJOR_SECTION_FONT_SIZE", "26"))
 MIN_HEADING_CHARS: int = int(os.getenv("MIN_HEADING_CHARS", "3"))
+# Page-text engine: "pdfplumber" (accurate layout), "fitz" (fast, no second
+# file handle) or "auto" (fitz, falling back to pdfplumber per page when the
+# fitz text fails a quality check).
+TEXT_ENGINE: str = os.getenv("TEXT_ENGINE", "pdfplumber")
+# Worker processes for pdfplumber page-text extraction.  0 or 1 keeps the
+# serial loop; N > 1 splits the page range across N processes.
+EXTRACTION_WORKERS: int = int(os.getenv("EXTRACTION_WORKERS", "0"))
+# Low-memory extraction: when > 0, pdfplumber is reopened between page chunks
+# whenever resident memory exceeds this many MB, and fitz layout caching is
+# bounded.  0 keeps everything open for the whole run.
+EXTRACTION_MEMORY_TARGET_MB: int = int(os.getenv("EXTRACTION_MEMORY_TARGET_MB", "0"))
+# Sections-only extraction: a Contents page is only looked for among this many
+# leading pages.
+CONTENTS_SCAN_PAGES: int = int(os.getenv("CONTENTS_SCAN_PAGES", "20"))
+# Content-addressed cache of extraction results, LRU-evicted past the budget.
+EXTRACTION_CACHE_DIR: Path = Path(os.getenv("EXTRACTION_CACHE_DIR", str(OUTPUT_DIR / "cache")))
+EXTRACTION_CACHE_MAX_BYTES: int = int(os.getenv("EXTRACTION_CACHE_MAX_BYTES", str(500 * 1024 * 1024)))
+# Compression for packed (.bin) extraction files and cache entries:
+# "zlib", "zstd" (needs the optional ``zstandard`` package) or "none".
+EXTRACTION_CODEC: str = os.getenv("EXTRACTION_CODEC", "zlib")
 
 # ── Logging ────────────────────────────────────────────────────────────────
 LOG_FILE: Path = LOGS_DIR / "app.log"
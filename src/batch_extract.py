@@ -0,0 +1,139 @@
+"""Batch extraction — run ``run_extraction`` over many PDFs in a process pool.
+
+Each PDF is extracted in its own worker process and written to its own
+output file; a failure is recorded in that document's ``BatchResult`` and
+never aborts the rest of the batch.
+"""
+
+import glob
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.app_config import OUTPUT_DIR
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    pdf: str
+    output: str
+    pages: int = 0
+    sections: int = 0
+    strategy: str = ""
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def collect_pdfs(spec: str, recursive: bool = False) -> list[Path]:
+    """Resolve a directory, glob pattern or single file to a sorted PDF list."""
+    path = Path(spec)
+    if path.is_dir():
+        pattern = "**/*.pdf" if recursive else "*.pdf"
+        return sorted(p for p in path.glob(pattern) if p.is_file())
+    if glob.has_magic(spec):
+        return sorted(Path(p) for p in glob.glob(spec, recursive=recursive) if Path(p).is_file())
+    return [path] if path.is_file() else []
+
+
+def _output_paths(pdfs: list[Path], output_dir: Path, suffix: str) -> list[Path]:
+    """``<output_dir>/<stem><suffix>`` per PDF; repeated stems get ``-2``, ``-3`` …"""
+    seen: dict[str, int] = {}
+    paths = []
+    for pdf in pdfs:
+        seen[pdf.stem] = seen.get(pdf.stem, 0) + 1
+        name = pdf.stem if seen[pdf.stem] == 1 else f"{pdf.stem}-{seen[pdf.stem]}"
+        paths.append(output_dir / f"{name}{suffix}")
+    return paths
+
+
+def _extract_one(pdf: str, output: str, use_cache: bool) -> BatchResult:
+    """Worker entry-point.  Never raises — errors are returned in the result."""
+    from src.bootstrapper import register_extractors  # worker processes start with an empty Registry
+    from src.extract import run_extraction
+
+    start = time.perf_counter()
+    try:
+        register_extractors()
+        result = run_extraction(pdf, output_path=output, use_cache=use_cache)
+    except Exception as exc:
+        seconds = round(time.perf_counter() - start, 3)
+        return BatchResult(pdf, output, seconds=seconds, error=f"{type(exc).__name__}: {exc}")
+
+    metadata = result["metadata"]
+    return BatchResult(
+        pdf,
+        output,
+        pages=metadata["total_pages"],
+        sections=len(result["sections"]),
+        strategy=metadata["extraction_strategy"],
+        seconds=round(time.perf_counter() - start, 3),
+    )
+
+
+def run_batch_extraction(
+    pdfs: list[Path],
+    output_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    suffix: str = ".json",
+) -> list[BatchResult]:
+    """Extract every PDF in *pdfs*, each to ``<output_dir>/<stem><suffix>``.
+
+    Args:
+        pdfs:       PDFs to extract (see ``collect_pdfs``).
+        output_dir: Where the per-document files go (default
+                    ``output/batch``).
+        workers:    Process-pool size (default: CPU count).  ``0`` or ``1``
+                    extracts in this process, one PDF after another.
+        use_cache:  Passed through to ``run_extraction``.
+        suffix:     Output format, as for ``run_extraction`` (``.json``,
+                    ``.pages``, ``.bin``).
+
+    Returns:
+        One ``BatchResult`` per PDF, in input order.
+    """
+    output_dir = Path(output_dir) if output_dir else OUTPUT_DIR / "batch"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = _output_paths(pdfs, output_dir, suffix)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(pdfs))
+    logger.info("Batch extraction — %d PDFs, %d workers → %s", len(pdfs), max(workers, 1), output_dir)
+
+    if workers <= 1:
+        results = [_extract_one(str(pdf), str(out), use_cache) for pdf, out in zip(pdfs, outputs)]
+    else:
+        results_by_index: dict[int, BatchResult] = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_extract_one, str(pdf), str(out), use_cache): i
+                for i, (pdf, out) in enumerate(zip(pdfs, outputs))
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results_by_index[i] = future.result()
+                except Exception as exc:  # worker died (e.g. BrokenProcessPool)
+                    error = f"{type(exc).__name__}: {exc}"
+                    results_by_index[i] = BatchResult(str(pdfs[i]), str(outputs[i]), error=error)
+        results = [results_by_index[i] for i in range(len(pdfs))]
+
+    for r in results:
+        if r.ok:
+            logger.info("Batch: %s → %s (%d pages, %.1fs)", r.pdf, r.output, r.pages, r.seconds)
+        else:
+            logger.error("Batch: %s failed — %s", r.pdf, r.error)
+    return results
@@ -1,15 +1,18 @@
-"""CLI entry-point — two sub-commands that delegate to the same functions
+"""CLI entry-point — sub-commands that delegate to the same functions
 the Streamlit UI uses.
 
 Usage
 -----
-    python -m src.cli extract  --input <pdf>  [--output <json>]
-    python -m src.cli generate [--config <config.json>] [--extracted <json>]
+    python -m src.cli extract  --input <pdf>  [--output <json|pages|bin>] [--no-cache] [--stream | --sections-only] [--timings]
+    python -m src.cli extract-batch --input <dir|glob> [--output-dir <dir>] [--workers N] [--format json|pages|bin]
+    python -m src.cli generate [--config <config.json>] [--extracted <json|ndjson|pages|bin> | --pdf <pdf>]
 """
 
 import argparse
 import json
 import sys
+from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -18,7 +21,15 @@ load_dotenv()
 
 from src.bootstrapper import bootstrap  # noqa: E402
 from src.app_config import CONFIG_PATH, OUTPUT_DIR  # noqa: E402
-from src.extract import run_extraction  # noqa: E402
+from src.extract import (  # noqa: E402
+    run_extraction,
+    run_lazy_extraction,
+    run_sections_extraction,
+    run_streaming_extraction,
+)
+from src.batch_extract import collect_pdfs, run_batch_extraction  # noqa: E402
+from src.extraction_io import load_extraction  # noqa: E402
+from src.page_store import PageStore  # noqa: E402
 from src.pipeline import run_pipeline  # noqa: E402
 
 bootstrap()
@@ -26,25 +37,82 @@ bootstrap()
 
 def cmd_extract(args: argparse.Namespace) -> None:
     """Handle the ``extract`` sub-command."""
-    output_path = args.output or str(OUTPUT_DIR / "extracted_text.json")
-    run_extraction(file_path=args.input, output_path=output_path)
+    if args.sections_only:
+        output_path = args.output or str(OUTPUT_DIR / "sections.json")
+        result = run_sections_extraction(file_path=args.input, output_path=output_path)
+        for sec in result["sections"]:
+            print(f"{'  ' * sec['depth']}{sec['title']}  (pp {sec['start_page']}–{sec['end_page']})")
+    elif args.stream:
+        output_path = args.output or str(OUTPUT_DIR / "extracted_text.ndjson")
+        result = run_streaming_extraction(file_path=args.input, output_path=output_path)
+    else:
+        output_path = args.output or str(OUTPUT_DIR / "extracted_text.json")
+        result = run_extraction(file_path=args.input, output_path=output_path, use_cache=not args.no_cache)
     print(f"Extraction complete → {output_path}")
+    if args.timings:
+        _print_stats(result["metadata"].get("stats"))
+
+
+def _print_stats(stats: Optional[dict]) -> None:
+    """Print ``metadata.stats`` as two tables: stage timings, then counters."""
+    if not stats:
+        print("No extraction stats recorded (result predates them)")
+        return
+    print(f"\n{'stage':28} {'ms':>10}")
+    for stage, ms in stats["timings_ms"].items():
+        print(f"{stage:28} {ms:>10.2f}")
+    print(f"\n{'counter':28} {'value':>10}")
+    for name, value in stats["counters"].items():
+        print(f"{name:28} {value:>10}")
+
+
+def cmd_extract_batch(args: argparse.Namespace) -> None:
+    """Handle the ``extract-batch`` sub-command."""
+    pdfs = collect_pdfs(args.input, recursive=args.recursive)
+    if not pdfs:
+        sys.exit(f"No PDFs found for {args.input!r}")
+
+    output_dir = Path(args.output_dir) if args.output_dir else OUTPUT_DIR / "batch"
+    results = run_batch_extraction(
+        pdfs, output_dir=output_dir, workers=args.workers, use_cache=not args.no_cache, suffix=f".{args.format}"
+    )
+
+    summary_path = output_dir / "batch_summary.json"
+    summary_path.write_text(json.dumps([r.to_dict() for r in results], indent=2), encoding="utf-8")
+
+    print(f"{'PDF':40} {'pages':>6} {'sections':>8} {'strategy':15} {'seconds':>8}  status")
+    for r in results:
+        status = "ok" if r.ok else f"FAILED: {r.error}"
+        print(f"{Path(r.pdf).name[:40]:40} {r.pages:>6} {r.sections:>8} {r.strategy:15} {r.seconds:>8.2f}  {status}")
+    failures = sum(not r.ok for r in results)
+    print(f"{len(results) - failures}/{len(results)} extracted → {output_dir}  (summary: {summary_path})")
+    if failures:
+        sys.exit(1)
 
 
 def cmd_generate(args: argparse.Namespace) -> None:
     """Handle the ``generate`` sub-command."""
-    with open(args.extracted, encoding="utf-8") as fh:
-        extracted_data = json.load(fh)
     with open(args.config, encoding="utf-8") as fh:
         config = json.load(fh)
+    if args.pdf:
+        extracted_data = run_lazy_extraction(args.pdf, use_cache=not args.no_cache)
+    else:
+        extracted_data = load_extraction(args.extracted, lazy=True)
 
     def progress(msg: str, frac: float) -> None:
         print(f"  [{frac * 100:5.1f}%] {msg}")
 
-    result = run_pipeline(extracted_data, config["sections"], progress_callback=progress)
+    try:
+        result = run_pipeline(extracted_data, config["sections"], progress_callback=progress)
+    finally:
+        if isinstance(extracted_data["pages"], PageStore):
+            extracted_data["pages"].close()
     print(f"Script written  → {OUTPUT_DIR / 'podcast_script.txt'}")
     print(f"Report written  → {OUTPUT_DIR / 'verification_report.json'}")
     print(f"Word count: {result.word_count}")
+    if args.pdf:
+        pages = extracted_data["pages"]
+        print(f"Pages extracted: {pages.pages_extracted} this run, {len(pages.extracted)}/{len(pages)} cached")
 
 
 def main() -> None:
@@ -54,20 +122,72 @@ def main() -> None:
     # extract ────────────────────────────────────────────────────────────
     ext = sub.add_parser("extract", help="Extract text and sections from a PDF")
     ext.add_argument("--input", required=True, help="Path to the PDF file")
-    ext.add_argument("--output", default=None, help="Output JSON path (optional)")
+    ext.add_argument(
+        "--output",
+        default=None,
+        help="Output path (optional); a .pages suffix writes an indexed page store, .bin a packed file",
+    )
+    ext.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract even if this PDF + settings is already in the extraction cache",
+    )
+    mode = ext.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="Clean pages one at a time and append them to an NDJSON file (bounded memory); "
+        "always re-extracts and never reads or writes the extraction cache",
+    )
+    mode.add_argument(
+        "--sections-only",
+        action="store_true",
+        help="Detect and print the section list without extracting page text (writes sections.json)",
+    )
+    ext.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings and counters (a cache hit shows those of the original run)",
+    )
+
+    # extract-batch ──────────────────────────────────────────────────────
+    batch = sub.add_parser("extract-batch", help="Extract every PDF in a directory or glob")
+    batch.add_argument("--input", required=True, help="Directory of PDFs or a glob pattern (quote it)")
+    batch.add_argument("--output-dir", default=None, help="Directory for per-PDF outputs (default output/batch)")
+    batch.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    batch.add_argument("--format", choices=["json", "pages", "bin"], default="json", help="Per-PDF output format")
+    batch.add_argument("--recursive", action="store_true", help="Include PDFs in subdirectories")
+    batch.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract even if a PDF + settings is already in the extraction cache",
+    )
 
     # generate ───────────────────────────────────────────────────────────
     gen = sub.add_parser("generate", help="Run the podcast generation pipeline")
     gen.add_argument("--config", default=str(CONFIG_PATH), help="Path to config.json")
-    gen.add_argument(
+    source = gen.add_mutually_exclusive_group()
+    source.add_argument(
         "--extracted",
         default=str(OUTPUT_DIR / "extracted_text.json"),
-        help="Path to the cached extraction JSON",
+        help="Path to the cached extraction (JSON, NDJSON, .pages store or packed .bin)",
+    )
+    source.add_argument(
+        "--pdf",
+        default=None,
+        help="Generate straight from a PDF, extracting only the pages of the selected sections",
+    )
+    gen.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="With --pdf: do not reuse or store lazily extracted pages",
     )
 
     args = parser.parse_args()
     if args.command == "extract":
         cmd_extract(args)
+    elif args.command == "extract-batch":
+        cmd_extract_batch(args)
     elif args.command == "generate":
         cmd_generate(args)
 
@@ -2,37 +2,66 @@
 
 Combines pdfplumber (accurate page text) and fitz/PyMuPDF (TOC, font details,
 hyperlinks) to produce the canonical ``extracted_text.json`` cache that every
-downstream step reads from.
+downstream step reads from.  The page-text engine is pluggable: ``fitz`` skips
+pdfplumber entirely, and ``auto`` uses fitz with a per-page pdfplumber
+fallback.
 
-Public entry-point
-------------------
-    run_extraction(file_path, output_path=None) → dict
+Public entry-points
+-------------------
+    run_extraction(file_path, output_path=None, use_cache=True) → dict
+    run_streaming_extraction(file_path, output_path=None) → dict
+    run_lazy_extraction(file_path, use_cache=True) → dict   (pages on demand)
+    run_sections_extraction(file_path, output_path=None) → dict   (no page text)
 
 The module also registers ``PDFExtractor`` in the IoC ``Registry`` at load time
 so that callers can resolve it generically via ``Registry.get_extractor("pdf")``.
 """
 
+import io
 import json
 import logging
 import os
 import re
+import tempfile
+import threading
+import time
 from collections import Counter
+from collections.abc import Mapping
+from contextlib import closing, contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain, groupby
 from math import floor
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple, Optional, Union
 
 import fitz  # PyMuPDF
+import numpy as np
 import pdfplumber
 
 from src.app_config import (
+    CONTENTS_SCAN_PAGES,
+    EXTRACTION_MEMORY_TARGET_MB,
+    EXTRACTION_WORKERS,
     HEADING_FONT_SIZE,
     MAJOR_SECTION_FONT_SIZE,
     MAX_PAGE_APPEARANCES,
     MIN_HEADING_CHARS,
     OUTPUT_DIR,
+    TEXT_ENGINE,
+)
+from src.extraction_cache import ExtractionCache
+from src.extraction_io import (
+    FORMAT_VERSION,
+    ExtractionFormatError,
+    decode_packed,
+    encode_packed,
+    save_extraction,
+    write_ndjson,
 )
 from src.register import BaseExtractor, Registry
+from src.utility.memory_helper import current_rss_mb, peak_rss_mb
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +78,19 @@ _NUMBER_ONLY_RE = re.compile(r"^\s*(\d+)\s*$")
 # the leading lines of every page).
 _CONTENTS_KEYWORDS = ("table of contents", "contents", "table des matières")
 
+# Lone surrogates — the only code points a Python ``str`` can hold that fail
+# ``encode("utf-8")``; pdfplumber emits them for some broken font maps.
+_UNENCODABLE_RE = re.compile("[\ud800-\udfff]")
+
+# Low-memory mode: pages read between resident-memory checks, and the number
+# of page layouts the layout cache keeps.
+LOW_MEMORY_CHUNK_PAGES = 50
+LOW_MEMORY_LAYOUT_PAGES = 32
+
+# Parallel text extraction: pages per worker task.  Small tasks keep progress
+# flowing page by page and let a cancel drop the queued work promptly.
+PARALLEL_CHUNK_PAGES = 8
+
 # Characters whose presence at the start of a line marks it as a nav arrow.
 _ARROW_CHARS = {"→", "▶", "▸", "►"}
 
@@ -56,6 +98,16 @@ _ARROW_CHARS = {"→", "▶", "▸", "►"}
 # Contents page.
 _INDENT_THRESHOLD_PT = 10
 
+# Supported page-text engines (see ``PDFExtractor``).
+TEXT_ENGINES = ("pdfplumber", "fitz", "auto")
+
+# ``auto`` engine quality check: fitz text is rejected when more than this
+# share of its characters are replacement / private-use / control glyphs, or
+# when a long page has almost no whitespace (glyphs run together).
+_MAX_BAD_CHAR_RATIO = 0.01
+_MIN_SPACE_RATIO = 0.05
+_SPACE_CHECK_MIN_CHARS = 200
+
 # Translation table that drops all C0 control characters (U+0000–U+001F).
 # PDF text extraction frequently leaves \x08 (backspace) in heading titles.
 _STRIP_CONTROL = str.maketrans({i: None for i in range(0x20)})
@@ -65,6 +117,248 @@ class ExtractionError(Exception):
     """User-facing extraction failure."""
 
 
+class ExtractionCancelled(ExtractionError):
+    """Raised when a ``CancelToken`` passed to the extractor is cancelled."""
+
+
+# ── Progress and cancellation ──────────────────────────────────────────────
+
+# Share of the overall progress bar covered by each stage: ``(start, end)``.
+_STAGE_SPANS = {
+    "text": (0.0, 0.6),
+    "sections": (0.6, 0.7),
+    "cleaning": (0.7, 1.0),
+    "done": (1.0, 1.0),
+}
+
+_STAGE_LABELS = {
+    "text": "Reading page text",
+    "sections": "Sections detected",
+    "cleaning": "Cleaning pages",
+    "done": "Extraction complete",
+}
+
+
+@dataclass(frozen=True)
+class ExtractionProgress:
+    """One progress event.  ``sections`` is only set on the ``"sections"``
+    event, which fires once detection is done and before cleaning starts."""
+
+    stage: str  # "text" | "sections" | "cleaning" | "done"
+    done: int
+    total: int
+    sections: Optional[list[dict]] = None
+
+    @property
+    def fraction(self) -> float:
+        start, end = _STAGE_SPANS[self.stage]
+        return start + (end - start) * (self.done / self.total if self.total else 1.0)
+
+    @property
+    def message(self) -> str:
+        return f"{_STAGE_LABELS[self.stage]} — {self.done}/{self.total}"
+
+
+class CancelToken:
+    """Thread-safe flag the extractor checks between pages."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise ExtractionCancelled("Extraction cancelled.")
+
+
+ProgressCallback = Callable[[ExtractionProgress], None]
+
+
+# ── PDF sources ────────────────────────────────────────────────────────────
+
+# What the extractor accepts: a path, the PDF bytes, or a binary buffer such
+# as ``io.BytesIO`` or a Streamlit ``UploadedFile``.
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+class PdfInput(NamedTuple):
+    """A resolved ``PdfSource``: exactly one of ``path`` / ``data`` is set."""
+
+    name: str  # file name reported in the metadata
+    path: Optional[str] = None
+    data: Optional[bytes] = None
+
+
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def resolve_pdf_source(source: PdfSource) -> PdfInput:
+    """Normalise *source* so fitz and pdfplumber can share it.
+
+    In-memory sources become one ``bytes`` object that both libraries read
+    without copying it again: fitz opens it as a stream, and pdfplumber
+    reads it through an ``io.BytesIO``, which shares a ``bytes`` buffer
+    until written to.  ``bytes`` and ``BytesIO``-like buffers are not
+    copied here either; ``bytearray`` and ``memoryview`` are copied once.
+
+    Raises:
+        TypeError: for anything that is not a path, bytes-like or readable.
+    """
+    if isinstance(source, PdfInput):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        return PdfInput(name=os.path.basename(path), path=path)
+
+    name = os.path.basename(getattr(source, "name", "") or "") or "in-memory.pdf"
+    if isinstance(source, bytes):
+        data = source
+    elif isinstance(source, (bytearray, memoryview)):
+        data = bytes(source)
+    elif hasattr(source, "getvalue"):
+        data = source.getvalue()  # BytesIO hands back its buffer without a copy
+    elif hasattr(source, "read"):
+        data = source.read()
+    else:
+        raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+    return PdfInput(name=name, data=data)
+
+
+def _open_fitz(pdf: PdfInput):
+    if pdf.data is not None:
+        return fitz.open(stream=pdf.data, filetype="pdf")
+    return fitz.open(pdf.path)
+
+
+def _open_plumber(pdf: PdfInput):
+    return pdfplumber.open(io.BytesIO(pdf.data) if pdf.data is not None else pdf.path)
+
+
+# ── Extraction stats ───────────────────────────────────────────────────────
+
+
+class ExtractionStats:
+    """Per-stage wall times and counters for one extraction run.
+
+    Recorded into ``metadata["stats"]`` as ``{"timings_ms": {stage: ms},
+    "counters": {name: n}}``; stages run more than once accumulate.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> dict:
+        return {
+            "timings_ms": {name: round(seconds * 1000, 2) for name, seconds in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+
+# ── Layout cache ───────────────────────────────────────────────────────────
+
+
+class LayoutSpan(NamedTuple):
+    """One text span from fitz ``get_text("dict")``, flattened."""
+
+    text: str
+    bbox: tuple
+    font: str
+    size: float
+    block: int  # index into ``PageLayout.block_bboxes``
+    line: int  # line index within the owning block
+
+
+class PageLayout(NamedTuple):
+    """Compact span table for one page.
+
+    ``spans`` keeps fitz reading order (block → line → span), so iterating it
+    is equivalent to the nested block/line/span walk over the raw dict.
+    """
+
+    spans: list[LayoutSpan]
+    block_bboxes: list[tuple]  # one per text block, including span-less ones
+
+
+def _build_page_layout(text_dict: dict) -> PageLayout:
+    """Flatten a fitz ``get_text("dict")`` result into a ``PageLayout``."""
+    spans: list[LayoutSpan] = []
+    block_bboxes: list[tuple] = []
+    for block in text_dict.get("blocks", []):
+        if block.get("type") != 0:
+            continue
+        block_idx = len(block_bboxes)
+        block_bboxes.append(tuple(block.get("bbox", (0, 0, 0, 0))))
+        for line_idx, line in enumerate(block.get("lines", [])):
+            for span in line.get("spans", []):
+                spans.append(
+                    LayoutSpan(
+                        text=span["text"],
+                        bbox=tuple(span["bbox"]),
+                        font=span.get("font", ""),
+                        size=span.get("size", 0),
+                        block=block_idx,
+                        line=line_idx,
+                    )
+                )
+    return PageLayout(spans=spans, block_bboxes=block_bboxes)
+
+
+class LayoutCache:
+    """Per-extraction cache so ``page.get_text("dict")`` runs at most once per
+    page, however many detection / cleaning steps need the layout.
+
+    Pages are parsed lazily on first access.  ``parses`` counts real fitz
+    layout parses; ``hits`` counts the parses the cache saved; ``spans``
+    counts text spans in the parsed pages.  With *max_pages* set, only the
+    most recently parsed pages are kept (low-memory mode), so a page read
+    again after eviction is parsed again.
+    """
+
+    def __init__(self, fitz_doc, max_pages: Optional[int] = None) -> None:
+        self._doc = fitz_doc
+        self._max_pages = max_pages
+        self._pages: dict[int, PageLayout] = {}
+        self.parses = 0
+        self.hits = 0
+        self.spans = 0
+
+    def page(self, page_idx: int) -> PageLayout:
+        """Return the span table for the 0-based *page_idx*."""
+        layout = self._pages.get(page_idx)
+        if layout is not None:
+            self.hits += 1
+            return layout
+        layout = _build_page_layout(self._doc[page_idx].get_text("dict"))
+        if self._max_pages is not None and len(self._pages) >= self._max_pages:
+            del self._pages[next(iter(self._pages))]  # oldest first
+        self._pages[page_idx] = layout
+        self.parses += 1
+        self.spans += len(layout.spans)
+        return layout
+
+
 # ── Tier helpers (module-level pure functions for testability) ─────────────
 
 
@@ -92,7 +386,7 @@ def _find_contents_page_index(raw_pages: list[dict]) -> Optional[int]:
     return None
 
 
-def _parse_contents_page(fitz_page) -> list[dict]:
+def _parse_contents_page(fitz_page, layout: Optional[PageLayout] = None) -> list[dict]:
     """Parse a single fitz page identified as a Contents page.
 
     Supports three TOC-line formats:
@@ -105,18 +399,27 @@ def _parse_contents_page(fitz_page) -> list[dict]:
     Levels are assigned in a second pass using x-indentation relative to the
     leftmost *matched* entry in each column, so sidebar / nav blocks that
     contain no valid TOC entries cannot skew the baseline.
+
+    *layout* is the page's cached span table; when omitted it is built from
+    ``fitz_page.get_text("dict")``.
     """
-    text_dict = fitz_page.get_text("dict")
-    blocks = [b for b in text_dict.get("blocks", []) if b.get("type") == 0]
+    if layout is None:
+        layout = _build_page_layout(fitz_page.get_text("dict"))
+    blocks = layout.block_bboxes
     if not blocks:
         return []
 
+    # Group the flat span table back into lines per block.
+    block_lines: dict[int, list[list[LayoutSpan]]] = {}
+    for (block_idx, _), line_spans in groupby(layout.spans, key=lambda sp: (sp.block, sp.line)):
+        block_lines.setdefault(block_idx, []).append(list(line_spans))
+
     # ── column detection ───────────────────────────────────────────────
-    widths = [b["bbox"][2] - b["bbox"][0] for b in blocks]
+    widths = [b[2] - b[0] for b in blocks]
     avg_width = sum(widths) / len(widths) if widths else 1.0
 
     # Collect unique left-edge positions, sorted.
-    x_lefts = sorted({round(b["bbox"][0], 1) for b in blocks})
+    x_lefts = sorted({round(b[0], 1) for b in blocks})
 
     # Cluster x-positions: a gap > avg_width starts a new column.
     columns_ranges: list[tuple[float, float]] = []
@@ -129,18 +432,18 @@ def _parse_contents_page(fitz_page) -> list[dict]:
             end = x
         columns_ranges.append((start, end))
 
-    # Assign blocks to columns.
-    columns: list[list] = [[] for _ in columns_ranges]
-    for block in blocks:
-        bx = round(block["bbox"][0], 1)
+    # Assign blocks (by index) to columns.
+    columns: list[list[int]] = [[] for _ in columns_ranges]
+    for block_idx, bbox in enumerate(blocks):
+        bx = round(bbox[0], 1)
         for i, (cs, ce) in enumerate(columns_ranges):
             if cs - avg_width / 4 <= bx <= ce + avg_width / 4:
-                columns[i].append(block)
+                columns[i].append(block_idx)
                 break
 
     # Sort each column top-to-bottom by y0.
     for col in columns:
-        col.sort(key=lambda b: b["bbox"][1])
+        col.sort(key=lambda bi: blocks[bi][1])
 
     # Titles that are just a contents-page keyword are noise.
     skip_titles = {kw.lower() for kw in _CONTENTS_KEYWORDS}
@@ -153,15 +456,12 @@ def _parse_contents_page(fitz_page) -> list[dict]:
         if not col:
             continue
 
-        for block in col:
+        for block_idx in col:
             # Collect (text, x) for every non-empty line in this block.
             lines_data: list[tuple[str, float]] = []
-            for line in block.get("lines", []):
-                spans = line.get("spans", [])
-                if not spans:
-                    continue
-                line_text = "".join(sp["text"] for sp in spans).strip()
-                line_x = min(sp["bbox"][0] for sp in spans)
+            for spans in block_lines.get(block_idx, []):
+                line_text = "".join(sp.text for sp in spans).strip()
+                line_x = min(sp.bbox[0] for sp in spans)
                 if line_text:
                     lines_data.append((line_text, line_x))
 
@@ -261,104 +561,218 @@ def _parse_contents_page(fitz_page) -> list[dict]:
     return sections
 
 
-def _font_heuristic_sections(fitz_doc, total_pages: int) -> list[dict]:
-    """Tier 3 — scan every page for large / bold text and classify headings.
+class SpanTable(NamedTuple):
+    """Columnar view of every text span in a document, for Tier 3.
 
-    Applies the candidate-filtering rules specified in §7.2 Tier 3.
+    ``texts`` holds the stripped span text; the arrays are aligned with it.
     """
-    # Effective nav-bar threshold.
-    max_appearances = MAX_PAGE_APPEARANCES if MAX_PAGE_APPEARANCES > 0 else floor(total_pages / 2)
-
-    candidates: list[dict] = []  # {title, start_page, level}
-
-    for page_idx in range(len(fitz_doc)):
-        page = fitz_doc[page_idx]
-        page_number = page_idx + 1
-        text_dict = page.get_text("dict")
 
-        prev_level: Optional[int] = None
-        prev_title: Optional[str] = None
-
-        for block in text_dict.get("blocks", []):
-            if block.get("type") != 0:
-                continue
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    text = span["text"].strip()
-                    if not text:
-                        continue
+    texts: list[str]
+    size: np.ndarray  # float64 font size
+    bold: np.ndarray  # bool — "bold" in the font name
+    page: np.ndarray  # int64, 1-based page number
+    alpha: np.ndarray  # int64, alphabetic characters in the stripped text
+
+
+def _build_span_table(layouts: Iterable[PageLayout]) -> SpanTable:
+    """Flatten page layouts (in page order) into a ``SpanTable``."""
+    texts: list[str] = []
+    sizes: list[float] = []
+    bold: list[bool] = []
+    pages: list[int] = []
+    for page_number, layout in enumerate(layouts, start=1):
+        spans = layout.spans
+        texts.extend(sp.text.strip() for sp in spans)
+        sizes.extend(sp.size for sp in spans)
+        bold.extend("bold" in sp.font.lower() for sp in spans)
+        pages.extend([page_number] * len(spans))
+    return SpanTable(
+        texts=texts,
+        size=np.asarray(sizes, dtype=np.float64),
+        bold=np.asarray(bold, dtype=bool),
+        page=np.asarray(pages, dtype=np.int64),
+        alpha=_alpha_counts(texts),
+    )
+
+
+# ``str.isalpha`` for every BMP code point, built on first use.
+_BMP_ALPHA: Optional[np.ndarray] = None
+
+
+def _alpha_counts(texts: list[str]) -> np.ndarray:
+    """``sum(ch.isalpha() for ch in t)`` for every *t*, without a Python
+    loop over characters: the texts are decoded into one code-point array
+    and looked up in an ``isalpha`` table."""
+    global _BMP_ALPHA
+    if _BMP_ALPHA is None:
+        _BMP_ALPHA = np.array([chr(cp).isalpha() for cp in range(0x10000)], dtype=bool)
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    is_alpha = _BMP_ALPHA[np.minimum(codes, 0xFFFF)]
+    astral = codes > 0xFFFF
+    if astral.any():
+        unique, inverse = np.unique(codes[astral], return_inverse=True)
+        is_alpha[astral] = np.array([chr(cp).isalpha() for cp in unique], dtype=bool)[inverse]
+
+    running = np.concatenate(([0], np.cumsum(is_alpha, dtype=np.int64)))
+    ends = np.cumsum(lengths)
+    return running[ends] - running[ends - lengths]
+
+
+def _font_heuristic_sections(
+    fitz_doc, total_pages: int, layout_cache: Optional[LayoutCache] = None
+) -> list[dict]:
+    """Tier 3 — scan every page for large / bold text and classify headings.
 
-                    # Must contain at least MIN_HEADING_CHARS alphabetic chars.
-                    alpha_count = sum(1 for ch in text if ch.isalpha())
-                    if alpha_count < MIN_HEADING_CHARS:
-                        continue
+    Applies the candidate-filtering rules specified in §7.2 Tier 3, as
+    array operations over a ``SpanTable``.
+    """
+    if layout_cache is None:
+        layout_cache = LayoutCache(fitz_doc)
 
-                    size = span.get("size", 0)
-                    is_bold = "bold" in span.get("font", "").lower()
-
-                    level: Optional[int] = None
-                    if size >= MAJOR_SECTION_FONT_SIZE:
-                        level = 1
-                    elif size >= HEADING_FONT_SIZE:
-                        level = 2
-                    elif is_bold and size >= 14:
-                        level = 2
-
-                    if level is None:
-                        # Not a heading candidate; reset merge state.
-                        prev_level = None
-                        prev_title = None
-                        continue
+    # Effective nav-bar threshold.
+    max_appearances = MAX_PAGE_APPEARANCES if MAX_PAGE_APPEARANCES > 0 else floor(total_pages / 2)
 
-                    # Merge consecutive candidates on the same page.
-                    if prev_level == level and prev_title is not None:
-                        # Update the last candidate's title.
-                        candidates[-1]["title"] += " " + text
-                        prev_title = candidates[-1]["title"]
-                    else:
-                        candidates.append({"title": text, "start_page": page_number, "level": level})
-                        prev_level = level
-                        prev_title = text
-
-    # Drop titles that appear on too many pages (nav-bar fragments).
-    title_page_counts: Counter = Counter()
-    for c in candidates:
-        title_page_counts[c["title"]] += 1
-
-    # Deduplicate: keep only the first occurrence of each title.
-    seen: set[str] = set()
-    filtered: list[dict] = []
-    for c in candidates:
-        if title_page_counts[c["title"]] > max_appearances:
-            continue
-        if c["title"] in seen:
-            continue
-        seen.add(c["title"])
-        filtered.append(c)
+    table = _build_span_table(layout_cache.page(i) for i in range(len(fitz_doc)))
+
+    # Spans that are empty or have fewer than MIN_HEADING_CHARS alphabetic
+    # chars are skipped outright — they neither qualify nor break a merge.
+    non_empty = np.fromiter(map(bool, table.texts), dtype=bool, count=len(table.texts))
+    keep = np.flatnonzero(non_empty & (table.alpha >= MIN_HEADING_CHARS))
+    size, bold, page = table.size[keep], table.bold[keep], table.page[keep]
+
+    # 0 = not a heading, 1 = major section, 2 = heading.
+    level = np.where(
+        size >= MAJOR_SECTION_FONT_SIZE,
+        1,
+        np.where((size >= HEADING_FONT_SIZE) | (bold & (size >= 14)), 2, 0),
+    )
+
+    # A heading span continues the previous kept span's title when that span
+    # is on the same page at the same level; any other heading starts a title.
+    continues = np.zeros(len(keep), dtype=bool)
+    continues[1:] = (level[1:] > 0) & (level[1:] == level[:-1]) & (page[1:] == page[:-1])
+    starts = np.flatnonzero((level > 0) & ~continues)
+    tails = np.flatnonzero(continues)
+
+    parts = [[table.texts[i]] for i in keep[starts].tolist()]
+    for group, i in zip((np.searchsorted(starts, tails, side="right") - 1).tolist(), keep[tails].tolist()):
+        parts[group].append(table.texts[i])
+    candidates = [
+        {"title": " ".join(p), "start_page": pg, "level": lv}
+        for p, pg, lv in zip(parts, page[starts].tolist(), level[starts].tolist())
+    ]
+    if not candidates:
+        return []
 
-    return filtered
+    # Drop titles that appear on too many pages (nav-bar fragments), then
+    # keep only the first occurrence of each remaining title.
+    titles = np.array([c["title"] for c in candidates], dtype=object)
+    _, first, inverse, counts = np.unique(titles, return_index=True, return_inverse=True, return_counts=True)
+    is_first = np.zeros(len(candidates), dtype=bool)
+    is_first[first] = True
+    selected = is_first & (counts[inverse] <= max_appearances)
+    return [c for c, ok in zip(candidates, selected.tolist()) if ok]
 
 
 def compute_end_pages(sections: list[dict], total_pages: int) -> list[dict]:
-    """Derive ``end_page`` for every section in a single pass.
+    """Derive ``end_page`` and the section hierarchy in a single pass.
 
     For section *i*, ``end_page`` is ``start_page[j] − 1`` where *j* is the
     next section whose level ≤ level *i*.  If no such *j* exists,
     ``end_page`` equals ``total_pages``.
+
+    A stack holds the sections that are still open (strictly increasing
+    levels); each new section closes every open section at its level or
+    deeper, and its parent is whatever remains on top.  Every section also
+    gains ``id`` (its list index), ``parent_id`` (``None`` for top-level
+    sections), ``child_ids`` and ``depth`` (0 for top-level).
     """
     result = [dict(s) for s in sections]  # shallow copy each dict
+    open_ids: list[int] = []
 
     for i, sec in enumerate(result):
-        end = total_pages  # default: extends to end of document
-        for j in range(i + 1, len(result)):
-            if result[j]["level"] <= sec["level"]:
-                end = result[j]["start_page"] - 1
-                break
-        result[i]["end_page"] = end
+        while open_ids and result[open_ids[-1]]["level"] >= sec["level"]:
+            result[open_ids.pop()]["end_page"] = sec["start_page"] - 1
+
+        parent_id = open_ids[-1] if open_ids else None
+        sec["end_page"] = total_pages  # default: extends to end of document
+        sec["id"] = i
+        sec["parent_id"] = parent_id
+        sec["child_ids"] = []
+        sec["depth"] = len(open_ids)
+        if parent_id is not None:
+            result[parent_id]["child_ids"].append(i)
+        open_ids.append(i)
 
     return result
 
 
+# ── Parallel text extraction ───────────────────────────────────────────────
+
+
+def _split_page_range(total_pages: int, chunks: int) -> list[tuple[int, int]]:
+    """Split ``[0, total_pages)`` into at most *chunks* contiguous half-open
+    ranges whose sizes differ by at most one page."""
+    chunks = max(1, min(chunks, total_pages))
+    size, extra = divmod(total_pages, chunks)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> list[str]:
+    """Worker — open a private pdfplumber handle and return the text of the
+    0-based pages ``[start, end)``.
+
+    Runs in a child process, so it must stay a picklable module-level function.
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return [_plumber_page_text(pdf, i) for i in range(start, end)]
+
+
+def _plumber_page_text(plumber_pdf, page_idx: int) -> str:
+    """Text of one pdfplumber page, releasing the page's parsed layout
+    straight after; pdfplumber otherwise keeps it for the life of the
+    document, which grows memory with every page read."""
+    page = plumber_pdf.pages[page_idx]
+    try:
+        return page.extract_text() or ""
+    finally:
+        page.close()
+
+
+# ── Text-engine quality check ──────────────────────────────────────────────
+
+
+def _fitz_text_ok(text: str) -> bool:
+    """Return ``True`` when fitz page text is good enough to keep under the
+    ``auto`` engine; ``False`` sends the page to pdfplumber instead."""
+    stripped = text.strip()
+    if not stripped:
+        return False
+
+    bad = sum(
+        1
+        for ch in stripped
+        if ch == "\ufffd" or "\ue000" <= ch <= "\uf8ff" or (ch < " " and ch not in "\n\t")
+    )
+    if bad / len(stripped) > _MAX_BAD_CHAR_RATIO:
+        return False
+
+    if len(stripped) >= _SPACE_CHECK_MIN_CHARS:
+        spaces = sum(1 for ch in stripped if ch.isspace())
+        if spaces / len(stripped) < _MIN_SPACE_RATIO:
+            return False
+
+    return True
+
+
 # ── Cleaning helpers ───────────────────────────────────────────────────────
 
 
@@ -366,204 +780,841 @@ def _effective_max_appearances(total_pages: int) -> int:
     return MAX_PAGE_APPEARANCES if MAX_PAGE_APPEARANCES > 0 else floor(total_pages / 2)
 
 
+def _nav_bar_key(line: str) -> str:
+    """A line with its whitespace collapsed, so fitz's ``"Home  About"`` and
+    pdfplumber's ``"Home About"`` count as the same nav-bar line."""
+    return " ".join(line.split())
+
+
+def _add_nav_bar_counts(freq: Counter, text: str) -> None:
+    """Count one page's top 5 lines toward the nav-bar page frequency."""
+    top_lines = text.split("\n")[:5]
+    # Use a *set* per page so a line repeated within the same page
+    # only counts once toward the page-frequency.
+    for key in {_nav_bar_key(line) for line in top_lines}:
+        if key:
+            freq[key] += 1
+
+
+def _nav_bar_lines_from_counts(freq: Counter, total_pages: int) -> set[str]:
+    threshold = _effective_max_appearances(total_pages)
+    return {line for line, count in freq.items() if count > threshold}
+
+
 def _build_nav_bar_lines(raw_pages: list[dict], total_pages: int) -> set[str]:
     """Scan the top 5 lines of every page; return lines whose frequency
     exceeds the nav-bar threshold."""
-    threshold = _effective_max_appearances(total_pages)
     freq: Counter = Counter()
     for page in raw_pages:
-        top_lines = (page["text"] or "").split("\n")[:5]
-        # Use a *set* per page so a line repeated within the same page
-        # only counts once toward the page-frequency.
-        for line in set(top_lines):
-            stripped = line.strip()
-            if stripped:
-                freq[stripped] += 1
-    return {line for line, count in freq.items() if count > threshold}
+        _add_nav_bar_counts(freq, page["text"] or "")
+    return _nav_bar_lines_from_counts(freq, total_pages)
+
+
+def _top_hyperlink_snippets(
+    fitz_page, layout_cache: LayoutCache, page_idx: int, counters: Optional[Counter] = None
+) -> set[str]:
+    """Text snippets of one page that belong to hyperlinks in the top 15 %
+    of the page.  The span table is only fetched if the page has such a
+    link.  *counters* (if given) accumulates ``links_inspected`` and
+    ``top_links``."""
+    top_limit = 0.15 * fitz_page.rect.height
+    links = fitz_page.get_links()
+    link_rects = []
+    for link in links:
+        rect = fitz.Rect(link["from"])
+        if rect.y0 < top_limit:
+            link_rects.append(rect)
+    if counters is not None:
+        counters["links_inspected"] += len(links)
+        counters["top_links"] += len(link_rects)
+
+    if not link_rects:
+        return set()
+
+    # Find spans whose bounding boxes overlap with the link rects.
+    snippets: set[str] = set()
+    for span in layout_cache.page(page_idx).spans:
+        span_rect = fitz.Rect(span.bbox)
+        for lr in link_rects:
+            if span_rect.intersects(lr):
+                t = span.text.strip()
+                if t:
+                    snippets.add(t)
+                break
+    return snippets
 
 
-def _remove_nav_bars(pages_text: list[str], nav_lines: set[str]) -> list[str]:
-    """Strip nav-bar lines from every page."""
-    cleaned: list[str] = []
-    for text in pages_text:
-        lines = text.split("\n")
-        cleaned.append("\n".join(ln for ln in lines if ln.strip() not in nav_lines))
-    return cleaned
+def _get_top_hyperlink_texts(
+    fitz_doc, total_pages: int, layout_cache: Optional[LayoutCache] = None, counters: Optional[Counter] = None
+) -> dict[int, set[str]]:
+    """For each page, collect text snippets that belong to hyperlinks in the
+    top 15 % of the page.  Keyed by 1-based page number.
+
+    Only pages that carry a top link need their layout, so the span table is
+    fetched lazily from *layout_cache*."""
+    if layout_cache is None:
+        layout_cache = LayoutCache(fitz_doc)
+    top_texts: dict[int, set[str]] = {}
+    for page_idx in range(min(len(fitz_doc), total_pages)):
+        snippets = _top_hyperlink_snippets(fitz_doc[page_idx], layout_cache, page_idx, counters)
+        if snippets:
+            top_texts[page_idx + 1] = snippets  # 1-based key
+    return top_texts
 
 
-def _remove_arrow_links(pages_text: list[str]) -> list[str]:
-    """Remove lines whose first non-whitespace character is an arrow."""
-    cleaned: list[str] = []
-    for text in pages_text:
-        lines = text.split("\n")
-        filtered: list[str] = []
+# ── Cleaning pipeline ──────────────────────────────────────────────────────
+
+
+class LineRule:
+    """One step of the cleaning pipeline.
+
+    ``apply`` receives the surviving lines of a page and returns the lines to
+    keep, possibly rewritten.  ``begin_page`` runs before each page so rules
+    with per-page state can set it up.  Rules may record extra counters in
+    ``counters``; they are reported alongside the pipeline's own.
+    """
+
+    name = "rule"
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+
+    def begin_page(self, page_number: int) -> None:
+        pass
+
+    def apply(self, lines: list[str]) -> list[str]:
+        raise NotImplementedError
+
+
+class LinePredicateRule(LineRule):
+    """Drops every line for which *predicate* returns ``True``."""
+
+    def __init__(self, name: str, predicate: Callable[[str], bool]) -> None:
+        super().__init__()
+        self.name = name
+        self.predicate = predicate
+
+    def apply(self, lines: list[str]) -> list[str]:
+        predicate = self.predicate
+        return [ln for ln in lines if not predicate(ln)]
+
+
+class NavBarRule(LineRule):
+    """Strips lines that the nav-bar statistics flagged document-wide.
+
+    Lines are compared whitespace-collapsed (``_nav_bar_key``), so lines
+    counted on one engine's text still match another engine's spacing.
+    """
+
+    name = "nav_bars"
+
+    def __init__(self, nav_lines: set[str]) -> None:
+        super().__init__()
+        self.nav_lines = {_nav_bar_key(line) for line in nav_lines}
+
+    def apply(self, lines: list[str]) -> list[str]:
+        nav_lines = self.nav_lines
+        if not nav_lines:
+            return lines
+        return [ln for ln in lines if _nav_bar_key(ln) not in nav_lines]
+
+
+def _is_arrow_link(line: str) -> bool:
+    """True if the first non-whitespace character is a nav arrow."""
+    stripped = line.lstrip()
+    return bool(stripped) and stripped[0] in _ARROW_CHARS
+
+
+class SnippetIndex:
+    """Answers "is *token* a substring of any snippet?" for one page.
+
+    Snippets are joined with ``"\n"``; a whitespace-free token cannot span
+    the separator, so one substring search over the joined text is
+    equivalent to testing every snippet.  Answers are memoised, since
+    navigation lines repeat the same few tokens.
+    """
+
+    def __init__(self, snippets: Iterable[str]) -> None:
+        self._joined = "\n".join(snippets)
+        self._memo: dict[str, bool] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._joined)
+
+    def covers(self, token: str) -> bool:
+        hit = self._memo.get(token)
+        if hit is None:
+            hit = self._memo[token] = token in self._joined
+        return hit
+
+    def covers_line(self, line: str) -> bool:
+        """True if *line* has tokens and every one of them is covered."""
+        tokens = line.split()
+        return bool(tokens) and all(self.covers(tok) for tok in tokens)
+
+
+class TopHyperlinkRule(LineRule):
+    """Removes lines that consist entirely of top-hyperlink text snippets:
+    a line is a hyperlink line if *all* its non-whitespace tokens are
+    contained in the page's snippet set."""
+
+    name = "top_hyperlinks"
+
+    def __init__(self, top_hyperlink_map: dict[int, set[str]]) -> None:
+        super().__init__()
+        self.top_hyperlink_map = top_hyperlink_map
+        self._index: Optional[SnippetIndex] = None
+
+    def begin_page(self, page_number: int) -> None:
+        snippets = self.top_hyperlink_map.get(page_number)
+        self._index = SnippetIndex(snippets) if snippets else None
+
+    def apply(self, lines: list[str]) -> list[str]:
+        if self._index is None:
+            return lines
+        covers_line = self._index.covers_line
+        return [ln for ln in lines if not covers_line(ln)]
+
+
+def _drop_unencodable(text: str) -> tuple[str, int]:
+    """Remove characters that cannot be encoded as UTF-8.
+
+    Returns:
+        ``(clean_text, number_of_characters_dropped)``.
+    """
+    return _UNENCODABLE_RE.subn("", text)
+
+
+class EncodingRule(LineRule):
+    """Drops any character that cannot be encoded as UTF-8, then removes the
+    blank lines left behind, logging a warning per affected page.  Runs last,
+    so it also removes blank lines produced by earlier rules."""
+
+    name = "encoding"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counters = {"chars_dropped": 0, "pages_affected": 0}
+        self._page_number = 0
+
+    def begin_page(self, page_number: int) -> None:
+        self._page_number = page_number
+
+    def apply(self, lines: list[str]) -> list[str]:
+        kept: list[str] = []
+        dropped = 0
         for ln in lines:
-            stripped = ln.lstrip()
-            if stripped and stripped[0] in _ARROW_CHARS:
-                continue
-            filtered.append(ln)
-        cleaned.append("\n".join(filtered))
+            ln, n = _drop_unencodable(ln)
+            dropped += n
+            if ln.strip():
+                kept.append(ln)
+        if dropped:
+            logger.warning("Encoding cleanup: characters dropped on page %d", self._page_number)
+            self.counters["chars_dropped"] += dropped
+            self.counters["pages_affected"] += 1
+        return kept
+
+
+class CleaningPipeline:
+    """Runs an ordered chain of ``LineRule`` steps over each page.
+
+    Every page is split into lines once, each rule filters the surviving
+    lines in turn, and the result is joined once.  ``stats`` reports, per
+    rule, the lines it dropped, the time it took, and the rule's own
+    counters.
+    """
+
+    def __init__(self, rules: Iterable[LineRule]) -> None:
+        self.rules = list(rules)
+        self.pages = 0
+        self._lines_dropped = [0] * len(self.rules)
+        self._seconds = [0.0] * len(self.rules)
+
+    def clean(self, page_number: int, text: str) -> str:
+        lines = text.split("\n")
+        for i, rule in enumerate(self.rules):
+            start = time.perf_counter()
+            rule.begin_page(page_number)
+            before = len(lines)
+            lines = rule.apply(lines)
+            self._lines_dropped[i] += before - len(lines)
+            self._seconds[i] += time.perf_counter() - start
+        self.pages += 1
+        return "\n".join(lines)
+
+    @property
+    def stats(self) -> dict[str, dict]:
+        return {
+            rule.name: {"lines_dropped": dropped, "seconds": round(seconds, 6), **rule.counters}
+            for rule, dropped, seconds in zip(self.rules, self._lines_dropped, self._seconds)
+        }
+
+
+def default_cleaning_rules(nav_lines: set[str], top_hyperlink_map: dict[int, set[str]]) -> list[LineRule]:
+    """The four standard cleaning steps, in order."""
+    return [
+        NavBarRule(nav_lines),
+        LinePredicateRule("arrow_links", _is_arrow_link),
+        TopHyperlinkRule(top_hyperlink_map),
+        EncodingRule(),
+    ]
+
+
+def _apply_rule(rule: LineRule, pages_text: list[str], page_numbers: Iterable[int]) -> list[str]:
+    cleaned: list[str] = []
+    for text, page_number in zip(pages_text, page_numbers):
+        rule.begin_page(page_number)
+        cleaned.append("\n".join(rule.apply(text.split("\n"))))
     return cleaned
 
 
-def _get_top_hyperlink_texts(fitz_doc, total_pages: int) -> dict[int, set[str]]:
-    """For each page, collect text snippets that belong to hyperlinks in the
-    top 15 % of the page.  Keyed by 1-based page number."""
-    top_texts: dict[int, set[str]] = {}
-    for page_idx in range(min(len(fitz_doc), total_pages)):
-        page = fitz_doc[page_idx]
-        page_height = page.rect.height
-        top_limit = 0.15 * page_height
-
-        links = page.get_links()
-        link_rects = []
-        for link in links:
-            rect = fitz.Rect(link["from"])
-            if rect.y0 < top_limit:
-                link_rects.append(rect)
-
-        if not link_rects:
-            continue
+# Single-step helpers over whole page lists (used by tests and benchmarks).
 
-        # Find spans whose bounding boxes overlap with the link rects.
-        snippets: set[str] = set()
-        text_dict = page.get_text("dict")
-        for block in text_dict.get("blocks", []):
-            if block.get("type") != 0:
-                continue
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    span_rect = fitz.Rect(span["bbox"])
-                    for lr in link_rects:
-                        if span_rect.intersects(lr):
-                            t = span["text"].strip()
-                            if t:
-                                snippets.add(t)
-                            break
 
-        if snippets:
-            top_texts[page_idx + 1] = snippets  # 1-based key
-    return top_texts
+def _remove_nav_bars(pages_text: list[str], nav_lines: set[str]) -> list[str]:
+    """Strip nav-bar lines from every page."""
+    return _apply_rule(NavBarRule(nav_lines), pages_text, range(1, len(pages_text) + 1))
+
+
+def _remove_arrow_links(pages_text: list[str]) -> list[str]:
+    """Remove lines whose first non-whitespace character is an arrow."""
+    rule = LinePredicateRule("arrow_links", _is_arrow_link)
+    return _apply_rule(rule, pages_text, range(1, len(pages_text) + 1))
 
 
 def _remove_top_hyperlinks(raw_pages: list[dict], top_hyperlink_map: dict[int, set[str]]) -> list[str]:
     """For each page, remove lines that consist entirely of top-hyperlink
     text snippets."""
-    cleaned: list[str] = []
-    for page in raw_pages:
-        pn = page["page_number"]
-        snippets = top_hyperlink_map.get(pn, set())
-        if not snippets:
-            cleaned.append(page["text"] or "")
-            continue
-
-        lines = (page["text"] or "").split("\n")
-        filtered: list[str] = []
-        for ln in lines:
-            # A line is a hyperlink line if *all* its non-whitespace tokens
-            # are contained in the snippets set.
-            tokens = ln.split()
-            if tokens and all(any(tok in sn for sn in snippets) for tok in tokens):
-                continue
-            filtered.append(ln)
-        cleaned.append("\n".join(filtered))
-    return cleaned
+    texts = [p["text"] or "" for p in raw_pages]
+    return _apply_rule(TopHyperlinkRule(top_hyperlink_map), texts, (p["page_number"] for p in raw_pages))
 
 
 def _encoding_cleanup(pages_text: list[str], raw_pages: list[dict]) -> list[str]:
     """Drop any character that cannot be encoded as UTF-8, remove empty lines
     that result, and log a warning per affected page."""
-    cleaned: list[str] = []
-    for text, page in zip(pages_text, raw_pages):
-        new_chars: list[str] = []
-        dropped = False
-        for ch in text:
-            try:
-                ch.encode("utf-8")
-                new_chars.append(ch)
-            except UnicodeEncodeError:
-                dropped = True
-        if dropped:
-            logger.warning(
-                "Encoding cleanup: characters dropped on page %d",
-                page["page_number"],
-            )
-        # Remove lines that became empty after stripping.
-        lines = "".join(new_chars).split("\n")
-        cleaned.append("\n".join(ln for ln in lines if ln.strip()))
-    return cleaned
+    return _apply_rule(EncodingRule(), pages_text, (p["page_number"] for p in raw_pages))
 
 
 # ── Main extractor class ───────────────────────────────────────────────────
 
 
 class PDFExtractor(BaseExtractor):
-    """Extracts text and section structure from a PDF file."""
-
-    def extract(self, file_path: str) -> dict:
-        logger.info("Starting PDF extraction — %s", os.path.basename(file_path))
+    """Extracts text and section structure from a PDF file.
 
-        # ── open documents ─────────────────────────────────────────────
-        try:
-            fitz_doc = fitz.open(file_path)
-        except Exception as exc:
-            raise ExtractionError(f"Could not open PDF with fitz: {exc}") from exc
+    Args:
+        workers:     Process count for pdfplumber page-text extraction.
+                     ``None`` uses ``EXTRACTION_WORKERS``; 0 or 1 runs the
+                     serial loop.
+        text_engine: ``"pdfplumber"``, ``"fitz"`` or ``"auto"``; ``None`` uses
+                     ``TEXT_ENGINE``.  Section detection and cleaning always
+                     use fitz, so only ``pdfplumber`` opens the file twice.
+        memory_target_mb:
+                     Low-memory mode when > 0: pdfplumber text is read
+                     serially and its handle reopened between page chunks
+                     while resident memory is above this many MB, and the
+                     layout cache keeps only recent pages.  ``None`` uses
+                     ``EXTRACTION_MEMORY_TARGET_MB``; 0 turns it off.
+
+    Raises:
+        ValueError: for an unknown text engine.
+    """
 
-        if fitz_doc.is_encrypted:
-            fitz_doc.close()
-            raise ExtractionError("PDF is password-protected. Cannot extract text.")
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        text_engine: Optional[str] = None,
+        memory_target_mb: Optional[int] = None,
+    ) -> None:
+        self.workers = EXTRACTION_WORKERS if workers is None else workers
+        self.memory_target_mb = EXTRACTION_MEMORY_TARGET_MB if memory_target_mb is None else memory_target_mb
+        self.text_engine = (text_engine or TEXT_ENGINE).lower()
+        if self.text_engine not in TEXT_ENGINES:
+            raise ValueError(f"Unknown text engine '{self.text_engine}'; expected one of {TEXT_ENGINES}")
+        # Per-rule counters and timings from the most recent cleaning run.
+        self.cleaning_stats: dict[str, dict] = {}
+        # Per-stage timings and counters of the most recent run.
+        self.stats = ExtractionStats()
+        # Progress hook and cancellation token of the current run.
+        self._on_progress: Optional[ProgressCallback] = None
+        self._cancel: Optional[CancelToken] = None
+
+    def extract(
+        self,
+        source: PdfSource,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> dict:
+        """Extract metadata, sections and cleaned page text.
+
+        Args:
+            source:      Path to the PDF, or its bytes / a binary buffer.
+            on_progress: Called with an ``ExtractionProgress`` after every
+                         page read, once with the detected sections, and
+                         after every page cleaned.
+            cancel:      Checked before each event; once cancelled, the run
+                         stops with ``ExtractionCancelled``.
+        """
+        pdf = resolve_pdf_source(source)
+        logger.info("Starting PDF extraction — %s (%s text)", pdf.name, self.text_engine)
+        self._on_progress, self._cancel = on_progress, cancel
+        self.stats = stats = ExtractionStats()
+        start = time.perf_counter()
+        with stats.stage("open"):
+            fitz_doc, plumber_pdf = self._open_documents(pdf)
 
         try:
-            plumber_pdf = pdfplumber.open(file_path)
-        except Exception as exc:
-            fitz_doc.close()
-            raise ExtractionError(f"Could not open PDF with pdfplumber: {exc}") from exc
+            total_pages = len(fitz_doc)
+            stats.count("pages", total_pages)
 
-        try:
-            total_pages = len(plumber_pdf.pages)
-
-            # ── raw text extraction (pdfplumber) ───────────────────────
-            raw_pages: list[dict] = []
-            for i, page in enumerate(plumber_pdf.pages):
-                text = page.extract_text() or ""
-                raw_pages.append({"page_number": i + 1, "text": text})
+            # ── raw text extraction ────────────────────────────────────
+            raw_pages = []
+            texts = self._iter_raw_texts(fitz_doc, plumber_pdf, pdf, total_pages)
+            with stats.stage("text"), closing(texts):
+                for i, text in enumerate(texts):
+                    raw_pages.append({"page_number": i + 1, "text": text})
+                    self._emit("text", i + 1, total_pages)
 
             if all(p["text"].strip() == "" for p in raw_pages):
-                logger.error("No extractable text found in %s", file_path)
+                logger.error("No extractable text found in %s", pdf.name)
                 raise ExtractionError("PDF contains no extractable text.")
 
+            # One span table per page, shared by detection and cleaning.
+            layout_cache = self._layout_cache(fitz_doc)
+
             # ── section detection (3-tier) ─────────────────────────────
-            sections, strategy = self._detect_sections(fitz_doc, raw_pages, total_pages)
-            for sec in sections:
-                sec["title"] = sec["title"].translate(_STRIP_CONTROL).strip()
-            sections = compute_end_pages(sections, total_pages)
+            with stats.stage("sections"):
+                sections, strategy = self._detect_sections(fitz_doc, raw_pages, total_pages, layout_cache)
+            stats.count("sections", len(sections))
+            self._emit("sections", 1, 1, sections=sections)
 
             # ── text cleaning ──────────────────────────────────────────
-            pages = self._clean_pages(raw_pages, fitz_doc, total_pages)
+            pages = self._clean_pages(raw_pages, fitz_doc, total_pages, layout_cache)
+            self._record_layout_stats(layout_cache)
 
             # ── assemble output ────────────────────────────────────────
+            stats.add_time("total", time.perf_counter() - start)
+            self._record_memory_stats()
             result = {
-                "metadata": {
-                    "filename": os.path.basename(file_path),
-                    "total_pages": total_pages,
-                    "extracted_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "extraction_strategy": strategy,
-                    "version": "1.0",
-                },
+                "metadata": dict(self._metadata(pdf.name, total_pages, strategy), stats=stats.to_dict()),
                 "sections": sections,
                 "pages": pages,
             }
 
             logger.info("Extraction complete — %d pages, %d sections (%s)", total_pages, len(sections), strategy)
+            self._emit("done", total_pages, total_pages)
             return result
 
         finally:
-            plumber_pdf.close()
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+            fitz_doc.close()
+
+    def stream(
+        self,
+        source: PdfSource,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> Iterator[dict]:
+        """Streaming variant of ``extract()``.
+
+        Yields the header ``{"metadata", "sections"}`` first, then one cleaned
+        ``{"page_number", "text"}`` dict per page, in page order.
+
+        Pass 1 extracts raw page text into an on-disk spool while collecting
+        the only document-wide statistics cleaning needs (nav-bar line
+        frequencies and the Contents-page candidates).  Pass 2 reads the
+        spool back one page at a time, so peak memory no longer grows with
+        the page count.  Output is identical to ``extract()``, except that
+        ``metadata.stats`` in the header only covers the stages before
+        cleaning; ``self.stats`` holds the complete figures once the
+        generator is exhausted.  *on_progress* and *cancel* behave as in
+        ``extract()``.
+        """
+        pdf = resolve_pdf_source(source)
+        logger.info("Starting streaming PDF extraction — %s (%s text)", pdf.name, self.text_engine)
+        self._on_progress, self._cancel = on_progress, cancel
+        self.stats = stats = ExtractionStats()
+        start = time.perf_counter()
+        with stats.stage("open"):
+            fitz_doc, plumber_pdf = self._open_documents(pdf)
+
+        try:
+            total_pages = len(fitz_doc)
+            stats.count("pages", total_pages)
+
+            with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+                # ── pass 1: raw text → spool, global statistics ────────
+                nav_freq: Counter = Counter()
+                heads: list[dict] = []  # top 15 lines per page, for Tier 2
+                has_text = False
+                texts = self._iter_raw_texts(fitz_doc, plumber_pdf, pdf, total_pages)
+                with stats.stage("text"), closing(texts):
+                    for i, text in enumerate(texts):
+                        # ASCII escapes keep lone surrogates (dropped later by
+                        # EncodingRule) writable to the UTF-8 spool.
+                        spool.write(json.dumps(text) + "\n")
+                        _add_nav_bar_counts(nav_freq, text)
+                        heads.append({"page_number": i + 1, "text": "\n".join(text.strip().split("\n")[:15])})
+                        has_text = has_text or bool(text.strip())
+                        self._emit("text", i + 1, total_pages)
+
+                if not has_text:
+                    logger.error("No extractable text found in %s", pdf.name)
+                    raise ExtractionError("PDF contains no extractable text.")
+
+                layout_cache = self._layout_cache(fitz_doc)
+                with stats.stage("sections"):
+                    sections, strategy = self._detect_sections(fitz_doc, heads, total_pages, layout_cache)
+                stats.count("sections", len(sections))
+                self._emit("sections", 1, 1, sections=sections)
+                del heads
+
+                metadata = dict(self._metadata(pdf.name, total_pages, strategy), stats=stats.to_dict())
+                yield {"metadata": metadata, "sections": sections}
+
+                # ── pass 2: clean and emit one page at a time ──────────
+                nav_lines = _nav_bar_lines_from_counts(nav_freq, total_pages)
+                if nav_lines:
+                    logger.warning("Nav-bar lines removed (%d distinct): %s", len(nav_lines), list(nav_lines)[:3])
+                stats.count("nav_lines_distinct", len(nav_lines))
+                top_map = self._top_hyperlink_map(fitz_doc, total_pages, layout_cache)
+                pipeline = CleaningPipeline(self._cleaning_rules(nav_lines, top_map))
+
+                spool.seek(0)
+                for i, line in enumerate(spool):
+                    page_number = i + 1
+                    yield {"page_number": page_number, "text": pipeline.clean(page_number, json.loads(line))}
+                    self._emit("cleaning", page_number, total_pages)
+                self._record_cleaning_stats(pipeline)
+                self._record_layout_stats(layout_cache)
+                stats.add_time("total", time.perf_counter() - start)
+                self._record_memory_stats()
+
+            logger.info("Streaming extraction complete — %d pages, %d sections (%s)", total_pages, len(sections), strategy)
+            self._emit("done", total_pages, total_pages)
+
+        finally:
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+            fitz_doc.close()
+
+    # ── progress ───────────────────────────────────────────────────────
+
+    def _emit(self, stage: str, done: int, total: int, sections: Optional[list[dict]] = None) -> None:
+        """Check for cancellation, then report progress."""
+        if self._cancel is not None:
+            self._cancel.raise_if_cancelled()
+        if self._on_progress is not None:
+            self._on_progress(ExtractionProgress(stage, done, total, sections))
+
+    # ── documents / metadata ───────────────────────────────────────────
+
+    def _open_documents(self, pdf: PdfInput) -> tuple:
+        """Open the PDF with fitz, plus pdfplumber when it is the text engine.
+
+        Returns ``(fitz_doc, plumber_pdf)``; ``plumber_pdf`` is ``None`` for
+        the ``fitz`` and ``auto`` engines (``auto`` opens pdfplumber lazily).
+        Both documents read the same in-memory buffer when *pdf* has one.
+        """
+        try:
+            fitz_doc = _open_fitz(pdf)
+        except Exception as exc:
+            raise ExtractionError(f"Could not open PDF with fitz: {exc}") from exc
+
+        if fitz_doc.is_encrypted:
+            fitz_doc.close()
+            raise ExtractionError("PDF is password-protected. Cannot extract text.")
+
+        if self.text_engine != "pdfplumber":
+            return fitz_doc, None
+
+        try:
+            plumber_pdf = _open_plumber(pdf)
+        except Exception as exc:
+            fitz_doc.close()
+            raise ExtractionError(f"Could not open PDF with pdfplumber: {exc}") from exc
+
+        return fitz_doc, plumber_pdf
+
+    def _layout_cache(self, fitz_doc) -> LayoutCache:
+        max_pages = LOW_MEMORY_LAYOUT_PAGES if self.memory_target_mb > 0 else None
+        return LayoutCache(fitz_doc, max_pages=max_pages)
+
+    def _metadata(self, filename: str, total_pages: int, strategy: str) -> dict:
+        return {
+            "filename": filename,
+            "total_pages": total_pages,
+            "extracted_at": _utc_timestamp(),
+            "extraction_strategy": strategy,
+            "text_engine": self.text_engine,
+            "version": FORMAT_VERSION,
+        }
+
+    # ── raw text extraction ────────────────────────────────────────────
+
+    def _iter_raw_texts(self, fitz_doc, plumber_pdf, pdf: PdfInput, total_pages: int) -> Iterator[str]:
+        """Yield raw page text in page order from the configured engine."""
+        if self.text_engine == "fitz":
+            for page_idx in range(total_pages):
+                yield fitz_doc[page_idx].get_text()
+        elif self.text_engine == "auto":
+            yield from self._iter_auto_texts(fitz_doc, pdf, total_pages)
+        else:
+            yield from self._iter_plumber_texts(plumber_pdf, pdf, total_pages)
+
+    def _raw_page_text(self, fitz_doc, plumber_pdf, page_idx: int) -> str:
+        """Raw text of one page from the configured engine.  *plumber_pdf*
+        may be ``None`` for the ``fitz`` engine."""
+        if self.text_engine == "pdfplumber":
+            return _plumber_page_text(plumber_pdf, page_idx)
+        text = fitz_doc[page_idx].get_text()
+        if self.text_engine == "auto" and not _fitz_text_ok(text):
+            return _plumber_page_text(plumber_pdf, page_idx)
+        return text
+
+    @staticmethod
+    def _iter_auto_texts(fitz_doc, pdf: PdfInput, total_pages: int) -> Iterator[str]:
+        """fitz text per page; pages failing ``_fitz_text_ok`` are re-read with
+        pdfplumber, which is only opened if some page needs it."""
+        plumber_pdf = None
+        fallbacks = 0
+        try:
+            for page_idx in range(total_pages):
+                text = fitz_doc[page_idx].get_text()
+                if not _fitz_text_ok(text):
+                    if plumber_pdf is None:
+                        try:
+                            plumber_pdf = _open_plumber(pdf)
+                        except Exception as exc:
+                            raise ExtractionError(f"Could not open PDF with pdfplumber: {exc}") from exc
+                    text = _plumber_page_text(plumber_pdf, page_idx)
+                    fallbacks += 1
+                yield text
+        finally:
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+        logger.info("Auto text engine: %d/%d pages fell back to pdfplumber", fallbacks, total_pages)
+
+    def _iter_plumber_texts(self, plumber_pdf, pdf: PdfInput, total_pages: int) -> Iterator[str]:
+        """Yield pdfplumber page text in page order.
+
+        With ``workers > 1`` the page range is split into contiguous chunks
+        of about ``PARALLEL_CHUNK_PAGES`` pages, each extracted by a worker
+        process with its own pdfplumber handle; ``Executor.map`` yields
+        chunk results in submission order, so the merged sequence is
+        identical to the serial loop.  Closing the generator early (a
+        cancelled run) drops the queued chunks instead of waiting for them.
+        In-memory PDFs are always read serially rather than shipped to
+        every worker.
+        """
+        if self.memory_target_mb > 0:
+            yield from self._iter_plumber_texts_bounded(plumber_pdf, pdf, total_pages)
+            return
+        if self.workers <= 1 or total_pages < 2 or pdf.path is None:
+            for page_idx in range(total_pages):
+                yield _plumber_page_text(plumber_pdf, page_idx)
+            return
+
+        ranges = _split_page_range(total_pages, max(self.workers, -(-total_pages // PARALLEL_CHUNK_PAGES)))
+        workers = min(self.workers, len(ranges))
+        logger.info(
+            "Parallel text extraction — %d pages in %d chunks across %d workers", total_pages, len(ranges), workers
+        )
+        pool = ProcessPoolExecutor(max_workers=workers)
+        finished = False
+        try:
+            chunks = pool.map(
+                _extract_page_range,
+                [pdf.path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+            for chunk in chunks:
+                yield from chunk
+            finished = True
+        except Exception as exc:
+            raise ExtractionError(f"Parallel text extraction failed: {exc}") from exc
+        finally:
+            pool.shutdown(wait=finished, cancel_futures=not finished)
+
+    def _iter_plumber_texts_bounded(self, plumber_pdf, pdf: PdfInput, total_pages: int) -> Iterator[str]:
+        """Serial pdfplumber loop for low-memory mode.
+
+        Every ``LOW_MEMORY_CHUNK_PAGES`` pages, if resident memory is above
+        ``memory_target_mb``, the pdfplumber handle is swapped for a fresh
+        one — dropping pdfminer's object cache — and MuPDF's store is
+        emptied.  Text is identical to the plain loop.
+        """
+        current = plumber_pdf
+        try:
+            for page_idx in range(total_pages):
+                yield _plumber_page_text(current, page_idx)
+                at_boundary = (page_idx + 1) % LOW_MEMORY_CHUNK_PAGES == 0 and page_idx + 1 < total_pages
+                if not at_boundary:
+                    continue
+                rss = current_rss_mb()
+                if rss is not None and rss <= self.memory_target_mb:
+                    continue
+                if current is not plumber_pdf:
+                    current.close()
+                try:
+                    current = _open_plumber(pdf)
+                except Exception as exc:
+                    raise ExtractionError(f"Could not reopen PDF with pdfplumber: {exc}") from exc
+                fitz.TOOLS.store_shrink(100)
+                self.stats.count("pdf_reopens")
+        finally:
+            if current is not plumber_pdf:
+                current.close()
+
+    def extract_sections(self, source: PdfSource) -> dict:
+        """Section list only — no page text, no cleaning, no pdfplumber.
+
+        Tier 1 reads the PDF outline; Tier 2 looks for a Contents page among
+        the first ``CONTENTS_SCAN_PAGES`` pages using fitz text; Tier 3 runs
+        the font heuristic, which only needs fitz layout.
+
+        Returns:
+            ``{"metadata", "sections"}``; ``metadata.sections_only`` is
+            ``True``.
+        """
+        pdf = resolve_pdf_source(source)
+        logger.info("Starting sections-only extraction — %s", pdf.name)
+        self.stats = stats = ExtractionStats()
+        start = time.perf_counter()
+        try:
+            with stats.stage("open"):
+                fitz_doc = _open_fitz(pdf)
+        except Exception as exc:
+            raise ExtractionError(f"Could not open PDF with fitz: {exc}") from exc
+        try:
+            if fitz_doc.is_encrypted:
+                raise ExtractionError("PDF is password-protected. Cannot extract text.")
+            total_pages = len(fitz_doc)
+            stats.count("pages", total_pages)
+            with stats.stage("text"):
+                heads = [
+                    {"page_number": i + 1, "text": "\n".join(fitz_doc[i].get_text().strip().split("\n")[:15])}
+                    for i in range(min(total_pages, CONTENTS_SCAN_PAGES))
+                ]
+            layout_cache = LayoutCache(fitz_doc)
+            with stats.stage("sections"):
+                sections, strategy = self._detect_sections(fitz_doc, heads, total_pages, layout_cache)
+            stats.count("sections", len(sections))
+            self._record_layout_stats(layout_cache)
+            stats.add_time("total", time.perf_counter() - start)
+            metadata = dict(
+                self._metadata(pdf.name, total_pages, strategy), sections_only=True, stats=stats.to_dict()
+            )
+        finally:
+            fitz_doc.close()
+
+        logger.info("Sections-only extraction complete — %d sections (%s)", len(sections), strategy)
+        return {"metadata": metadata, "sections": sections}
+
+    def lazy(self, source: PdfSource, cache: Optional[ExtractionCache] = None) -> dict:
+        """Detect sections now; extract and clean page text on demand.
+
+        Section detection and the nav-bar statistics run on fitz text, which
+        is fast; the configured text engine only runs for the pages a caller
+        actually reads from the returned ``LazyPages``.
+
+        Args:
+            source: Path to the source PDF, or its bytes / a binary buffer.
+            cache:  Optional ``ExtractionCache``.  Detected sections and
+                    every page extracted so far are stored in it, so a later
+                    run skips detection and only extracts pages it has not
+                    seen.
+
+        Returns:
+            ``{"metadata", "sections", "pages"}`` where ``"pages"`` is a
+            ``LazyPages`` mapping (``page_number → cleaned text``).
+
+        Note:
+            Nav-bar lines are detected from fitz text rather than the
+            engine's own text.  Spacing differences between the engines
+            are ignored, but a nav bar that pdfplumber breaks into
+            different lines may survive cleaning.  With ``fitz`` the result
+            matches ``extract()``.
+        """
+        pdf = resolve_pdf_source(source)
+        key = cache.key_for(pdf.path or pdf.data, dict(extraction_settings(), mode="lazy")) if cache else None
+        entry = cache.get(key) if cache else None
+        if entry is not None:
+            try:
+                state = decode_packed(entry.read_bytes())
+                state["metadata"].update(filename=pdf.name, extracted_at=_utc_timestamp())
+                logger.info("Lazy extraction cache hit (%s) — %d pages extracted", key[:12], len(state["pages"]))
+            except ExtractionFormatError as exc:
+                logger.warning("Lazy extraction cache entry %s is unreadable (%s); re-detecting", entry.name, exc)
+                cache.discard(key)
+                entry = None
+            except FileNotFoundError:  # evicted by a concurrent writer
+                logger.info("Lazy extraction cache entry %s was evicted; re-detecting", entry.name)
+                entry = None
+
+        if entry is None:
+            state = self._lazy_state(pdf)
+            state["pages"] = []
+
+        pages = LazyPages(
+            self,
+            pdf,
+            state["metadata"]["total_pages"],
+            set(state["nav_lines"]),
+            pages={p["page_number"]: p["text"] for p in state["pages"]},
+        )
+        if cache:
+
+            def persist(lazy_pages: LazyPages) -> None:
+                cache.put(key, encode_packed(dict(state, pages=lazy_pages.page_dicts(extracted_only=True))))
+
+            pages.on_fill = persist
+        return {"metadata": state["metadata"], "sections": state["sections"], "pages": pages}
+
+    def _lazy_state(self, pdf: PdfInput) -> dict:
+        """Metadata, sections and nav-bar lines from a fitz-only pass."""
+        try:
+            fitz_doc = _open_fitz(pdf)
+        except Exception as exc:
+            raise ExtractionError(f"Could not open PDF with fitz: {exc}") from exc
+        try:
+            if fitz_doc.is_encrypted:
+                raise ExtractionError("PDF is password-protected. Cannot extract text.")
+            total_pages = len(fitz_doc)
+            nav_freq: Counter = Counter()
+            heads: list[dict] = []
+            for page_idx in range(total_pages):
+                text = fitz_doc[page_idx].get_text()
+                _add_nav_bar_counts(nav_freq, text)
+                heads.append({"page_number": page_idx + 1, "text": "\n".join(text.strip().split("\n")[:15])})
+
+            sections, strategy = self._detect_sections(fitz_doc, heads, total_pages, LayoutCache(fitz_doc))
+            return {
+                "metadata": self._metadata(pdf.name, total_pages, strategy),
+                "sections": sections,
+                "nav_lines": sorted(_nav_bar_lines_from_counts(nav_freq, total_pages)),
+            }
+        finally:
             fitz_doc.close()
 
     # ── section detection ──────────────────────────────────────────────
 
-    def _detect_sections(self, fitz_doc, raw_pages: list[dict], total_pages: int) -> tuple[list[dict], str]:
+    def _detect_sections(
+        self, fitz_doc, raw_pages: list[dict], total_pages: int, layout_cache: LayoutCache
+    ) -> tuple[list[dict], str]:
+        """Run the 3-tier detection, then normalise titles and derive end pages.
+
+        Returns ``(sections, strategy_name)``.
+        """
+        sections, strategy = self._detect_raw_sections(fitz_doc, raw_pages, total_pages, layout_cache)
+        for sec in sections:
+            sec["title"] = sec["title"].translate(_STRIP_CONTROL).strip()
+        return compute_end_pages(sections, total_pages), strategy
+
+    def _detect_raw_sections(
+        self, fitz_doc, raw_pages: list[dict], total_pages: int, layout_cache: LayoutCache
+    ) -> tuple[list[dict], str]:
         """Try Tier 1 → 2 → 3 and return (sections, strategy_name)."""
         # Tier 1 — PDF outline
         toc = fitz_doc.get_toc()
@@ -575,64 +1626,315 @@ class PDFExtractor(BaseExtractor):
         contents_idx = _find_contents_page_index(raw_pages)
         if contents_idx is not None:
             logger.info("Section detection: using Contents page (page %d)", contents_idx + 1)
-            sections = _parse_contents_page(fitz_doc[contents_idx])
+            sections = _parse_contents_page(fitz_doc[contents_idx], layout_cache.page(contents_idx))
             if sections:
                 return sections, "contents_page"
 
         # Tier 3 — font-size heuristic
         logger.info("Section detection: using font-size heuristic")
-        return _font_heuristic_sections(fitz_doc, total_pages), "font_heuristic"
+        return _font_heuristic_sections(fitz_doc, total_pages, layout_cache), "font_heuristic"
 
     # ── cleaning pipeline (steps run in order) ─────────────────────────
 
-    def _clean_pages(self, raw_pages: list[dict], fitz_doc, total_pages: int) -> list[dict]:
-        # Step 1 — Nav-bar removal
-        nav_lines = _build_nav_bar_lines(raw_pages, total_pages)
-        texts = _remove_nav_bars([p["text"] or "" for p in raw_pages], nav_lines)
+    def _clean_pages(
+        self, raw_pages: list[dict], fitz_doc, total_pages: int, layout_cache: LayoutCache
+    ) -> list[dict]:
+        # Document-wide inputs: nav-bar lines and top-of-page link snippets.
+        with self.stats.stage("nav_bar_stats"):
+            nav_lines = _build_nav_bar_lines(raw_pages, total_pages)
         if nav_lines:
             logger.warning("Nav-bar lines removed (%d distinct): %s", len(nav_lines), list(nav_lines)[:3])
+        self.stats.count("nav_lines_distinct", len(nav_lines))
+        top_map = self._top_hyperlink_map(fitz_doc, total_pages, layout_cache)
+
+        pipeline = CleaningPipeline(self._cleaning_rules(nav_lines, top_map))
+        pages = []
+        for p in raw_pages:
+            pages.append({"page_number": p["page_number"], "text": pipeline.clean(p["page_number"], p["text"] or "")})
+            self._emit("cleaning", p["page_number"], total_pages)
+        self._record_cleaning_stats(pipeline)
+        return pages
+
+    def _top_hyperlink_map(self, fitz_doc, total_pages: int, layout_cache: LayoutCache) -> dict[int, set[str]]:
+        link_counts: Counter = Counter()
+        with self.stats.stage("top_links"):
+            top_map = _get_top_hyperlink_texts(fitz_doc, total_pages, layout_cache, link_counts)
+        for name in ("links_inspected", "top_links"):
+            self.stats.count(name, link_counts[name])
+        return top_map
+
+    def _cleaning_rules(self, nav_lines: set[str], top_map: dict[int, set[str]]) -> list[LineRule]:
+        """The cleaning chain; override to add rules.  New rules belong
+        before ``EncodingRule``, which also drops the blank lines left by the
+        others."""
+        return default_cleaning_rules(nav_lines, top_map)
+
+    def _record_cleaning_stats(self, pipeline: CleaningPipeline) -> None:
+        self.cleaning_stats = pipeline.stats
+        for name, st in self.cleaning_stats.items():
+            self.stats.add_time(f"clean_{name}", st["seconds"])
+            for counter, value in st.items():
+                if counter != "seconds":
+                    self.stats.count(f"{name}_{counter}", value)
+        summary = ", ".join(
+            f"{name} −{st['lines_dropped']} lines ({st['seconds'] * 1000:.1f} ms)"
+            for name, st in self.cleaning_stats.items()
+        )
+        logger.info("Cleaning: %s", summary)
+
+    def _record_memory_stats(self) -> None:
+        peak = peak_rss_mb()
+        if peak is None:
+            return
+        self.stats.count("peak_rss_mb", round(peak))
+        if 0 < self.memory_target_mb < peak:
+            logger.warning("Peak RSS %.0f MB exceeded the %d MB memory target", peak, self.memory_target_mb)
+
+    def _record_layout_stats(self, layout_cache: LayoutCache) -> None:
+        self.stats.count("layout_parses", layout_cache.parses)
+        self.stats.count("spans_scanned", layout_cache.spans)
+        logger.info(
+            "Layout cache: %d page layouts parsed, %d parses saved",
+            layout_cache.parses,
+            layout_cache.hits,
+        )
+
+
+# ── Lazy extraction ────────────────────────────────────────────────────────
+
+
+class LazyPages(Mapping):
+    """Read-only ``page_number → cleaned text`` mapping that extracts pages
+    on first access.
+
+    ``prefetch`` extracts every missing page of a request in one pass over
+    the PDF; ``filter.resolve`` calls it with the selected page ranges, so
+    only those pages are ever read.  ``on_fill`` (if set) is called after
+    each pass — ``PDFExtractor.lazy`` uses it to persist the pages.
+    ``pages_extracted`` counts pages extracted by this instance.
+    """
 
-        # Step 2 — Arrow-link removal
-        texts = _remove_arrow_links(texts)
-
-        # Step 3 — Top hyperlink removal
-        top_map = _get_top_hyperlink_texts(fitz_doc, total_pages)
-        # Re-build raw_pages-like list with current texts for the helper.
-        interim = [{"page_number": p["page_number"], "text": t} for p, t in zip(raw_pages, texts)]
-        texts = _remove_top_hyperlinks(interim, top_map)
+    def __init__(
+        self,
+        extractor: "PDFExtractor",
+        source: PdfSource,
+        total_pages: int,
+        nav_lines: set[str],
+        pages: Optional[dict[int, str]] = None,
+    ) -> None:
+        self.extractor = extractor
+        self.pdf = resolve_pdf_source(source)
+        self.total_pages = total_pages
+        self.nav_lines = nav_lines
+        self.on_fill: Optional[Callable[["LazyPages"], None]] = None
+        self.pages_extracted = 0
+        self._pages: dict[int, str] = dict(pages or {})
+
+    # ── Mapping interface ──────────────────────────────────────────────
+
+    def __getitem__(self, page_number: int) -> str:
+        if not 1 <= page_number <= self.total_pages:
+            raise KeyError(page_number)
+        if page_number not in self._pages:
+            self.prefetch([page_number])
+        return self._pages[page_number]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self.total_pages + 1))
+
+    def __len__(self) -> int:
+        return self.total_pages
+
+    # ── extraction ─────────────────────────────────────────────────────
+
+    @property
+    def extracted(self) -> set[int]:
+        """Page numbers whose text is already available."""
+        return set(self._pages)
+
+    def prefetch(self, page_numbers: Iterable[int]) -> int:
+        """Extract and clean every requested page not yet available.
+
+        Returns:
+            The number of pages extracted.
+        """
+        missing = sorted({pn for pn in page_numbers if 1 <= pn <= self.total_pages and pn not in self._pages})
+        if not missing:
+            return 0
+
+        logger.info("Lazy extraction — %d pages (%d already available)", len(missing), len(self._pages))
+        fitz_doc, plumber_pdf = self.extractor._open_documents(self.pdf)
+        try:
+            if plumber_pdf is None and self.extractor.text_engine == "auto":
+                plumber_pdf = _open_plumber(self.pdf)
+            layout_cache = LayoutCache(fitz_doc)
+            top_map: dict[int, set[str]] = {}
+            for pn in missing:
+                snippets = _top_hyperlink_snippets(fitz_doc[pn - 1], layout_cache, pn - 1)
+                if snippets:
+                    top_map[pn] = snippets
+
+            pipeline = CleaningPipeline(self.extractor._cleaning_rules(self.nav_lines, top_map))
+            for pn in missing:
+                raw = self.extractor._raw_page_text(fitz_doc, plumber_pdf, pn - 1)
+                self._pages[pn] = pipeline.clean(pn, raw)
+            self.extractor._record_cleaning_stats(pipeline)
+        finally:
+            if plumber_pdf is not None:
+                plumber_pdf.close()
+            fitz_doc.close()
 
-        # Step 4 — Encoding cleanup
-        interim = [{"page_number": p["page_number"], "text": t} for p, t in zip(raw_pages, texts)]
-        texts = _encoding_cleanup(texts, interim)
+        self.pages_extracted += len(missing)
+        if self.on_fill is not None:
+            self.on_fill(self)
+        return len(missing)
 
-        return [{"page_number": p["page_number"], "text": t} for p, t in zip(raw_pages, texts)]
+    def page_dicts(self, extracted_only: bool = False) -> list[dict]:
+        """``{"page_number", "text"}`` list (JSON shape).  Extracts every
+        page unless *extracted_only*."""
+        if not extracted_only:
+            self.prefetch(range(1, self.total_pages + 1))
+        return [{"page_number": pn, "text": self._pages[pn]} for pn in sorted(self._pages)]
 
 
 # ── Public entry-point ─────────────────────────────────────────────────────
 
 
-def run_extraction(file_path: str, output_path: Optional[str] = None) -> dict:
+def extraction_settings() -> dict:
+    """Every setting that changes extractor output — part of the cache key."""
+    return {
+        "heading_font_size": HEADING_FONT_SIZE,
+        "major_section_font_size": MAJOR_SECTION_FONT_SIZE,
+        "max_page_appearances": MAX_PAGE_APPEARANCES,
+        "min_heading_chars": MIN_HEADING_CHARS,
+        "text_engine": TEXT_ENGINE,
+        "format_version": FORMAT_VERSION,
+    }
+
+
+def run_extraction(
+    file_path: PdfSource,
+    output_path: Optional[str] = None,
+    use_cache: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelToken] = None,
+) -> dict:
     """Extract text and sections from a PDF and persist the cache.
 
     Args:
-        file_path:   Path to the source PDF.
-        output_path: Where to write the JSON cache (defaults to
-                     ``output/extracted_text.json``).
+        file_path:   Path to the source PDF, or its bytes / a binary buffer
+                     (e.g. a Streamlit upload), which is never written to
+                     disk.
+        output_path: Where to write the cache (defaults to
+                     ``output/extracted_text.json``).  The suffix picks the
+                     format — ``.pages`` (indexed page store), ``.bin``
+                     (packed), ``.ndjson``, otherwise JSON; see
+                     ``extraction_io.save_extraction``.
+        use_cache:   Look the PDF up in the content-addressed
+                     ``ExtractionCache`` first, and store fresh results in it.
+        on_progress: Per-page ``ExtractionProgress`` hook (see
+                     ``PDFExtractor.extract``); a cache hit reports the
+                     ``"sections"`` and ``"done"`` events only.
+        cancel:      ``CancelToken``; a cancelled run raises
+                     ``ExtractionCancelled`` and writes nothing.
 
     Returns:
         The extraction result dict (same content that was written to disk).
     """
+    out = Path(output_path) if output_path else OUTPUT_DIR / "extracted_text.json"
+
+    pdf = resolve_pdf_source(file_path)
+    cache = ExtractionCache() if use_cache else None
+    key = cache.key_for(pdf.path or pdf.data, extraction_settings()) if cache else None
+    result: Optional[dict] = None
+
+    if cache:
+        entry = cache.get(key)
+        if entry is not None:
+            try:
+                result = decode_packed(entry.read_bytes())
+                # The key is content-addressed: report this source's name
+                # and time, but keep the original run's stats.
+                result["metadata"].update(filename=pdf.name, extracted_at=_utc_timestamp())
+                logger.info("Extraction cache hit (%s)", key[:12])
+            except ExtractionFormatError as exc:
+                logger.warning("Extraction cache entry %s is unreadable (%s); re-extracting", entry.name, exc)
+                cache.discard(key)
+            except FileNotFoundError:  # evicted by a concurrent writer
+                logger.info("Extraction cache entry %s was evicted; re-extracting", entry.name)
+
+    if result is None:
+        extractor = Registry.get_extractor("pdf")
+        result = extractor.extract(pdf, on_progress=on_progress, cancel=cancel)
+        if cache:
+            cache.put(key, encode_packed(result))
+    elif on_progress is not None:
+        total_pages = result["metadata"]["total_pages"]
+        on_progress(ExtractionProgress("sections", 1, 1, sections=result["sections"]))
+        on_progress(ExtractionProgress("done", total_pages, total_pages))
+
+    save_extraction(result, out)
+    logger.info("Extraction cache written → %s", out)
+
+    return result
+
+
+def run_lazy_extraction(file_path: PdfSource, use_cache: bool = True) -> dict:
+    """Detect sections now and extract page text only as it is read.
+
+    Returns the extraction dict with a ``LazyPages`` mapping in ``"pages"``;
+    pass it straight to ``pipeline.run_pipeline`` and only the pages of the
+    selected sections are extracted.  With *use_cache*, sections and
+    extracted pages persist in the ``ExtractionCache`` across runs.
+    """
     extractor = Registry.get_extractor("pdf")
-    result = extractor.extract(file_path)
+    if not hasattr(extractor, "lazy"):
+        raise ExtractionError(f"{type(extractor).__name__} does not support lazy extraction")
+    return extractor.lazy(file_path, cache=ExtractionCache() if use_cache else None)
 
-    out = Path(output_path) if output_path else OUTPUT_DIR / "extracted_text.json"
+
+def run_sections_extraction(file_path: PdfSource, output_path: Optional[str] = None) -> dict:
+    """Detect sections without extracting page text and write them as JSON
+    (default ``output/sections.json``).  Returns ``{"metadata", "sections"}``."""
+    extractor = Registry.get_extractor("pdf")
+    if not hasattr(extractor, "extract_sections"):
+        raise ExtractionError(f"{type(extractor).__name__} does not support sections-only extraction")
+    result = extractor.extract_sections(file_path)
+
+    out = Path(output_path) if output_path else OUTPUT_DIR / "sections.json"
     out.parent.mkdir(parents=True, exist_ok=True)
     out.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
-    logger.info("Extraction cache written → %s", out)
-
+    logger.info("Sections written → %s", out)
     return result
 
 
+def run_streaming_extraction(file_path: PdfSource, output_path: Optional[str] = None) -> dict:
+    """Extract a PDF page by page, appending each cleaned page to an NDJSON
+    file as soon as it is ready.
+
+    Args:
+        file_path:   Path to the source PDF, or its bytes / a binary buffer.
+        output_path: NDJSON destination (defaults to
+                     ``output/extracted_text.ndjson``).
+
+    Returns:
+        The header dict ``{"metadata", "sections"}``; page text stays on disk
+        and can be read back with ``extraction_io.load_extraction``.  The
+        returned ``metadata.stats`` covers the whole run; the copy in the
+        file's header line only covers the stages before cleaning.
+    """
+    out = Path(output_path) if output_path else OUTPUT_DIR / "extracted_text.ndjson"
+
+    extractor = Registry.get_extractor("pdf")
+    records = extractor.stream(file_path)
+    header = next(records)
+    pages = write_ndjson(chain([header], records), out)
+    logger.info("Streaming extraction written → %s (%d pages)", out, pages)
+    header["metadata"] = dict(header["metadata"], stats=extractor.stats.to_dict())
+
+    return header
+
+
 # ── Standalone CLI ─────────────────────────────────────────────────────────
 
 if __name__ == "__main__":  # pragma: no cover
@@ -641,6 +1943,7 @@ if __name__ == "__main__":  # pragma: no cover
     parser = argparse.ArgumentParser(description="Extract text and sections from a PDF")
     parser.add_argument("--input", required=True, help="Path to the PDF file")
     parser.add_argument("--output", default=None, help="Output JSON path (optional)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the extraction cache")
     args = parser.parse_args()
 
-    run_extraction(file_path=args.input, output_path=args.output)
+    run_extraction(file_path=args.input, output_path=args.output, use_cache=not args.no_cache)
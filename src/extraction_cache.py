@@ -0,0 +1,132 @@
+"""Content-addressed extraction cache.
+
+Each entry is keyed by the SHA-256 of the PDF bytes combined with every
+setting that changes the extractor's output (heading thresholds, nav-bar
+threshold, format version, …), so re-extracting an unchanged file with
+unchanged settings is a file lookup rather than a full parse.
+
+Entries are stored as ``<key>.bin`` in ``EXTRACTION_CACHE_DIR`` using the
+packed, compressed format from ``extraction_io``.  Reads refresh an entry's
+mtime; when the directory grows past ``EXTRACTION_CACHE_MAX_BYTES`` the
+least-recently-used entries are evicted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from src.app_config import EXTRACTION_CACHE_DIR, EXTRACTION_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """Return the hex SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Size-bounded, LRU-evicted directory of extraction results.
+
+    Args:
+        cache_dir: Directory holding the entries (default
+                   ``EXTRACTION_CACHE_DIR``).
+        max_bytes: Total size budget for the directory (default
+                   ``EXTRACTION_CACHE_MAX_BYTES``).
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else EXTRACTION_CACHE_DIR
+        self.max_bytes = EXTRACTION_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+
+    # ── keys ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def key_for(source: Union[str, bytes], settings: dict) -> str:
+        """Derive the cache key from the PDF bytes and the extraction settings.
+
+        *source* is a file path, or the PDF bytes themselves (an upload).
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            content_hash = hashlib.sha256(source).hexdigest()
+        else:
+            content_hash = file_sha256(source)
+        digest = hashlib.sha256()
+        digest.update(content_hash.encode("ascii"))
+        digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.bin"
+
+    # ── lookup / store ─────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the entry path on a hit (refreshing its LRU stamp), else ``None``.
+
+        A concurrent ``evict()`` may still remove the entry after this
+        returns, so callers treat ``FileNotFoundError`` on read as a miss.
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, payload: bytes) -> Path:
+        """Store a serialised extraction result and enforce the size budget.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        self.evict(keep=path)
+        return path
+
+    def discard(self, key: str) -> None:
+        """Remove an entry (e.g. one that failed to parse)."""
+        self.path_for(key).unlink(missing_ok=True)
+
+    def evict(self, keep: Optional[Path] = None) -> list[Path]:
+        """Delete least-recently-used entries until the directory fits the
+        size budget.  *keep* (the entry just written) is never evicted.
+
+        Returns:
+            The paths that were removed.
+        """
+        entries = []
+        for path in self.cache_dir.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by a concurrent writer
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed: list[Path] = []
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+
+        if removed:
+            logger.info("Extraction cache: evicted %d entries (budget %d bytes)", len(removed), self.max_bytes)
+        return removed
@@ -0,0 +1,208 @@
+"""Reading and writing extraction results on disk.
+
+Formats
+-------
+json     ``extracted_text.json`` — one pretty-printed document (default).
+ndjson   a header line ``{"metadata", "sections"}`` followed by one
+         ``{"page_number", "text"}`` object per line; written incrementally
+         by streaming extraction.
+pages    indexed page store (see ``page_store.py``); loaded lazily, so
+         ``"pages"`` is a ``PageStore`` mapping rather than a list.
+bin      packed document — a binary preamble (magic, layout, codec,
+         ``metadata.version``) followed by compact JSON compressed with zlib,
+         zstd (if ``zstandard`` is installed) or nothing.  Also the format of
+         ``ExtractionCache`` entries.
+
+``save_extraction`` picks the writer from the file suffix; ``load_extraction``
+sniffs the format from the file content, so callers never need to know which
+writer produced a file.
+"""
+
+import json
+import logging
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.app_config import EXTRACTION_CODEC
+from src.page_store import PAGE_STORE_SUFFIX, PageStore, is_page_store, write_page_store
+
+try:  # optional dependency — zstd codec for packed files
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Schema version written to ``metadata.version``.  Packed files record it in
+# their preamble and are rejected when the major version differs.
+# 1.1 — sections carry ``id``, ``parent_id``, ``child_ids`` and ``depth``.
+FORMAT_VERSION = "1.1"
+
+PACKED_MAGIC = b"APXB"
+PACKED_SUFFIX = ".bin"
+NDJSON_SUFFIX = ".ndjson"
+_PACKED_LAYOUT = 1
+# magic, layout version, codec id, NUL-padded ASCII schema version
+_PACKED_PREAMBLE = struct.Struct("<4sHB8s")
+_CODEC_IDS = {"none": 0, "zlib": 1, "zstd": 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+
+
+class ExtractionFormatError(Exception):
+    """Raised when a file cannot be decoded as an extraction result."""
+
+
+# ── packed (binary) format ─────────────────────────────────────────────────
+
+
+def _resolve_codec(codec: Optional[str]) -> str:
+    codec = (codec or EXTRACTION_CODEC).lower()
+    if codec not in _CODEC_IDS:
+        raise ValueError(f"Unknown codec '{codec}'; expected one of {tuple(_CODEC_IDS)}")
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; packing with zlib instead")
+        return "zlib"
+    return codec
+
+
+def encode_packed(result: dict, codec: Optional[str] = None) -> bytes:
+    """Serialise an extraction result to the packed binary format.
+
+    Args:
+        result: The extraction dict.
+        codec:  ``"zlib"``, ``"zstd"`` or ``"none"``; ``None`` uses
+                ``EXTRACTION_CODEC``.
+    """
+    codec = _resolve_codec(codec)
+    body = json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if codec == "zlib":
+        body = zlib.compress(body, 6)
+    elif codec == "zstd":
+        body = zstandard.ZstdCompressor(level=3).compress(body)
+
+    version = result.get("metadata", {}).get("version", FORMAT_VERSION).encode("ascii")
+    return _PACKED_PREAMBLE.pack(PACKED_MAGIC, _PACKED_LAYOUT, _CODEC_IDS[codec], version) + body
+
+
+def decode_packed(data: bytes) -> dict:
+    """Inverse of ``encode_packed``.
+
+    Raises:
+        ExtractionFormatError: on a bad preamble, an unsupported layout or
+            schema version, a missing codec, or a corrupt body.
+    """
+    if len(data) < _PACKED_PREAMBLE.size:
+        raise ExtractionFormatError("Packed extraction file is truncated")
+    magic, layout, codec_id, raw_version = _PACKED_PREAMBLE.unpack_from(data, 0)
+    if magic != PACKED_MAGIC:
+        raise ExtractionFormatError("Not a packed extraction file")
+    if layout != _PACKED_LAYOUT:
+        raise ExtractionFormatError(f"Unsupported packed layout version {layout}")
+
+    version = raw_version.rstrip(b"\0").decode("ascii")
+    if version.split(".")[0] != FORMAT_VERSION.split(".")[0]:
+        raise ExtractionFormatError(
+            f"Extraction schema version {version} is not supported (expected {FORMAT_VERSION})"
+        )
+
+    codec = _CODEC_NAMES.get(codec_id)
+    if codec is None:
+        raise ExtractionFormatError(f"Unknown codec id {codec_id}")
+    if codec == "zstd" and zstandard is None:
+        raise ExtractionFormatError("File is zstd-compressed but zstandard is not installed")
+
+    body = data[_PACKED_PREAMBLE.size :]
+    try:
+        if codec == "zlib":
+            body = zlib.decompress(body)
+        elif codec == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+        return json.loads(body)
+    except Exception as exc:  # zlib.error, ZstdError, JSON / UTF-8 errors
+        raise ExtractionFormatError(f"Corrupt packed extraction file: {exc}") from exc
+
+
+def is_packed(path: Path) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(len(PACKED_MAGIC)) == PACKED_MAGIC
+
+
+# ── NDJSON ─────────────────────────────────────────────────────────────────
+
+
+def write_ndjson(records: Iterable[dict], path: Path) -> int:
+    """Write a header record followed by page records, one JSON object per
+    line, flushing after every line so partial output is visible on disk.
+
+    Returns:
+        The number of page records written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pages = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        for idx, record in enumerate(records):
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+            fh.flush()
+            if idx:
+                pages += 1
+    return pages
+
+
+# ── dispatch ───────────────────────────────────────────────────────────────
+
+
+def save_extraction(result: dict, path) -> Path:
+    """Write *result* in the format implied by the suffix of *path*:
+    ``.pages`` (page store), ``.bin`` (packed), ``.ndjson``, else
+    pretty-printed JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == PAGE_STORE_SUFFIX:
+        write_page_store(result, path)
+    elif path.suffix == PACKED_SUFFIX:
+        path.write_bytes(encode_packed(result))
+    elif path.suffix == NDJSON_SUFFIX:
+        header = {"metadata": result["metadata"], "sections": result["sections"]}
+        write_ndjson([header, *result["pages"]], path)
+    else:
+        path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def load_extraction(path, lazy: bool = False) -> dict:
+    """Load an extraction result written in any supported format.
+
+    Args:
+        path: The file to read.
+        lazy: For a page store, return ``"pages"`` as the open ``PageStore``
+              (``page_number → text``, decoded on access) instead of reading
+              every page into memory.  The caller must ``close()`` it.
+
+    Returns:
+        The canonical ``{"metadata", "sections", "pages"}`` dict.
+    """
+    path = Path(path)
+    if is_page_store(path):
+        store = PageStore(path)
+        if lazy:
+            return {"metadata": store.metadata, "sections": store.sections, "pages": store}
+        with store:
+            return {"metadata": store.metadata, "sections": store.sections, "pages": store.page_dicts()}
+    if is_packed(path):
+        return decode_packed(path.read_bytes())
+
+    with open(path, encoding="utf-8") as fh:
+        first_line = fh.readline()
+        try:
+            header = json.loads(first_line)
+        except json.JSONDecodeError:
+            header = None
+
+        if isinstance(header, dict) and "metadata" in header and "pages" not in header:
+            pages = [json.loads(line) for line in fh if line.strip()]
+            return {"metadata": header["metadata"], "sections": header.get("sections", []), "pages": pages}
+
+        fh.seek(0)
+        return json.load(fh)
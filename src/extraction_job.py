@@ -0,0 +1,95 @@
+"""Background extraction — run ``run_extraction`` on a worker thread.
+
+The Streamlit UI starts an ``ExtractionJob`` and polls it on every rerun:
+``progress`` tracks the latest per-page event, ``sections`` is filled in as
+soon as detection finishes (so section selection can start while pages are
+still being cleaned), and ``result`` / ``error`` are set when the run ends.
+``cancel()`` stops the run at the next page boundary.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from src.extract import (
+    CancelToken,
+    ExtractionCancelled,
+    ExtractionProgress,
+    PdfSource,
+    resolve_pdf_source,
+    run_extraction,
+)
+
+logger = logging.getLogger(__name__)
+
+# Job states.
+PENDING, RUNNING, DONE, FAILED, CANCELLED = "pending", "running", "done", "failed", "cancelled"
+
+
+class ExtractionJob:
+    """One extraction running on a daemon thread.
+
+    Args:
+        source:      Path to the PDF, or its bytes / a binary buffer.  Buffers
+                     are read once, up front, so the caller may discard them.
+        output_path: Passed through to ``run_extraction``.
+        use_cache:   Passed through to ``run_extraction``.
+    """
+
+    def __init__(self, source: PdfSource, output_path: Optional[str] = None, use_cache: bool = True) -> None:
+        self.pdf = resolve_pdf_source(source)
+        self.output_path = output_path
+        self.use_cache = use_cache
+        self.state = PENDING
+        self.progress: Optional[ExtractionProgress] = None
+        self.sections: Optional[list[dict]] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self._token = CancelToken()
+        self._thread = threading.Thread(target=self._run, name=f"extract-{self.pdf.name}", daemon=True)
+
+    # ── control ────────────────────────────────────────────────────────
+
+    def start(self) -> "ExtractionJob":
+        self.state = RUNNING
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Ask the run to stop; it does so before the next page."""
+        self._token.cancel()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the run ends; returns ``False`` on timeout."""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @property
+    def running(self) -> bool:
+        return self.state in (PENDING, RUNNING)
+
+    # ── worker ─────────────────────────────────────────────────────────
+
+    def _on_progress(self, event: ExtractionProgress) -> None:
+        if event.sections is not None:
+            self.sections = event.sections
+        self.progress = event
+
+    def _run(self) -> None:
+        try:
+            self.result = run_extraction(
+                self.pdf,
+                output_path=self.output_path,
+                use_cache=self.use_cache,
+                on_progress=self._on_progress,
+                cancel=self._token,
+            )
+        except ExtractionCancelled:
+            logger.info("Extraction of %s cancelled", self.pdf.name)
+            self.state = CANCELLED
+        except Exception as exc:
+            logger.exception("Background extraction of %s failed", self.pdf.name)
+            self.error = str(exc)
+            self.state = FAILED
+        else:
+            self.state = DONE
@@ -1,13 +1,17 @@
 """Section resolution — bridges user section selection and extracted data.
 
 Reads ``config.json``-style section entries and maps each one to the actual
-pages and text discovered by the extractor.  Returns an ``OrderedDict``
-preserving the caller's requested order.
+pages and text discovered by the extractor.  Returns a ``SourcePassages``
+(an ``OrderedDict``) preserving the caller's requested order.
 """
 
+import difflib
 import logging
+import re
+import unicodedata
 from collections import OrderedDict
-from typing import Optional
+from collections.abc import Iterator, Mapping
+from typing import NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -16,89 +20,484 @@ class SectionNotFoundError(Exception):
     """Raised when a requested section name has no match in the extraction."""
 
 
+# ── passages ───────────────────────────────────────────────────────────────
+
+
+PageRanges = list[tuple[int, int]]
+
+
+class Passage(Mapping):
+    """One resolved section: merged page ranges over the extraction's shared
+    page store.  Reads like ``{"start_page", "end_page", "text"}``; the text
+    is joined from the store on first access and kept."""
+
+    __slots__ = ("ranges", "start_page", "end_page", "_page_text", "_text")
+
+    _KEYS = ("start_page", "end_page", "text")
+
+    def __init__(self, page_text: Mapping[int, str], ranges: PageRanges) -> None:
+        self.ranges = _merge_ranges(ranges)
+        self.start_page = self.ranges[0][0]
+        self.end_page = self.ranges[-1][1]
+        self._page_text = page_text
+        self._text: Optional[str] = None
+
+    @property
+    def pages(self) -> list[int]:
+        return [pn for start, end in self.ranges for pn in range(start, end + 1)]
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self.collect(start, end) for start, end in self.ranges)
+        return self._text
+
+    def collect(self, start: int, end: int) -> str:
+        """Marked-up text of pages *start*–*end* from the page store."""
+        return _collect_text(self._page_text, start, end)
+
+    def __getitem__(self, key: str):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"Passage(pages {_format_ranges(self.ranges)})"
+
+
+class SectionBlock(NamedTuple):
+    """One section of the rendered source text."""
+
+    name: str
+    header: str
+    body: str
+
+
+class SourcePassages(OrderedDict):
+    """``resolve()`` result: section name → ``Passage``.
+
+    ``render()`` builds the prompt text for the whole selection once and
+    returns the same string to every later caller, so generation and
+    verification share one copy per run.  Each page appears in it once:
+    a page already shown under an earlier section is referenced, not
+    repeated.  ``duplicate_pages`` counts the page repeats so removed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._blocks: Optional[list[SectionBlock]] = None
+        self._rendered: Optional[str] = None
+        self.duplicate_pages = 0
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value) -> None:
+        self._blocks = self._rendered = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._blocks = self._rendered = None
+        super().__delitem__(key)
+
+    def blocks(self) -> list[SectionBlock]:
+        """Per-section header and body that ``render()`` joins."""
+        if self._blocks is None:
+            self._blocks = _render_blocks(self)
+        return self._blocks
+
+    def render(self) -> str:
+        """Prompt text for every section, with section and page markers."""
+        if self._rendered is None:
+            self._rendered = join_blocks(self.blocks())
+            logger.info(
+                "Rendered source text — %d chars over %d sections (%s)",
+                len(self._rendered), len(self),
+                ", ".join(f"{name}: {size}" for name, size in self.rendered_sizes().items()),
+            )
+        return self._rendered
+
+    def rendered_sizes(self) -> dict[str, int]:
+        """Characters each section contributes to ``render()``."""
+        return {b.name: len(b.header) + len(b.body) for b in self.blocks()}
+
+    def page_sections(self) -> dict[int, list[str]]:
+        """Page number → every requested section that includes it."""
+        owners: dict[int, list[str]] = {}
+        for name, passage in self.items():
+            for pn in _passage_pages(passage):
+                owners.setdefault(pn, []).append(name)
+        return dict(sorted(owners.items()))
+
+
+def format_passages(source_passages: Mapping) -> str:
+    """Prompt text for any name → ``{"start_page", "end_page", "text"}``
+    mapping; a ``SourcePassages`` returns its cached rendering."""
+    if isinstance(source_passages, SourcePassages):
+        return source_passages.render()
+    return join_blocks(_render_blocks(source_passages))
+
+
+def passage_blocks(source_passages: Mapping) -> list[SectionBlock]:
+    """``SectionBlock`` list for any passages mapping (cached for a
+    ``SourcePassages``)."""
+    if isinstance(source_passages, SourcePassages):
+        return source_passages.blocks()
+    return _render_blocks(source_passages)
+
+
+def join_blocks(blocks: list[SectionBlock]) -> str:
+    return "\n".join(part for block in blocks for part in (block.header, block.body))
+
+
+def _render_blocks(source_passages: Mapping) -> list[SectionBlock]:
+    blocks: list[SectionBlock] = []
+    shown: dict[int, str] = {}  # page → section it was first shown under
+    for section_name, data in source_passages.items():
+        if isinstance(data, Passage):
+            header = f"\n=== Section: {section_name} (Pages {_format_ranges(data.ranges)}) ===\n"
+            body = _render_unshown(section_name, data, shown)
+        else:
+            header = f"\n=== Section: {section_name} (Pages {data['start_page']}-{data['end_page']}) ===\n"
+            body = data["text"]
+        blocks.append(SectionBlock(section_name, header, body))
+    return blocks
+
+
+def _render_unshown(section_name: str, passage: Passage, shown: dict[int, str]) -> str:
+    """Text of *passage* with pages already in *shown* replaced by a pointer
+    to the section that holds them; records the rest in *shown*."""
+    if not any(pn in shown for pn in passage.pages):
+        for pn in passage.pages:
+            shown[pn] = section_name
+        return passage.text
+
+    # Split the section's pages into runs: new pages, or pages shown
+    # under one earlier section.
+    runs: list[tuple[Optional[str], int, int]] = []
+    for pn in passage.pages:
+        owner = shown.get(pn)
+        if runs and runs[-1][0] == owner and runs[-1][2] == pn - 1:
+            runs[-1] = (owner, runs[-1][1], pn)
+        else:
+            runs.append((owner, pn, pn))
+    parts = []
+    for owner, start, end in runs:
+        if owner is None:
+            parts.append(passage.collect(start, end))
+        else:
+            pages = f"Page {start}" if start == end else f"Pages {start}-{end}"
+            parts.append(f"--- {pages}: shown above under section '{owner}' ---")
+    for pn in passage.pages:
+        shown.setdefault(pn, section_name)
+    return "\n".join(parts)
+
+
+def _passage_pages(data: Mapping) -> list[int]:
+    if isinstance(data, Passage):
+        return data.pages
+    return list(range(data["start_page"], data["end_page"] + 1))
+
+
 # ── public API ─────────────────────────────────────────────────────────────
 
 
-def resolve(extracted_data: dict, selected_sections: list[dict]) -> OrderedDict:
+def resolve(extracted_data: dict, selected_sections: list[dict]) -> SourcePassages:
     """Resolve each section entry to its page range and concatenated text.
 
     Args:
-        extracted_data:    The full extraction dict (from ``extracted_text.json``).
+        extracted_data:    The extraction dict (from ``extraction_io.load_extraction``
+                           or ``extract.run_lazy_extraction``); ``"pages"`` is a
+                           page list, a ``PageStore`` or a ``LazyPages``.
         selected_sections: List of ``{"name": str, "page_override": str | None}``.
 
     Returns:
-        ``OrderedDict`` mapping each requested section name to
-        ``{"start_page": int, "end_page": int, "text": str}``.
+        ``SourcePassages`` mapping each requested section name to a
+        ``Passage`` — read as ``{"start_page": int, "end_page": int,
+        "text": str}``, with the text joined from the page store on demand.
 
     Raises:
         SectionNotFoundError: if a name cannot be matched and has no override.
     """
     if not selected_sections:
-        return OrderedDict()
+        return SourcePassages()
 
     sections_db = extracted_data.get("sections", [])
     pages_db = extracted_data.get("pages", [])
 
-    # Build a quick page-number → text lookup.
-    page_text: dict[int, str] = {p["page_number"]: p.get("text", "") for p in pages_db}
-
-    result: OrderedDict = OrderedDict()
+    # Page-number → text lookup.  A ``PageStore`` already is one and decodes
+    # only the pages asked for; a plain page list is indexed once.
+    if isinstance(pages_db, Mapping):
+        page_text: Mapping[int, str] = pages_db
+    else:
+        page_text = {p["page_number"]: p.get("text", "") for p in pages_db}
 
+    index = section_index(sections_db)
+    requested: list[tuple[str, PageRanges]] = []
     for entry in selected_sections:
         name = entry["name"]
         override = entry.get("page_override")
 
         if override:
-            start, end = _parse_page_override(override)
+            page_ranges = _parse_page_override(override)
         else:
-            matched = _find_best_match(name, sections_db)
+            matched = index.match(name)
             if matched is None:
-                available = [s["title"] for s in sections_db]
-                raise SectionNotFoundError(
-                    f"Section '{name}' not found.  Available sections: {available}"
-                )
-            start = matched["start_page"]
-            end = matched["end_page"]
+                raise SectionNotFoundError(_not_found_message(name, index))
+            page_ranges = [(matched["start_page"], matched["end_page"])]
+        requested.append((name, page_ranges))
+
+    # Every page once, however many sections (a parent and its children,
+    # or overlapping overrides) ask for it.
+    unique = _merge_ranges([r for _, page_ranges in requested for r in page_ranges])
+
+    # A lazy page source (``extract.LazyPages``) extracts every requested
+    # page in one pass instead of one page per lookup.
+    prefetch = getattr(page_text, "prefetch", None)
+    if prefetch is not None:
+        prefetch(pn for start, end in unique for pn in range(start, end + 1))
+
+    result = SourcePassages()
+    for name, page_ranges in requested:
+        result[name] = passage = Passage(page_text, page_ranges)
+        logger.info("Resolved section '%s' → pages %s", name, _format_ranges(passage.ranges))
 
-        text = _collect_text(page_text, start, end)
-        result[name] = {"start_page": start, "end_page": end, "text": text}
-        logger.info("Resolved section '%s' → pages %d–%d", name, start, end)
+    requested_pages = sum(end - start + 1 for _, page_ranges in requested for start, end in page_ranges)
+    result.duplicate_pages = requested_pages - sum(end - start + 1 for start, end in unique)
+    if result.duplicate_pages:
+        logger.info("Removed %d duplicate pages from the selection.", result.duplicate_pages)
 
     return result
 
 
+# ── section-title index ────────────────────────────────────────────────────
+
+# Suggestions listed in a ``SectionNotFoundError`` and the lowest fuzzy score
+# that still counts as "similar".
+MAX_SUGGESTIONS = 5
+MIN_SUGGESTION_SCORE = 0.5
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _strip_control(text: str) -> str:
+    return "".join(ch for ch in text if unicodedata.category(ch) not in ("Cc", "Cf"))
+
+
+def normalise_title(text: str) -> str:
+    """Fold a title for matching: NFKC, case-folded, control and format
+    characters dropped, punctuation turned into single spaces."""
+    text = _strip_control(unicodedata.normalize("NFKC", text).casefold())
+    return _NON_WORD.sub(" ", text).strip()
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode"] = {}
+        self.ids: set[int] = set()
+
+
+class SectionIndex:
+    """Title index over one extraction's section list.
+
+    Every suffix of every title token goes into a character trie, so walking
+    a query token finds each title with a token *containing* it.  Substring
+    matching intersects those sets before comparing strings, and the reverse
+    test (title inside the query) looks the query's substrings up in a
+    title → ids map.  Neither scans the whole list.
+
+    Build one with ``section_index()``, which reuses it for the same list.
+    """
+
+    def __init__(self, sections: list[dict]) -> None:
+        self.sections = sections
+        self.titles = [normalise_title(s.get("title", "")) for s in sections]
+        self._tokens = [t.split() for t in self.titles]
+        self._root = _TrieNode()
+        self._by_title: dict[str, list[int]] = {}
+        for i, (title, tokens) in enumerate(zip(self.titles, self._tokens)):
+            if not title:
+                continue
+            self._by_title.setdefault(title, []).append(i)
+            for token in set(tokens):
+                for start in range(len(token)):
+                    self._insert(token[start:], i)
+        self._title_lengths = sorted({len(t) for t in self._by_title})
+
+    def _insert(self, text: str, idx: int) -> None:
+        node = self._root
+        for ch in text:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.ids.add(idx)
+
+    def _walk(self, text: str) -> set[int]:
+        """Ids of titles with a token containing *text*."""
+        node = self._root
+        for ch in text:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+    # ── exact (substring) matching ─────────────────────────────────────
+
+    def _containing(self, query: str) -> set[int]:
+        """Ids of titles that contain *query* (both normalised)."""
+        tokens = query.split()
+        candidates: Optional[set[int]] = None
+        for token in sorted(tokens, key=lambda t: len(self._walk(t))):
+            ids = self._walk(token)
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+        return {i for i in candidates or () if query in self.titles[i]}
+
+    def _contained(self, query: str) -> set[int]:
+        """Ids of titles that are substrings of *query*."""
+        found: set[int] = set()
+        for length in self._title_lengths:
+            if length > len(query):
+                break
+            for start in range(len(query) - length + 1):
+                found.update(self._by_title.get(query[start:start + length], ()))
+        return found
+
+    def match(self, name: str) -> Optional[dict]:
+        """Best section for *name*.  Accepts A⊂B or B⊂A on the normalised
+        strings; the greatest overlap (length of the shorter string) wins,
+        and ties go to the earliest section."""
+        query = normalise_title(name)
+        if not query:
+            return None
+        ids = self._containing(query) | self._contained(query)
+        if not ids:
+            return None
+        best = min(ids, key=lambda i: (-min(len(query), len(self.titles[i])), i))
+        return self.sections[best]
+
+    # ── fuzzy ranking ──────────────────────────────────────────────────
+
+    def suggestions(self, name: str, limit: int = MAX_SUGGESTIONS) -> list[tuple[dict, float]]:
+        """Sections ranked by similarity to *name*, best first, as
+        ``(section, score)`` with scores in ``[0, 1]``.
+
+        Candidates share a three-letter stretch with one of the query's
+        tokens; each is scored on per-token similarity and on the whole
+        string, so typos and word-order changes still rank well.
+        """
+        query = normalise_title(name)
+        if not query:
+            return []
+        q_tokens = query.split()
+        candidates: set[int] = set()
+        for token in q_tokens:
+            for start in range(max(len(token) - 2, 1)):
+                candidates |= self._walk(token[start:start + 3])
+        scored = []
+        for i in candidates:
+            score = _similarity(query, q_tokens, self.titles[i], self._tokens[i])
+            if score >= MIN_SUGGESTION_SCORE:
+                scored.append((-score, i))
+        scored.sort()
+        return [(self.sections[i], -neg) for neg, i in scored[:limit]]
+
+
+def _similarity(query: str, q_tokens: list[str], title: str, t_tokens: list[str]) -> float:
+    """Blend of mean best-token similarity and whole-string similarity."""
+    if not t_tokens:
+        return 0.0
+    per_token = []
+    for q in q_tokens:
+        best = 0.0
+        for t in t_tokens:
+            if q == t:
+                best = 1.0
+                break
+            if t.startswith(q) or q.startswith(t):
+                ratio = 0.9
+            else:
+                ratio = difflib.SequenceMatcher(None, q, t).ratio()
+            best = max(best, ratio)
+        per_token.append(best)
+    token_score = sum(per_token) / len(per_token)
+    return 0.7 * token_score + 0.3 * difflib.SequenceMatcher(None, query, title).ratio()
+
+
+# Indexes of recently resolved extractions, keyed by ``id()`` of the section
+# list.  The list itself is held alongside, so the id cannot be reused while
+# the entry is cached.
+_INDEX_CACHE: "OrderedDict[int, tuple[list, SectionIndex]]" = OrderedDict()
+_INDEX_CACHE_SIZE = 8
+
+
+def section_index(sections: list[dict]) -> SectionIndex:
+    """The ``SectionIndex`` for *sections*, built once per extraction."""
+    key = id(sections)
+    hit = _INDEX_CACHE.get(key)
+    if hit is not None and hit[0] is sections and len(hit[1].titles) == len(sections):
+        _INDEX_CACHE.move_to_end(key)
+        return hit[1]
+    index = SectionIndex(sections)
+    _INDEX_CACHE[key] = (sections, index)
+    if len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+        _INDEX_CACHE.popitem(last=False)
+    return index
+
+
 # ── internal helpers ───────────────────────────────────────────────────────
 
 
-def _parse_page_override(override: str) -> tuple[int, int]:
-    """Parse ``"42"`` or ``"50-65"`` into ``(start, end)``."""
-    parts = override.strip().split("-")
-    if len(parts) == 1:
-        page = int(parts[0])
-        return page, page
-    return int(parts[0]), int(parts[1])
+def _not_found_message(name: str, index: SectionIndex) -> str:
+    ranked = index.suggestions(name)
+    if not ranked:
+        return f"Section '{name}' not found, and no section title is similar ({len(index.sections)} sections available)."
+    listed = ", ".join(
+        f"'{_strip_control(sec['title']).strip()}' (pp. {sec['start_page']}–{sec['end_page']})" for sec, _ in ranked
+    )
+    return f"Section '{name}' not found.  Closest matches: {listed}"
 
 
-def _find_best_match(name: str, sections_db: list[dict]) -> Optional[dict]:
-    """Case-insensitive substring match.  Accepts A⊂B or B⊂A.
-    If multiple sections match, the one with the greatest character overlap
-    (length of the shorter string) wins."""
-    name_lower = name.lower()
-    best: Optional[dict] = None
-    best_overlap = -1
+def _parse_page_override(override: str) -> PageRanges:
+    """Parse ``"42"``, ``"50-65"`` or a comma-separated mix such as
+    ``"12-15,40,50-52"`` into merged ``(start, end)`` ranges."""
+    ranges: PageRanges = []
+    for part in override.split(","):
+        bounds = [b.strip() for b in part.split("-")]
+        if not 1 <= len(bounds) <= 2 or not all(b.isdigit() for b in bounds):
+            raise ValueError(f"Invalid page override {override!r}: expected e.g. \"12-15,40,50-52\".")
+        start, end = int(bounds[0]), int(bounds[-1])
+        if start < 1 or end < start:
+            raise ValueError(f"Invalid page range {part.strip()!r} in page override {override!r}.")
+        ranges.append((start, end))
+    return _merge_ranges(ranges)
 
-    for sec in sections_db:
-        title_lower = sec["title"].lower()
-        if name_lower in title_lower or title_lower in name_lower:
-            overlap = min(len(name_lower), len(title_lower))
-            if overlap > best_overlap:
-                best = sec
-                best_overlap = overlap
 
-    return best
+def _merge_ranges(ranges: PageRanges) -> PageRanges:
+    """Sort inclusive page ranges and merge overlapping or adjacent ones."""
+    merged: PageRanges = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _format_ranges(ranges: PageRanges) -> str:
+    return ", ".join(f"{start}-{end}" for start, end in ranges)
+
+
+def _find_best_match(name: str, sections_db: list[dict]) -> Optional[dict]:
+    """Best section for *name* — see ``SectionIndex.match``."""
+    return section_index(sections_db).match(name)
 
 
-def _collect_text(page_text: dict[int, str], start: int, end: int) -> str:
+def _collect_text(page_text: Mapping[int, str], start: int, end: int) -> str:
     """Concatenate page texts with page-number markers so downstream agents
     can reference specific pages."""
     parts: list[str] = []
@@ -1,9 +1,10 @@
 """Layer 2 — Podcast generation with PydanticAI agents.
 
 Contains the Generator, Evaluator, and Improver agent definitions (via the
-``EvaluationScores`` model) and the ``run_generation()`` function that
-orchestrates the eval/improve loop.  Agents are resolved at call time from the
-``Registry``; shared LLM helpers live in ``utility.llm_utility``.
+``EvaluationScores`` model) and the ``run_generation_async()`` function that
+orchestrates the eval/improve loop; ``run_generation()`` is its blocking form.
+Agents are resolved at call time from the ``Registry``; shared LLM helpers
+live in ``utility.llm_utility``.
 """
 
 import json
@@ -21,11 +22,12 @@ from src.app_config import (
 from src.register import Registry
 from src.utility.llm_utility import (
     _check_budget,
-    _run_with_retry,
-    format_source_passages,
+    _run_with_retry_async,
     log_llm_call,
+    run_sync,
 )
 from src.utility.prompt_loader import load_prompt
+from src.utility.token_budget import SourceBudgeter
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +81,14 @@ def _format_key_points_checklist(key_points: KeyPointsOutput) -> str:
 def run_generation(
     source_passages: OrderedDict,
     progress_callback: Optional[Callable[[str, float], None]] = None,
+) -> str:
+    """Blocking ``run_generation_async`` for the CLI and the Streamlit UI."""
+    return run_sync(run_generation_async(source_passages, progress_callback))
+
+
+async def run_generation_async(
+    source_passages: OrderedDict,
+    progress_callback: Optional[Callable[[str, float], None]] = None,
 ) -> str:
     """Run Generator → Evaluator → Improver loop and return the final script.
 
@@ -88,22 +98,25 @@ def run_generation(
 
     Returns:
         The final podcast script text.
+
+    Each prompt gets the source text cut to that agent's token budget (see
+    ``utility.token_budget``).
     """
 
     def _progress(msg: str, frac: float) -> None:
         if progress_callback:
             progress_callback(msg, frac)
 
-    source_text = format_source_passages(source_passages)
+    budgeter = SourceBudgeter(source_passages)
 
     # ── 0. Key-points extraction ──────────────────────────────────────
     _check_budget()
     _progress("Extracting key points …", 0.05)
 
     kp_prompt = load_prompt("extract_key_points")
-    kp_prompt = kp_prompt.replace("{{source_text}}", source_text)
+    kp_prompt = kp_prompt.replace("{{source_text}}", budgeter.for_agent("key_points", kp_prompt))
 
-    kp_result = _run_with_retry(Registry.get_agent("key_points"), kp_prompt)
+    kp_result = await _run_with_retry_async(Registry.get_agent("key_points"), kp_prompt)
     key_points: KeyPointsOutput = kp_result.output
     key_points_checklist = _format_key_points_checklist(key_points)
     log_llm_call("key_points", 0, kp_prompt, kp_result)
@@ -114,11 +127,11 @@ def run_generation(
     _progress("Generating initial script …", 0.15)
 
     gen_prompt = load_prompt("generate")
-    gen_prompt = gen_prompt.replace("{{source_text}}", source_text)
+    gen_prompt = gen_prompt.replace("{{source_text}}", budgeter.for_agent("generator", gen_prompt))
     gen_prompt = gen_prompt.replace("{{target_word_count}}", str(TARGET_WORD_COUNT))
     gen_prompt = gen_prompt.replace("{{key_points_checklist}}", key_points_checklist)
 
-    result = _run_with_retry(Registry.get_agent("generator"), gen_prompt)
+    result = await _run_with_retry_async(Registry.get_agent("generator"), gen_prompt)
     script: str = result.output
     log_llm_call("generator", 0, gen_prompt, result)
     logger.info("Generator produced %d words.", len(script.split()))
@@ -132,10 +145,11 @@ def run_generation(
         )
 
         eval_prompt = load_prompt("evaluate")
+        eval_source = budgeter.for_agent("evaluator", eval_prompt, script=script)
         eval_prompt = eval_prompt.replace("{{script}}", script)
-        eval_prompt = eval_prompt.replace("{{source_text}}", source_text)
+        eval_prompt = eval_prompt.replace("{{source_text}}", eval_source)
 
-        eval_result = _run_with_retry(Registry.get_agent("evaluator"), eval_prompt)
+        eval_result = await _run_with_retry_async(Registry.get_agent("evaluator"), eval_prompt)
         scores: EvaluationScores = eval_result.output
         scores_dict = scores.model_dump()
         log_llm_call("evaluator", iteration, eval_prompt, eval_result, scores=scores_dict)
@@ -150,14 +164,17 @@ def run_generation(
         _progress(f"Improving script (iteration {iteration + 1}) …", 0.3 + iteration * 0.08)
 
         imp_prompt = load_prompt("improve")
+        imp_source = budgeter.for_agent("improver", imp_prompt, script=script)
         imp_prompt = imp_prompt.replace("{{script}}", script)
         imp_prompt = imp_prompt.replace("{{scores}}", json.dumps(scores_dict, indent=2))
-        imp_prompt = imp_prompt.replace("{{source_text}}", source_text)
+        imp_prompt = imp_prompt.replace("{{source_text}}", imp_source)
         imp_prompt = imp_prompt.replace("{{key_points_checklist}}", key_points_checklist)
 
-        imp_result = _run_with_retry(Registry.get_agent("improver"), imp_prompt)
+        imp_result = await _run_with_retry_async(Registry.get_agent("improver"), imp_prompt)
         script = imp_result.output
         log_llm_call("improver", iteration, imp_prompt, imp_result)
         logger.info("Improver produced %d words.", len(script.split()))
 
+    if budgeter.saved_tokens:
+        logger.info("Source budgeting saved ~%d prompt tokens during generation.", budgeter.saved_tokens)
     return script
@@ -0,0 +1,155 @@
+"""Indexed, memory-mapped page store for extraction results.
+
+A ``.pages`` file holds the same content as ``extracted_text.json``, but page
+text is laid out as raw UTF-8 blobs behind an offset index, so a reader can
+map the file and decode only the pages it actually needs.
+
+Layout
+------
+    magic      4 bytes   ``b"APPS"``
+    version    uint16    store layout version (little-endian)
+    hdr_len    uint32    length of the JSON header in bytes
+    header     JSON      ``{"metadata", "sections", "index": [[page_number, offset, length], …]}``
+    blobs      bytes     concatenated UTF-8 page texts; offsets are relative
+                         to the first blob byte
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Iterator
+
+PAGE_STORE_MAGIC = b"APPS"
+PAGE_STORE_SUFFIX = ".pages"
+_LAYOUT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHI")
+
+
+class PageStoreError(Exception):
+    """Raised when a file is not a readable page store."""
+
+
+def write_page_store(result: dict, path: Path) -> Path:
+    """Write an extraction result as a page store.
+
+    The file is written next to *path* and renamed into place, so readers
+    that still have the previous store mapped keep a valid view of it.
+    """
+    index: list[list[int]] = []
+    blobs: list[bytes] = []
+    offset = 0
+    for page in result["pages"]:
+        blob = (page.get("text") or "").encode("utf-8")
+        index.append([page["page_number"], offset, len(blob)])
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps(
+        {"metadata": result["metadata"], "sections": result["sections"], "index": index},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_PREAMBLE.pack(PAGE_STORE_MAGIC, _LAYOUT_VERSION, len(header)))
+        fh.write(header)
+        for blob in blobs:
+            fh.write(blob)
+    os.replace(tmp, path)
+    return path
+
+
+def is_page_store(path: Path) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(len(PAGE_STORE_MAGIC)) == PAGE_STORE_MAGIC
+
+
+class PageStore(Mapping):
+    """Read-only ``page_number → text`` mapping over a memory-mapped store.
+
+    Only the header is parsed up front; each lookup slices and decodes one
+    page blob.  ``pages_read`` counts decoded pages.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._fh = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            self._fh.close()
+            raise PageStoreError(f"{self.path} is not a page store") from exc
+
+        try:
+            header, self._blob_start = self._read_header()
+            self.metadata: dict = header["metadata"]
+            self.sections: list[dict] = header["sections"]
+            self._index: dict[int, tuple[int, int]] = {pn: (off, length) for pn, off, length in header["index"]}
+        except Exception as exc:
+            self.close()
+            if isinstance(exc, PageStoreError):
+                raise
+            raise PageStoreError(f"{self.path} has a corrupt header: {exc}") from exc
+        self.pages_read = 0
+
+    def _read_header(self) -> tuple[dict, int]:
+        """Validate the preamble and blob extent; return the parsed header
+        and the offset of the first blob byte.
+
+        Raises:
+            PageStoreError: on a truncated file, bad magic or an unsupported
+                layout version.
+        """
+        size = len(self._mm)
+        if size < _PREAMBLE.size:
+            raise PageStoreError(f"{self.path} is truncated")
+        magic, version, hdr_len = _PREAMBLE.unpack_from(self._mm, 0)
+        if magic != PAGE_STORE_MAGIC:
+            raise PageStoreError(f"{self.path} is not a page store")
+        if version != _LAYOUT_VERSION:
+            raise PageStoreError(f"Unsupported page-store layout version {version}")
+        blob_start = _PREAMBLE.size + hdr_len
+        if size < blob_start:
+            raise PageStoreError(f"{self.path} is truncated")
+
+        header = json.loads(self._mm[_PREAMBLE.size : blob_start].decode("utf-8"))
+        blob_end = max((off + length for _, off, length in header["index"]), default=0)
+        if size < blob_start + blob_end:
+            raise PageStoreError(f"{self.path} is truncated")
+        return header, blob_start
+
+    # ── Mapping interface ──────────────────────────────────────────────
+
+    def __getitem__(self, page_number: int) -> str:
+        offset, length = self._index[page_number]
+        start = self._blob_start + offset
+        self.pages_read += 1
+        return self._mm[start : start + length].decode("utf-8")
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # ── helpers ────────────────────────────────────────────────────────
+
+    def page_dicts(self) -> list[dict]:
+        """Materialise every page as ``{"page_number", "text"}`` (JSON shape)."""
+        return [{"page_number": pn, "text": self[pn]} for pn in self._index]
+
+    def close(self) -> None:
+        self._mm.close()
+        self._fh.close()
+
+    def __enter__(self) -> "PageStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,8 +1,11 @@
 """Pipeline orchestrator — the single entry-point shared by the UI and CLI.
 
 Wires together filter → generate → verify and writes all output artefacts.
+``run_pipeline_async`` is the implementation, for callers that already run an
+event loop; ``run_pipeline`` drives it to completion for the CLI and the UI.
 """
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -12,6 +15,8 @@ from src import filter as section_filter
 from src import generate
 from src import verify
 from src.app_config import OUTPUT_DIR
+from src.utility import token_budget
+from src.utility.llm_utility import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +32,15 @@ def run_pipeline(
     extracted_data: dict,
     selected_sections: list[dict],
     progress_callback: Optional[Callable[[str, float], None]] = None,
+) -> PipelineResult:
+    """Blocking ``run_pipeline_async``; same arguments and result."""
+    return run_sync(run_pipeline_async(extracted_data, selected_sections, progress_callback))
+
+
+async def run_pipeline_async(
+    extracted_data: dict,
+    selected_sections: list[dict],
+    progress_callback: Optional[Callable[[str, float], None]] = None,
 ) -> PipelineResult:
     """Run the full generation + verification pipeline.
 
@@ -41,6 +55,10 @@ def run_pipeline(
     Returns:
         ``PipelineResult`` with the final script, verification report, and
         word count.
+
+    Raises:
+        token_budget.TokenBudgetError: if the selection cannot fit the agent
+            prompts even trimmed; raised before the first LLM call.
     """
 
     def _progress(msg: str, frac: float) -> None:
@@ -49,15 +67,19 @@ def run_pipeline(
 
     # 1. Resolve sections ───────────────────────────────────────────────
     _progress("Resolving sections …", 0.0)
-    source_passages = section_filter.resolve(extracted_data, selected_sections)
+    # Resolution may extract PDF pages (``extract.LazyPages``), so it runs
+    # off the event loop, as does the preflight that renders the passages.
+    source_passages = await asyncio.to_thread(section_filter.resolve, extracted_data, selected_sections)
+    # Refuse a selection that cannot fit the prompts before any LLM call.
+    await asyncio.to_thread(token_budget.preflight, source_passages)
 
     # 2. Run generation + eval/improve loop ─────────────────────────────
     _progress("Generating podcast script …", 0.15)
-    script = generate.run_generation(source_passages, progress_callback=_progress)
+    script = await generate.run_generation_async(source_passages, progress_callback=_progress)
 
     # 3. Run verification ───────────────────────────────────────────────
     _progress("Verifying claims and coverage …", 0.75)
-    verification = verify.run_verification(script, source_passages, selected_sections)
+    verification = await verify.run_verification_async(script, source_passages, selected_sections)
 
     # 4. Write output files ─────────────────────────────────────────────
     _progress("Writing output files …", 0.9)
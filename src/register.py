@@ -7,21 +7,34 @@ Nothing else in the codebase needs to change.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Type
+from typing import Any, BinaryIO, Dict, Iterator, Type, Union
 
 
 class BaseExtractor(ABC):
     """Interface every file-type extractor must implement."""
 
     @abstractmethod
-    def extract(self, file_path: str) -> dict:
+    def extract(self, source: Union[str, bytes, BinaryIO]) -> dict:
         """Return the canonical extracted-text dict.
 
-        The returned dict must conform to the schema defined in §7.4 of the
-        design document (metadata, sections, pages).
+        *source* is a file path, or the file's bytes / a binary buffer (an
+        upload held in memory).  The returned dict must conform to the
+        schema defined in §7.4 of the design document (metadata, sections,
+        pages).
         """
         ...
 
+    def stream(self, source: Union[str, bytes, BinaryIO]) -> Iterator[dict]:
+        """Yield the header ``{"metadata", "sections"}``, then one page dict
+        per page.
+
+        The default materialises ``extract()``; extractors that can emit pages
+        incrementally override it.
+        """
+        result = self.extract(source)
+        yield {"metadata": result["metadata"], "sections": result["sections"]}
+        yield from result["pages"]
+
 
 class Registry:
     """Singleton IoC container.  Extractors and agents are registered once
@@ -5,19 +5,25 @@ These helpers are consumed by both ``generate.py`` and ``verify.py``.  Keeping
 them here avoids a circular dependency between those two modules.
 """
 
+import asyncio
 import json
 import logging
-import time
+import threading
+import weakref
 from collections import OrderedDict
+from collections.abc import Coroutine
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional, TypeVar
 
 from pydantic_ai import Agent
 
 from src.app_config import LLM_LOG_FILE, MAX_LLM_CALLS, MODEL_NAME, OUTPUT_DIR
+from src.filter import format_passages
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 # ── exceptions ─────────────────────────────────────────────────────────────
 
@@ -74,23 +80,17 @@ def _check_budget() -> None:
 
 def format_source_passages(source_passages: OrderedDict) -> str:
     """Turn the ordered-dict from ``filter.resolve()`` into a single readable
-    string with section and page markers."""
-    parts: list[str] = []
-    for section_name, data in source_passages.items():
-        parts.append(
-            f"\n=== Section: {section_name} "
-            f"(Pages {data['start_page']}-{data['end_page']}) ===\n"
-        )
-        parts.append(data["text"])
-    return "\n".join(parts)
+    string with section and page markers.  A ``filter.SourcePassages`` is
+    rendered once and the same string is returned on every later call."""
+    return format_passages(source_passages)
 
 
-def _run_with_retry(agent: Agent, prompt: str, max_retries: int = 3):
+async def _run_with_retry_async(agent: Agent, prompt: str, max_retries: int = 3):
     """Run a PydanticAI agent with exponential back-off on failure."""
     last_exc: Optional[Exception] = None
     for attempt in range(max_retries):
         try:
-            return agent.run_sync(prompt)
+            return await agent.run(prompt)
         except Exception as exc:
             last_exc = exc
             if attempt == max_retries - 1:
@@ -100,5 +100,53 @@ def _run_with_retry(agent: Agent, prompt: str, max_retries: int = 3):
                 "LLM call failed (attempt %d/%d): %s. Retrying in %ds…",
                 attempt + 1, max_retries, exc, wait,
             )
-            time.sleep(wait)
+            await asyncio.sleep(wait)
     raise LLMCallError(f"LLM call failed after {max_retries} retries") from last_exc
+
+
+def _run_with_retry(agent: Agent, prompt: str, max_retries: int = 3):
+    """Blocking ``_run_with_retry_async``."""
+    return run_sync(_run_with_retry_async(agent, prompt, max_retries))
+
+
+# ── sync bridge ────────────────────────────────────────────────────────────
+
+_thread_state = threading.local()
+
+
+class _ThreadLoop:
+    """A thread's event loop, closed once the thread exits and its
+    ``threading.local`` slot (the only reference) is released."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+
+def run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run *coro* to completion for a synchronous caller.
+
+    Uses one event loop per thread, kept open between calls, rather than
+    ``asyncio.run()``: the HTTP client PydanticAI caches for a model is bound
+    to the loop it was first used on, so a fresh loop per call would break
+    the second call.  The loop is closed when its thread exits.
+
+    Raises:
+        RuntimeError: when called from a running event loop — await the
+            ``*_async`` function there instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("Called a blocking pipeline function inside an event loop; await its *_async version.")
+
+    state = getattr(_thread_state, "loop", None)
+    if state is None or state.loop.is_closed():
+        state = _thread_state.loop = _ThreadLoop()
+    loop = state.loop
+    # Also the thread's current loop, so PydanticAI's own ``run_sync`` shares it.
+    asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
@@ -0,0 +1,33 @@
+"""Process memory readings for the low-memory extraction mode.
+
+Both helpers return megabytes, or ``None`` where the platform offers no
+cheap way to read the figure (``resource`` does not exist on Windows).
+"""
+
+import os
+import sys
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover — Windows
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size; falls back to the peak off Linux."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
@@ -0,0 +1,317 @@
+"""Token budgeting for the source text placed in agent prompts.
+
+Token counts are estimated offline — no tokenizer or network access — from
+word, number and punctuation pieces, which tracks GPT-style BPE counts
+closely enough to size prompts.  Each agent's source budget is its
+configured ``SOURCE_TOKEN_BUDGET`` capped by what fits in
+``MODEL_CONTEXT_TOKENS`` beside the prompt template, the script and the
+response.  Over-budget source text is split across sections by fair share
+and trimmed deterministically: each section keeps its opening lines, then
+its most number-dense lines, in their original order.
+"""
+
+import logging
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+from src.app_config import MODEL_CONTEXT_TOKENS, SOURCE_TOKEN_BUDGETS, TARGET_WORD_COUNT
+from src.filter import SectionBlock, SourcePassages, join_blocks, passage_blocks
+from src.utility.prompt_loader import load_prompt
+
+logger = logging.getLogger(__name__)
+
+# Tokens held back for the model's reply.
+RESPONSE_RESERVE_TOKENS = 4096
+# Room for a script not written yet: ~1.3 tokens a word, plus overshoot.
+SCRIPT_RESERVE_TOKENS = 2 * TARGET_WORD_COUNT
+# Room for the key-points checklist in generator / improver prompts.
+CHECKLIST_RESERVE_TOKENS = 1500
+# Smallest useful share of the budget for one section.
+MIN_SECTION_TOKENS = 200
+# Share of a trimmed section's allowance spent on its opening lines.
+LEAD_SHARE = 0.3
+
+# Prompt template of every agent that is given source text.
+AGENT_PROMPTS = {
+    "key_points": "extract_key_points",
+    "generator": "generate",
+    "evaluator": "evaluate",
+    "improver": "improve",
+    "claims": "verify_claims",
+    "coverage": "verify_coverage",
+}
+
+GAP_MARKER = "[…]"
+
+_PIECE = re.compile(r"[^\W\d_]+|\d+|\S")
+_PAGE_MARKER = re.compile(r"^--- Page \d+ ---$")
+
+
+# ── exceptions ─────────────────────────────────────────────────────────────
+
+
+class TokenBudgetError(Exception):
+    """Raised when the selected source text cannot fit an agent's prompt."""
+
+
+# ── estimation and allocation ──────────────────────────────────────────────
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one per punctuation mark, one per seven
+    letters of a word (rounded up), one per three digits of a number."""
+    total = 0
+    for match in _PIECE.finditer(text):
+        piece = match.group()
+        if piece[0].isdigit():
+            total += (len(piece) + 2) // 3
+        elif piece[0].isalpha():
+            total += 1 + (len(piece) - 1) // 7
+        else:
+            total += 1
+    return total
+
+
+def fair_shares(demands: Mapping[str, int], budget: int) -> dict[str, int]:
+    """Split *budget* across *demands* max-min fairly: no one gets more than
+    it asks for, and what small demands leave over goes to the larger ones."""
+    shares: dict[str, int] = {}
+    remaining = max(budget, 0)
+    ordered = sorted(demands.items(), key=lambda item: item[1])
+    for i, (name, demand) in enumerate(ordered):
+        shares[name] = min(demand, remaining // (len(ordered) - i))
+        remaining -= shares[name]
+    return {name: shares[name] for name in demands}
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut *text* to at most *max_tokens* estimated tokens.
+
+    Keeps the opening lines (``LEAD_SHARE`` of the allowance), then the
+    lines with the highest share of digits, earliest first on ties.  A
+    page's ``--- Page N ---`` marker is kept with any of its lines, and
+    every run of dropped lines becomes one ``[…]``.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    lines = text.split("\n")
+    cost = [estimate_tokens(line) for line in lines]
+    gap = estimate_tokens(GAP_MARKER)
+    marker_of: list[Optional[int]] = []  # index of the page marker above each line
+    content: list[int] = []
+    marker: Optional[int] = None
+    for i, line in enumerate(lines):
+        if _PAGE_MARKER.match(line):
+            marker = i
+        elif line.strip():
+            content.append(i)
+        marker_of.append(marker)
+
+    kept: set[int] = set()
+    used = gap  # a trailing gap marker
+
+    def take(i: int) -> bool:
+        nonlocal used
+        extra = cost[i] + gap
+        m = marker_of[i]
+        if m is not None and m not in kept:
+            extra += cost[m] + gap
+        if used + extra > max_tokens:
+            return False
+        kept.add(i)
+        if m is not None:
+            kept.add(m)
+        used += extra
+        return True
+
+    lead_limit = int(max_tokens * LEAD_SHARE)
+    lead = 0
+    for i in content:
+        if used >= lead_limit or not take(i):
+            break
+        lead += 1
+
+    rest = content[lead:]
+    for i in sorted(rest, key=lambda i: (-_digit_share(lines[i]), i)):
+        take(i)
+
+    out: list[str] = []
+    for i, line in enumerate(lines):
+        if i in kept:
+            out.append(line)
+        elif (line.strip() and not _PAGE_MARKER.match(line)) and (not out or out[-1] != GAP_MARKER):
+            out.append(GAP_MARKER)
+    return "\n".join(out)
+
+
+def _digit_share(line: str) -> float:
+    chars = [ch for ch in line if not ch.isspace()]
+    return sum(ch.isdigit() for ch in chars) / len(chars) if chars else 0.0
+
+
+# ── budgeted source text ───────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class BudgetedSource:
+    """Source text cut to one token budget."""
+
+    text: str
+    tokens: int
+    original_tokens: int
+    budget: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+class _SourceText:
+    """Rendered source text and its token estimates, measured once.
+
+    A ``SourcePassages`` contributes its cached ``render()`` output; the
+    per-section demands are only estimated the first time a budget is too
+    small for the whole text.
+    """
+
+    def __init__(self, source_passages: Mapping) -> None:
+        self.blocks = passage_blocks(source_passages)
+        if isinstance(source_passages, SourcePassages):
+            self.text = source_passages.render()
+        else:
+            self.text = join_blocks(self.blocks)
+        self.tokens = estimate_tokens(self.text)
+        self._header_tokens = 0
+        self._demands: Optional[dict[str, int]] = None
+
+    def budget(self, max_tokens: int) -> BudgetedSource:
+        if self.tokens <= max_tokens:
+            return BudgetedSource(self.text, self.tokens, self.tokens, max_tokens)
+
+        if self._demands is None:
+            self._header_tokens = sum(estimate_tokens(b.header) for b in self.blocks)
+            self._demands = {b.name: estimate_tokens(b.body) for b in self.blocks}
+        demands = self._demands
+        shares = fair_shares(demands, max_tokens - self._header_tokens)
+        trimmed = [
+            b if demands[b.name] <= shares[b.name] else SectionBlock(b.name, b.header, trim_to_tokens(b.body, shares[b.name]))
+            for b in self.blocks
+        ]
+        text = join_blocks(trimmed)
+        return BudgetedSource(text, estimate_tokens(text), self.tokens, max_tokens)
+
+
+def budget_source(source_passages: Mapping, max_tokens: int) -> BudgetedSource:
+    """Rendered source text within *max_tokens*: section headers are kept,
+    each body gets a fair share of the rest and is trimmed to it."""
+    return _SourceText(source_passages).budget(max_tokens)
+
+
+def source_budget(agent: str, template: str, script: Optional[str] = None) -> int:
+    """Source tokens *agent* may use with *template*.
+
+    Prompts that embed the script count *script* if given, else
+    ``SCRIPT_RESERVE_TOKENS``.
+    """
+    overhead = estimate_tokens(template) + RESPONSE_RESERVE_TOKENS
+    if "{{script}}" in template:
+        overhead += estimate_tokens(script) if script is not None else SCRIPT_RESERVE_TOKENS
+    if "{{key_points_checklist}}" in template:
+        overhead += CHECKLIST_RESERVE_TOKENS
+    available = MODEL_CONTEXT_TOKENS - overhead
+    configured = SOURCE_TOKEN_BUDGETS.get(agent, 0)
+    return min(configured, available) if configured > 0 else available
+
+
+class SourceBudgeter:
+    """Budgeted source text for each agent call of one run.
+
+    The source is rendered and measured once, and the trimmed text is
+    computed once per distinct budget.  Savings are counted per call, as
+    every call resends its trimmed text: ``saved_by_agent`` totals the
+    source tokens left out of each agent's prompts, ``saved_tokens`` sums
+    them.
+    """
+
+    def __init__(self, source_passages: Mapping) -> None:
+        self.source_passages = source_passages
+        self.saved_by_agent: dict[str, int] = {}
+        self._source: Optional[_SourceText] = None
+        self._by_budget: dict[int, BudgetedSource] = {}
+
+    @property
+    def saved_tokens(self) -> int:
+        return sum(self.saved_by_agent.values())
+
+    def for_agent(self, agent: str, template: str, script: Optional[str] = None) -> str:
+        budget = source_budget(agent, template, script)
+        budgeted = self._by_budget.get(budget)
+        if budgeted is None:
+            if self._source is None:
+                self._source = _SourceText(self.source_passages)
+            budgeted = self._by_budget[budget] = self._source.budget(budget)
+            if budgeted.saved_tokens:
+                logger.info(
+                    "Source text for %s trimmed to its %d-token budget: %d → %d tokens.",
+                    agent, budget, budgeted.original_tokens, budgeted.tokens,
+                )
+        self._record(agent, budgeted.saved_tokens)
+        return budgeted.text
+
+    def for_section(self, agent: str, template: str, text: str, script: Optional[str] = None) -> str:
+        """One section's text cut to *agent*'s budget (see ``trim_section_text``)."""
+        trimmed, saved = trim_section_text(agent, template, text, script)
+        self._record(agent, saved)
+        return trimmed
+
+    def _record(self, agent: str, saved: int) -> None:
+        self.saved_by_agent[agent] = self.saved_by_agent.get(agent, 0) + saved
+
+
+def trim_section_text(agent: str, template: str, text: str, script: Optional[str] = None) -> tuple[str, int]:
+    """One section's text cut to *agent*'s budget, and the tokens saved."""
+    budget = source_budget(agent, template, script)
+    trimmed = trim_to_tokens(text, budget)
+    return trimmed, estimate_tokens(text) - estimate_tokens(trimmed)
+
+
+# ── preflight ──────────────────────────────────────────────────────────────
+
+
+def preflight(source_passages: Mapping) -> dict[str, int]:
+    """Check that the selection fits every agent's prompt once trimmed.
+
+    Each section needs ``MIN_SECTION_TOKENS`` plus its header in the
+    combined-source prompts, and on its own in the coverage prompt.
+
+    Returns:
+        Agent name → source-token budget.
+
+    Raises:
+        TokenBudgetError: naming each agent whose budget is too small.
+    """
+    blocks = passage_blocks(source_passages)
+    needed = sum(estimate_tokens(b.header) for b in blocks) + MIN_SECTION_TOKENS * len(blocks)
+    source_tokens = estimate_tokens(join_blocks(blocks))
+
+    budgets: dict[str, int] = {}
+    problems: list[str] = []
+    for agent, prompt in AGENT_PROMPTS.items():
+        budgets[agent] = budget = source_budget(agent, load_prompt(prompt))
+        need = MIN_SECTION_TOKENS if agent == "coverage" else min(needed, source_tokens)
+        if budget < need:
+            problems.append(f"{agent} (needs {need} source tokens, budget {budget})")
+
+    if problems:
+        raise TokenBudgetError(
+            f"Selected sections do not fit the prompt of {', '.join(problems)}.  "
+            f"Select fewer sections, or raise MODEL_CONTEXT_TOKENS / SOURCE_TOKEN_BUDGET."
+        )
+    logger.info(
+        "Token preflight — source ~%d tokens; budgets: %s",
+        source_tokens, ", ".join(f"{agent} {budget}" for agent, budget in budgets.items()),
+    )
+    return budgets
@@ -15,11 +15,12 @@ from pydantic import BaseModel
 from src.register import Registry
 from src.utility.llm_utility import (
     _check_budget,
-    _run_with_retry,
-    format_source_passages,
+    _run_with_retry_async,
     log_llm_call,
+    run_sync,
 )
 from src.utility.prompt_loader import load_prompt
+from src.utility.token_budget import SourceBudgeter
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,15 @@ def run_verification(
     script: str,
     source_passages: OrderedDict,
     selected_sections: list[dict],
+) -> dict:
+    """Blocking ``run_verification_async`` for the CLI and the Streamlit UI."""
+    return run_sync(run_verification_async(script, source_passages, selected_sections))
+
+
+async def run_verification_async(
+    script: str,
+    source_passages: OrderedDict,
+    selected_sections: list[dict],
 ) -> dict:
     """Run claims + coverage verification and return the full report dict.
 
@@ -65,18 +75,22 @@ def run_verification(
 
     Returns:
         A dict conforming to the ``verification_report.json`` schema.
+
+    Source and section text are cut to each agent's token budget (see
+    ``utility.token_budget``).
     """
-    source_text = format_source_passages(source_passages)
+    budgeter = SourceBudgeter(source_passages)
 
     # ── Claims ─────────────────────────────────────────────────────────
     _check_budget()
     logger.info("Running claims verification …")
 
     claims_prompt = load_prompt("verify_claims")
+    claims_source = budgeter.for_agent("claims", claims_prompt, script=script)
     claims_prompt = claims_prompt.replace("{{script}}", script)
-    claims_prompt = claims_prompt.replace("{{source_text}}", source_text)
+    claims_prompt = claims_prompt.replace("{{source_text}}", claims_source)
 
-    claims_result = _run_with_retry(Registry.get_agent("claims"), claims_prompt)
+    claims_result = await _run_with_retry_async(Registry.get_agent("claims"), claims_prompt)
     log_llm_call("claims_agent", 0, claims_prompt, claims_result)
 
     claims: list[dict] = [c.model_dump() for c in claims_result.output.claims]
@@ -90,16 +104,19 @@ def run_verification(
         _check_budget()
 
         cov_prompt = load_prompt("verify_coverage")
+        section_text = budgeter.for_section("coverage", cov_prompt, section_data["text"], script=script)
         cov_prompt = cov_prompt.replace("{{section_name}}", section_name)
-        cov_prompt = cov_prompt.replace("{{section_text}}", section_data["text"])
+        cov_prompt = cov_prompt.replace("{{section_text}}", section_text)
         cov_prompt = cov_prompt.replace("{{script}}", script)
 
-        cov_result = _run_with_retry(Registry.get_agent("coverage"), cov_prompt)
+        cov_result = await _run_with_retry_async(Registry.get_agent("coverage"), cov_prompt)
         log_llm_call("coverage_agent", idx, cov_prompt, cov_result)
 
         coverage.append(cov_result.output.model_dump())
 
     logger.info("Coverage verification returned %d sections.", len(coverage))
+    if budgeter.saved_tokens:
+        logger.info("Source budgeting saved ~%d prompt tokens during verification.", budgeter.saved_tokens)
 
     # ── Summary ────────────────────────────────────────────────────────
     summary = _compute_summary(claims, coverage)
@@ -3,6 +3,30 @@
 import pytest
 
 
+def build_synthetic_pdf(path, pages: int = 12, outline: bool = True, nav_link: bool = True):
+    """Small ``benchmarks.bench_extraction.build_pdf`` report: nav bar,
+    top-of-page hyperlinks, arrow links, and large-font headings on every
+    third page.  With ``nav_link=False`` the nav bar carries no hyperlink,
+    so only the nav-bar statistics can remove it."""
+    from benchmarks.bench_extraction import build_pdf
+
+    return build_pdf(
+        path,
+        pages,
+        "outline" if outline else "no_outline",
+        chapter_every=3,
+        subsection_every=0,
+        filler_lines=0,
+        nav_link=nav_link,
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_pdf(tmp_path_factory):
+    """Path to a 12-page synthetic PDF with a PDF outline."""
+    return build_synthetic_pdf(tmp_path_factory.mktemp("pdf") / "synthetic.pdf")
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _register_extractors():
     """Register file-type extractors once before the test session starts."""
@@ -0,0 +1,44 @@
+"""Tests for batch_extract.py — directory / glob resolution and the process pool."""
+
+from src.batch_extract import _output_paths, collect_pdfs, run_batch_extraction
+from src.extraction_io import load_extraction
+from tests.conftest import build_synthetic_pdf
+
+
+class TestCollectPdfs:
+    def test_directory_and_glob(self, tmp_path):
+        for name in ("b.pdf", "a.pdf", "notes.txt"):
+            (tmp_path / name).write_bytes(b"%PDF")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "c.pdf").write_bytes(b"%PDF")
+
+        assert [p.name for p in collect_pdfs(str(tmp_path))] == ["a.pdf", "b.pdf"]
+        assert [p.name for p in collect_pdfs(str(tmp_path), recursive=True)] == ["a.pdf", "b.pdf", "c.pdf"]
+        assert [p.name for p in collect_pdfs(str(tmp_path / "a*.pdf"))] == ["a.pdf"]
+        assert collect_pdfs(str(tmp_path / "missing.pdf")) == []
+
+    def test_repeated_stems_get_distinct_outputs(self, tmp_path):
+        pdfs = [tmp_path / "x" / "report.pdf", tmp_path / "y" / "report.pdf"]
+        assert [p.name for p in _output_paths(pdfs, tmp_path, ".json")] == ["report.json", "report-2.json"]
+
+
+class TestRunBatchExtraction:
+    def test_bad_pdf_does_not_abort_batch(self, tmp_path):
+        good_a = build_synthetic_pdf(tmp_path / "a.pdf", pages=6)
+        bad = tmp_path / "broken.pdf"
+        bad.write_bytes(b"this is not a pdf")
+        good_b = build_synthetic_pdf(tmp_path / "b.pdf", pages=4, outline=False)
+
+        results = run_batch_extraction([good_a, bad, good_b], output_dir=tmp_path / "out", workers=2, use_cache=False)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert "broken.pdf" in results[1].pdf and results[1].error
+        assert [r.pages for r in results] == [6, 0, 4]
+        assert results[0].strategy == "toc"
+        assert load_extraction(results[2].output)["metadata"]["total_pages"] == 4
+
+    def test_serial_mode(self, tmp_path):
+        pdf = build_synthetic_pdf(tmp_path / "a.pdf", pages=3)
+        (result,) = run_batch_extraction([pdf], output_dir=tmp_path, workers=0, use_cache=False, suffix=".bin")
+        assert result.ok
+        assert result.output.endswith("a.bin")
@@ -17,6 +17,10 @@ from src.extract import (
     _remove_nav_bars,
     _remove_arrow_links,
     _encoding_cleanup,
+    _split_page_range,
+    LayoutCache,
+    _get_top_hyperlink_texts,
+    _fitz_text_ok,
 )
 
 
@@ -212,6 +216,62 @@ class TestFontHeuristic:
         assert "12" not in titles
         assert "OK" not in titles
 
+    @staticmethod
+    def _reference_sections(pages_data, max_appearances):
+        """The original span-by-span loop, kept as the reference."""
+        from collections import Counter
+
+        candidates = []
+        for page_number, spans in enumerate(pages_data, start=1):
+            prev_level = None
+            for span in spans:
+                text = span["text"].strip()
+                if not text or sum(ch.isalpha() for ch in text) < 3:
+                    continue
+                size, is_bold = span["size"], "bold" in span["font"].lower()
+                level = 1 if size >= 26 else 2 if size >= 18 or (is_bold and size >= 14) else None
+                if level is None:
+                    prev_level = None
+                elif prev_level == level:
+                    candidates[-1]["title"] += " " + text
+                else:
+                    candidates.append({"title": text, "start_page": page_number, "level": level})
+                    prev_level = level
+        counts = Counter(c["title"] for c in candidates)
+        seen, out = set(), []
+        for c in candidates:
+            if counts[c["title"]] <= max_appearances and c["title"] not in seen:
+                seen.add(c["title"])
+                out.append(c)
+        return out
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_span_loop(self, seed):
+        """The vectorised Tier 3 gives the same sections as the span loop on
+        random pages — mixed sizes, bold fonts, short / numeric / non-Latin
+        text and titles repeated across pages."""
+        import random
+
+        rng = random.Random(seed)
+        words = ["Home", "Risk", "Outlook", "12", "OK", "", "  ", "Été", "½ year", "\U0001d400\U0001d401\U0001d402", "→ More"]
+        pages_data = [
+            [
+                self._make_span(
+                    " ".join(rng.sample(words, rng.randint(1, 2))),
+                    rng.choice([10, 12, 15, 18, 20, 26, 30]),
+                    font=rng.choice(["Arial", "Arial-Bold", "Helvetica-BoldOblique"]),
+                )
+                for _ in range(rng.randint(0, 8))
+            ]
+            for _ in range(rng.randint(1, 12))
+        ]
+        total = len(pages_data)
+
+        with patch("src.extract.MAX_PAGE_APPEARANCES", 0):
+            sections = _font_heuristic_sections(self._make_fitz_doc(pages_data), total_pages=total)
+
+        assert sections == self._reference_sections(pages_data, total // 2)
+
 
 # ── End-page computation ──────────────────────────────────────────────────
 
@@ -240,6 +300,227 @@ class TestEndPageComputation:
         result = compute_end_pages(sections, total_pages=50)
         assert result[0]["end_page"] == 50
 
+    def test_hierarchy_fields(self):
+        sections = [
+            {"title": "A", "start_page": 1, "level": 1},
+            {"title": "A1", "start_page": 3, "level": 2},
+            {"title": "A1a", "start_page": 4, "level": 3},
+            {"title": "A2", "start_page": 5, "level": 2},
+            {"title": "B", "start_page": 8, "level": 1},
+        ]
+        result = compute_end_pages(sections, total_pages=20)
+        assert [s["id"] for s in result] == [0, 1, 2, 3, 4]
+        assert [s["parent_id"] for s in result] == [None, 0, 1, 0, None]
+        assert [s["child_ids"] for s in result] == [[1, 3], [2], [], [], []]
+        assert [s["depth"] for s in result] == [0, 1, 2, 1, 0]
+
+    @staticmethod
+    def _reference_end_pages(sections, total_pages):
+        """The original nested scan."""
+        ends = []
+        for i, sec in enumerate(sections):
+            end = total_pages
+            for later in sections[i + 1 :]:
+                if later["level"] <= sec["level"]:
+                    end = later["start_page"] - 1
+                    break
+            ends.append(end)
+        return ends
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_nested_scan(self, seed):
+        """Property: end pages equal the nested scan and parents are the
+        nearest preceding section at a shallower level, for random inputs
+        (including skipped levels and repeated start pages)."""
+        import random
+
+        rng = random.Random(seed)
+        page = 1
+        sections = []
+        for i in range(rng.randint(0, 60)):
+            page += rng.randint(0, 4)
+            sections.append({"title": f"S{i}", "start_page": page, "level": rng.randint(1, 4)})
+        total = page + rng.randint(0, 10)
+
+        result = compute_end_pages(sections, total)
+
+        assert [s["end_page"] for s in result] == self._reference_end_pages(sections, total)
+        for i, sec in enumerate(result):
+            # Parent: the latest earlier section at a shallower level that no
+            # section in between has closed.
+            expected = next(
+                (
+                    j for j in reversed(range(i))
+                    if result[j]["level"] < sec["level"]
+                    and all(result[k]["level"] > result[j]["level"] for k in range(j + 1, i))
+                ),
+                None,
+            )
+            assert sec["parent_id"] == expected
+            assert sec["depth"] == (0 if expected is None else result[expected]["depth"] + 1)
+            assert sec["child_ids"] == [j for j, s in enumerate(result) if s["parent_id"] == i]
+        assert sections == [{k: v for k, v in s.items() if k in ("title", "start_page", "level")} for s in result]
+
+
+# ── Layout cache ──────────────────────────────────────────────────────────
+
+
+class TestLayoutCache:
+    def _make_doc(self, n_pages):
+        pages = []
+        for i in range(n_pages):
+            page = MagicMock()
+            page.rect.height = 800
+            page.get_links.return_value = [{"from": (10, 10, 200, 40), "type": 0}]
+            page.get_text.return_value = {
+                "blocks": [
+                    {
+                        "type": 0,
+                        "bbox": (10, 10, 200, 40),
+                        "lines": [
+                            {"spans": [{"text": "Home", "bbox": (10, 10, 60, 40), "size": 9, "font": "Arial"}]},
+                            {"spans": [{"text": f"Big Heading {i}", "bbox": (10, 100, 300, 130), "size": 28, "font": "Arial"}]},
+                        ],
+                    }
+                ]
+            }
+            pages.append(page)
+        doc = MagicMock()
+        doc.__len__ = lambda self: n_pages
+        doc.__getitem__ = lambda self, idx: pages[idx]
+        return doc, pages
+
+    @patch("src.extract.MAX_PAGE_APPEARANCES", 0)
+    def test_layout_parsed_once_per_page(self):
+        """Tier 3 and hyperlink cleaning share one get_text("dict") per page."""
+        doc, pages = self._make_doc(3)
+        cache = LayoutCache(doc)
+
+        sections = _font_heuristic_sections(doc, total_pages=3, layout_cache=cache)
+        top_map = _get_top_hyperlink_texts(doc, total_pages=3, layout_cache=cache)
+
+        assert [s["title"] for s in sections] == ["Big Heading 0", "Big Heading 1", "Big Heading 2"]
+        assert top_map == {1: {"Home"}, 2: {"Home"}, 3: {"Home"}}
+        for page in pages:
+            assert page.get_text.call_count == 1
+        assert cache.parses == 3
+        assert cache.hits == 3
+
+    def test_span_table_fields(self):
+        doc, _ = self._make_doc(1)
+        layout = LayoutCache(doc).page(0)
+        assert layout.block_bboxes == [(10, 10, 200, 40)]
+        assert [(sp.text, sp.size, sp.block, sp.line) for sp in layout.spans] == [
+            ("Home", 9, 0, 0),
+            ("Big Heading 0", 28, 0, 1),
+        ]
+
+    def test_max_pages_evicts_oldest(self):
+        doc, pages = self._make_doc(3)
+        cache = LayoutCache(doc, max_pages=2)
+
+        for idx in (0, 1, 2, 2, 0):
+            cache.page(idx)
+
+        assert cache.parses == 4  # page 0 was evicted by page 2, then parsed again
+        assert cache.hits == 1
+        assert pages[0].get_text.call_count == 2
+
+
+# ── Text engines ──────────────────────────────────────────────────────────
+
+
+class TestTextEngines:
+    def _mock_fitz_doc(self, texts):
+        doc = MagicMock()
+        doc.is_encrypted = False
+        doc.get_toc.return_value = [[1, "Intro", 1]]
+        doc.__len__ = lambda self: len(texts)
+        pages = []
+        for text in texts:
+            page = MagicMock()
+            page.get_text.side_effect = lambda kind="text", _t=text: _t if kind == "text" else {"blocks": []}
+            page.get_links.return_value = []
+            pages.append(page)
+        doc.__getitem__ = lambda self, idx: pages[idx]
+        return doc
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError, match="Unknown text engine"):
+            PDFExtractor(text_engine="ocr")
+
+    @patch("src.extract.pdfplumber.open")
+    @patch("src.extract.fitz.open")
+    def test_fitz_engine_never_opens_pdfplumber(self, mock_fitz_open, mock_plumber_open):
+        mock_fitz_open.return_value = self._mock_fitz_doc(["Page one text", "Page two text"])
+
+        result = PDFExtractor(text_engine="fitz").extract("doc.pdf")
+
+        mock_plumber_open.assert_not_called()
+        assert [p["text"] for p in result["pages"]] == ["Page one text", "Page two text"]
+        assert result["metadata"]["text_engine"] == "fitz"
+
+    @patch("src.extract.pdfplumber.open")
+    @patch("src.extract.fitz.open")
+    def test_auto_engine_falls_back_per_page(self, mock_fitz_open, mock_plumber_open):
+        """Only the page whose fitz text fails the quality check is re-read."""
+        mock_fitz_open.return_value = self._mock_fitz_doc(["Good fitz text", "\ufffd\ufffd\ufffd"])
+        plumber_pages = [MagicMock(), MagicMock()]
+        plumber_pages[1].extract_text.return_value = "Recovered by pdfplumber"
+        mock_plumber_open.return_value.pages = plumber_pages
+
+        result = PDFExtractor(text_engine="auto").extract("doc.pdf")
+
+        assert [p["text"] for p in result["pages"]] == ["Good fitz text", "Recovered by pdfplumber"]
+        plumber_pages[0].extract_text.assert_not_called()
+        mock_plumber_open.return_value.close.assert_called_once()
+
+
+class TestSectionsOnly:
+    @patch("src.extract.CONTENTS_SCAN_PAGES", 2)
+    @patch("src.extract.fitz.open")
+    def test_contents_scan_is_bounded(self, mock_fitz_open):
+        """Only the first CONTENTS_SCAN_PAGES pages are read for Tier 2."""
+        texts = ["Cover", "Welcome", "Contents\nStrategy 4", "Body"]
+        doc = TestTextEngines()._mock_fitz_doc(texts)
+        doc.get_toc.return_value = []
+        mock_fitz_open.return_value = doc
+
+        with patch("src.extract._find_contents_page_index", return_value=None) as find:
+            PDFExtractor().extract_sections("doc.pdf")
+
+        heads = find.call_args.args[0]
+        assert [h["text"] for h in heads] == ["Cover", "Welcome"]
+
+
+class TestFitzTextQuality:
+    def test_plain_text_passes(self):
+        assert _fitz_text_ok("Revenue grew 12% year on year.\nMargins improved.")
+
+    def test_empty_page_fails(self):
+        assert not _fitz_text_ok("  \n ")
+
+    def test_replacement_glyphs_fail(self):
+        assert not _fitz_text_ok("Revenue \ufffd\ufffd grew")
+
+    def test_run_together_words_fail(self):
+        assert not _fitz_text_ok("Revenuegrewtwelvepercent" * 20)
+
+
+# ── Parallel extraction: page-range splitting ────────────────────────────
+
+
+class TestSplitPageRange:
+    def test_ranges_are_contiguous_and_cover_all_pages(self):
+        ranges = _split_page_range(10, 3)
+        assert ranges == [(0, 4), (4, 7), (7, 10)]
+
+    def test_chunks_capped_at_page_count(self):
+        assert _split_page_range(2, 8) == [(0, 1), (1, 2)]
+
+    def test_single_chunk(self):
+        assert _split_page_range(5, 1) == [(0, 5)]
+
 
 # ── Cleaning: nav-bar removal ─────────────────────────────────────────────
 
@@ -258,13 +539,18 @@ class TestNavBarRemoval:
         with patch("src.extract.MAX_PAGE_APPEARANCES", 0):
             nav_lines = _build_nav_bar_lines(raw_pages, total_pages=10)
 
-        assert "Home  About  Investors" in nav_lines
+        assert "Home About Investors" in nav_lines
 
         texts = [p["text"] for p in raw_pages]
         cleaned = _remove_nav_bars(texts, nav_lines)
         for t in cleaned:
             assert "Home  About  Investors" not in t
 
+    def test_nav_bar_match_ignores_spacing(self):
+        """Lines counted on fitz text still match pdfplumber's spacing."""
+        texts = ["Home About Investors\nBody", "  Home\tAbout  Investors \nBody"]
+        assert _remove_nav_bars(texts, {"Home  About  Investors"}) == ["Body", "Body"]
+
 
 # ── Cleaning: arrow-link removal ──────────────────────────────────────────
 
@@ -299,6 +585,87 @@ class TestEncodingCleanup:
         assert "Hello" in result[0]
         assert "World" in result[0]
 
+    def test_affected_pages_reported(self, caplog):
+        texts = ["clean page", "bad \udc80\udfff page\n\ud800", "also clean"]
+        pages = [{"page_number": n} for n in (4, 5, 6)]
+        with caplog.at_level("WARNING", logger="src.extract"):
+            result = _encoding_cleanup(texts, pages)
+
+        assert result == ["clean page", "bad  page", "also clean"]
+        assert [r.getMessage() for r in caplog.records] == ["Encoding cleanup: characters dropped on page 5"]
+
+
+# ── Cleaning pipeline ─────────────────────────────────────────────────────
+
+
+class TestCleaningPipeline:
+    def _pipeline(self, extra_rules=()):
+        from src.extract import CleaningPipeline, default_cleaning_rules
+
+        rules = default_cleaning_rules({"Home  About"}, {1: {"Investors", "News"}})
+        return CleaningPipeline([*extra_rules, *rules])
+
+    def test_matches_step_by_step_cleaning(self):
+        """Fusing the four steps gives the same text as running them in turn."""
+        from src.extract import _remove_top_hyperlinks
+
+        text = "Home  About\n→ Next\nInvestors News\nRevenue\ud800 grew\n\n  \nMargins"
+        texts = _remove_nav_bars([text], {"Home  About"})
+        texts = _remove_arrow_links(texts)
+        texts = _remove_top_hyperlinks([{"page_number": 1, "text": texts[0]}], {1: {"Investors", "News"}})
+        texts = _encoding_cleanup(texts, [{"page_number": 1}])
+
+        assert self._pipeline().clean(1, text) == texts[0] == "Revenue grew\nMargins"
+
+    def test_stats_per_rule(self):
+        pipeline = self._pipeline()
+        pipeline.clean(1, "Home  About\n→ Next\nInvestors News\nRevenue\ud800 grew\n\nMargins")
+        pipeline.clean(2, "Investors News\nBody")
+
+        stats = pipeline.stats
+        assert list(stats) == ["nav_bars", "arrow_links", "top_hyperlinks", "encoding"]
+        assert stats["nav_bars"]["lines_dropped"] == 1
+        assert stats["arrow_links"]["lines_dropped"] == 1
+        assert stats["top_hyperlinks"]["lines_dropped"] == 1  # page 2 has no top links
+        assert stats["encoding"]["lines_dropped"] == 1  # the blank line
+        assert stats["encoding"]["chars_dropped"] == 1
+        assert stats["encoding"]["pages_affected"] == 1
+        assert pipeline.pages == 2
+
+    def test_custom_predicate_rule(self):
+        from src.extract import LinePredicateRule
+
+        footer = LinePredicateRule("footers", lambda ln: ln.startswith("Annual Report 2023"))
+        pipeline = self._pipeline(extra_rules=[footer])
+
+        assert pipeline.clean(3, "Annual Report 2023 | 17\nBody") == "Body"
+        assert pipeline.stats["footers"]["lines_dropped"] == 1
+
+
+class TestExtractionStats:
+    def test_stages_accumulate_and_counters_add(self):
+        from src.extract import ExtractionStats
+
+        stats = ExtractionStats()
+        with stats.stage("text"):
+            pass
+        stats.add_time("text", 0.5)
+        stats.count("pages", 3)
+        stats.count("pages", 2)
+
+        out = stats.to_dict()
+        assert out["timings_ms"]["text"] >= 500
+        assert out["counters"] == {"pages": 5}
+
+    def test_stage_timed_even_when_it_raises(self):
+        from src.extract import ExtractionStats
+
+        stats = ExtractionStats()
+        with pytest.raises(RuntimeError):
+            with stats.stage("open"):
+                raise RuntimeError("boom")
+        assert "open" in stats.to_dict()["timings_ms"]
+
 
 # ── Negative / error cases ────────────────────────────────────────────────
 
@@ -384,3 +751,31 @@ class TestHyperlinkRemoval:
         cleaned = _remove_top_hyperlinks(raw, top_map)
         assert "Home" not in cleaned[0]
         assert "Real content here" in cleaned[0]
+
+    def test_index_matches_nested_scan(self):
+        """The snippet index keeps / drops exactly the lines the per-snippet
+        substring scan did."""
+        import random
+
+        from src.extract import _remove_top_hyperlinks
+
+        rng = random.Random(7)
+        words = ["Home", "About", "Investors", "ome", "Ab", "report", "2023", "Us", "News", "x"]
+        for _ in range(50):
+            snippets = {" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(rng.randint(1, 6))}
+            lines = [" ".join(rng.choices(words, k=rng.randint(0, 4))) for _ in range(10)]
+            page = {"page_number": 1, "text": "\n".join(lines)}
+
+            expected = "\n".join(
+                ln for ln in lines
+                if not (ln.split() and all(any(t in sn for sn in snippets) for t in ln.split()))
+            )
+            assert _remove_top_hyperlinks([page], {1: snippets}) == [expected]
+
+    def test_token_does_not_match_across_snippets(self):
+        from src.extract import SnippetIndex
+
+        index = SnippetIndex({"Home", "About"})
+        assert index.covers("ome")
+        assert not index.covers("HomeAbout")
+        assert not index.covers_line("   ")
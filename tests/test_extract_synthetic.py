@@ -0,0 +1,287 @@
+"""Integration tests against small synthetic PDFs generated with fitz.
+
+Unlike ``test_extract.py`` these read real files, but the PDFs are built on
+the fly by the ``synthetic_pdf`` fixture so nothing needs to be checked in.
+"""
+
+import io
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.extract import (
+    CancelToken,
+    ExtractionCancelled,
+    PDFExtractor,
+    resolve_pdf_source,
+    run_streaming_extraction,
+)
+from src.extraction_cache import ExtractionCache
+from src.extraction_io import load_extraction
+from src.filter import resolve
+from tests.conftest import build_synthetic_pdf
+
+
+class TestParallelExtraction:
+    def test_parallel_matches_serial(self, synthetic_pdf):
+        """Pages come back merged in page order, identical to the serial loop."""
+        serial = PDFExtractor(workers=0).extract(str(synthetic_pdf))
+        parallel = PDFExtractor(workers=3).extract(str(synthetic_pdf))
+
+        assert parallel["pages"] == serial["pages"]
+        assert parallel["sections"] == serial["sections"]
+
+    def test_more_workers_than_pages(self, synthetic_pdf):
+        serial = PDFExtractor(workers=0).extract(str(synthetic_pdf))
+        parallel = PDFExtractor(workers=64).extract(str(synthetic_pdf))
+        assert parallel["pages"] == serial["pages"]
+
+
+class TestStreamingExtraction:
+    def test_stream_matches_extract(self, synthetic_pdf):
+        """Header then pages, identical to the materialised extraction."""
+        extractor = PDFExtractor()
+        full = extractor.extract(str(synthetic_pdf))
+        records = list(extractor.stream(str(synthetic_pdf)))
+
+        header, pages = records[0], records[1:]
+        assert header["sections"] == full["sections"]
+        assert header["metadata"]["total_pages"] == full["metadata"]["total_pages"]
+        assert pages == full["pages"]
+
+    def test_stream_survives_lone_surrogate(self, synthetic_pdf):
+        """Unencodable raw text is spooled intact and cleaned like ``extract()``."""
+        original = PDFExtractor._iter_raw_texts
+
+        def planted(self, *args):
+            for i, text in enumerate(original(self, *args)):
+                yield text + "\ud800" if i == 2 else text
+
+        with patch.object(PDFExtractor, "_iter_raw_texts", planted):
+            extractor = PDFExtractor()
+            full = extractor.extract(str(synthetic_pdf))
+            pages = list(extractor.stream(str(synthetic_pdf)))[1:]
+
+        assert pages == full["pages"]
+        assert "\ud800" not in pages[2]["text"]
+
+    def test_stream_records_cleaning_stats(self, synthetic_pdf):
+        """Streaming reports the same per-rule counts as ``extract()``."""
+        extractor = PDFExtractor()
+        extractor.extract(str(synthetic_pdf))
+        full_counts = {name: st["lines_dropped"] for name, st in extractor.cleaning_stats.items()}
+        list(extractor.stream(str(synthetic_pdf)))
+        stream_counts = {name: st["lines_dropped"] for name, st in extractor.cleaning_stats.items()}
+
+        assert stream_counts == full_counts
+        assert full_counts["nav_bars"] > 0
+
+    def test_streaming_run_writes_ndjson(self, synthetic_pdf, tmp_path):
+        out = tmp_path / "extracted.ndjson"
+        header = run_streaming_extraction(str(synthetic_pdf), output_path=str(out))
+
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1 + header["metadata"]["total_pages"]
+
+        loaded = load_extraction(out)
+        full = PDFExtractor().extract(str(synthetic_pdf))
+        assert loaded["sections"] == full["sections"]
+        assert loaded["pages"] == full["pages"]
+
+
+class TestExtractionStats:
+    def test_metadata_carries_stage_timings_and_counters(self, synthetic_pdf):
+        result = PDFExtractor().extract(str(synthetic_pdf))
+        stats = result["metadata"]["stats"]
+
+        for stage in ("open", "text", "sections", "nav_bar_stats", "top_links", "clean_nav_bars", "total"):
+            assert stage in stats["timings_ms"]
+        counters = stats["counters"]
+        assert counters["pages"] == result["metadata"]["total_pages"] == 12
+        assert counters["sections"] == len(result["sections"])
+        assert counters["links_inspected"] == 12  # one link per page
+        assert counters["nav_bars_lines_dropped"] > 0
+        assert counters["encoding_chars_dropped"] == 0
+        assert counters["spans_scanned"] > 0
+
+    def test_streaming_run_returns_full_stats(self, synthetic_pdf, tmp_path):
+        header = run_streaming_extraction(str(synthetic_pdf), output_path=str(tmp_path / "out.ndjson"))
+        full = PDFExtractor().extract(str(synthetic_pdf))
+
+        streamed = dict(header["metadata"]["stats"]["counters"], peak_rss_mb=None)
+        assert streamed == dict(full["metadata"]["stats"]["counters"], peak_rss_mb=None)
+
+
+class TestLowMemoryMode:
+    @patch("src.extract.LOW_MEMORY_CHUNK_PAGES", 4)
+    def test_output_matches_default_mode(self, synthetic_pdf):
+        default = PDFExtractor(memory_target_mb=0).extract(str(synthetic_pdf))
+        extractor = PDFExtractor(memory_target_mb=1)  # always above target → reopen every chunk
+        low = extractor.extract(str(synthetic_pdf))
+
+        assert low["sections"] == default["sections"]
+        assert low["pages"] == default["pages"]
+        assert low["metadata"]["stats"]["counters"]["pdf_reopens"] == 2  # after pages 4 and 8
+
+    def test_peak_rss_reported(self, synthetic_pdf):
+        counters = PDFExtractor().extract(str(synthetic_pdf))["metadata"]["stats"]["counters"]
+        assert counters["peak_rss_mb"] > 0
+
+
+class TestInMemorySources:
+    @pytest.mark.parametrize("engine", ["pdfplumber", "fitz", "auto"])
+    def test_buffer_matches_path(self, synthetic_pdf, engine):
+        upload = io.BytesIO(synthetic_pdf.read_bytes())
+        upload.name = "report.pdf"  # as on a Streamlit UploadedFile
+        from_path = PDFExtractor(text_engine=engine).extract(str(synthetic_pdf))
+        from_memory = PDFExtractor(text_engine=engine).extract(upload)
+
+        assert from_memory["metadata"]["filename"] == "report.pdf"
+        assert from_memory["sections"] == from_path["sections"]
+        assert from_memory["pages"] == from_path["pages"]
+
+    def test_bytes_are_not_copied(self, synthetic_pdf):
+        data = synthetic_pdf.read_bytes()
+        assert resolve_pdf_source(data).data is data
+        assert resolve_pdf_source(io.BytesIO(data)).data is data
+
+    def test_unsupported_source(self):
+        with pytest.raises(TypeError):
+            resolve_pdf_source(42)
+
+    def test_lazy_and_sections_only_from_bytes(self, synthetic_pdf):
+        data = synthetic_pdf.read_bytes()
+        full = PDFExtractor(text_engine="fitz").extract(str(synthetic_pdf))
+        lazy = PDFExtractor(text_engine="fitz").lazy(data)
+
+        assert lazy["sections"] == PDFExtractor().extract_sections(data)["sections"] == full["sections"]
+        assert lazy["pages"][5] == full["pages"][4]["text"]
+
+
+class TestProgressAndCancellation:
+    def test_events_per_page_and_sections_before_cleaning(self, synthetic_pdf):
+        events = []
+        result = PDFExtractor().extract(str(synthetic_pdf), on_progress=events.append)
+
+        stages = [e.stage for e in events]
+        assert stages == ["text"] * 12 + ["sections"] + ["cleaning"] * 12 + ["done"]
+        assert events[12].sections == result["sections"]
+        fractions = [e.fraction for e in events]
+        assert fractions == sorted(fractions) and fractions[-1] == 1.0
+
+    def test_cancel_stops_between_pages(self, synthetic_pdf):
+        token = CancelToken()
+        seen = []
+
+        def on_progress(event):
+            seen.append(event)
+            if len(seen) == 3:
+                token.cancel()
+
+        with pytest.raises(ExtractionCancelled):
+            PDFExtractor().extract(str(synthetic_pdf), on_progress=on_progress, cancel=token)
+        assert len(seen) == 3
+
+    def test_parallel_cancel_drops_queued_chunks(self, tmp_path):
+        """With workers, a cancel shuts the pool down without waiting for
+        the rest of the text pass."""
+        pdf = build_synthetic_pdf(tmp_path / "long.pdf", pages=48)
+        token = CancelToken()
+        seen = []
+
+        def on_progress(event):
+            seen.append(event)
+            token.cancel()
+
+        shutdown = ProcessPoolExecutor.shutdown
+        with patch.object(ProcessPoolExecutor, "shutdown", autospec=True, side_effect=shutdown) as mock_shutdown:
+            with pytest.raises(ExtractionCancelled):
+                PDFExtractor(workers=2).extract(str(pdf), on_progress=on_progress, cancel=token)
+
+        assert [e.stage for e in seen] == ["text"]
+        mock_shutdown.assert_called_once()
+        assert mock_shutdown.call_args.kwargs == {"wait": False, "cancel_futures": True}
+
+    def test_stream_reports_progress(self, synthetic_pdf):
+        events = []
+        list(PDFExtractor().stream(str(synthetic_pdf), on_progress=events.append))
+        assert [e.stage for e in events].count("cleaning") == 12
+        assert events[-1].stage == "done"
+
+
+class TestTextEngines:
+    def test_fitz_engine_matches_pdfplumber_structure(self, synthetic_pdf):
+        plumber = PDFExtractor(text_engine="pdfplumber").extract(str(synthetic_pdf))
+        fitz_result = PDFExtractor(text_engine="fitz").extract(str(synthetic_pdf))
+
+        assert fitz_result["sections"] == plumber["sections"]
+        for a, b in zip(plumber["pages"], fitz_result["pages"]):
+            assert a["text"].split() == b["text"].split()
+
+
+class TestLazyExtraction:
+    def test_fitz_engine_matches_full_extraction(self, synthetic_pdf):
+        full = PDFExtractor(text_engine="fitz").extract(str(synthetic_pdf))
+        lazy = PDFExtractor(text_engine="fitz").lazy(str(synthetic_pdf))
+
+        assert lazy["sections"] == full["sections"]
+        assert lazy["pages"].page_dicts() == full["pages"]
+
+    def test_default_engine_strips_unlinked_nav_bar(self, tmp_path):
+        """Nav-bar lines counted on fitz text still match pdfplumber's spacing."""
+        pdf = build_synthetic_pdf(tmp_path / "unlinked.pdf", pages=6, nav_link=False)
+        full = PDFExtractor().extract(str(pdf))
+        lazy = PDFExtractor().lazy(str(pdf))
+
+        for n in range(1, 7):
+            assert lazy["pages"][n] == full["pages"][n - 1]["text"]
+        assert "Home" not in full["pages"][0]["text"]
+
+    def test_resolve_extracts_only_selected_pages(self, synthetic_pdf):
+        lazy = PDFExtractor().lazy(str(synthetic_pdf))
+        pages = lazy["pages"]
+        assert pages.extracted == set()
+
+        passages = resolve(lazy, [{"name": "Chapter 2 Overview"}])
+
+        assert passages["Chapter 2 Overview"]["start_page"] == 4
+        assert pages.extracted == {4, 5, 6}
+        assert pages.pages_extracted == 3
+        assert "Body text on page 5." in passages["Chapter 2 Overview"]["text"]
+        assert "Home  About  Investors" not in passages["Chapter 2 Overview"]["text"]
+
+    def test_cache_fills_only_missing_pages(self, synthetic_pdf, tmp_path):
+        cache = ExtractionCache(cache_dir=tmp_path)
+        first = PDFExtractor().lazy(str(synthetic_pdf), cache=cache)
+        resolve(first, [{"name": "Chapter 1 Overview"}])
+
+        second = PDFExtractor().lazy(str(synthetic_pdf), cache=cache)
+        assert second["sections"] == first["sections"]
+        assert second["pages"].extracted == {1, 2, 3}
+
+        resolve(second, [{"name": "Chapter 1"}, {"name": "x", "page_override": "3-4"}])
+        assert second["pages"].pages_extracted == 1
+        assert second["pages"][3] == first["pages"][3]
+
+
+class TestSectionsOnly:
+    def test_outline_sections_match_full_extraction(self, synthetic_pdf):
+        full = PDFExtractor().extract(str(synthetic_pdf))
+        result = PDFExtractor().extract_sections(str(synthetic_pdf))
+
+        assert result["sections"] == full["sections"]
+        assert result["metadata"]["extraction_strategy"] == "toc"
+        assert result["metadata"]["sections_only"] is True
+        assert "pages" not in result
+
+    def test_font_heuristic_without_pdfplumber(self, tmp_path):
+        pdf = build_synthetic_pdf(tmp_path / "no_outline.pdf", outline=False)
+        full = PDFExtractor().extract(str(pdf))
+
+        with patch("src.extract.pdfplumber.open") as plumber_open:
+            result = PDFExtractor().extract_sections(str(pdf))
+
+        plumber_open.assert_not_called()
+        assert result["metadata"]["extraction_strategy"] == "font_heuristic"
+        assert result["sections"] == full["sections"]
@@ -38,7 +38,7 @@ class TestVestasMetadata:
         }
 
     def test_version(self, vestas_result):
-        assert vestas_result["metadata"]["version"] == "1.0"
+        assert vestas_result["metadata"]["version"] == "1.1"
 
     def test_extracted_at_present(self, vestas_result):
         assert "extracted_at" in vestas_result["metadata"]
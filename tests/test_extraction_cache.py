@@ -0,0 +1,148 @@
+"""Tests for extraction_cache.py and the cache path through run_extraction."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.extract import extraction_settings, run_extraction
+from src.extraction_cache import ExtractionCache
+from src.extraction_io import load_extraction
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4 fake bytes")
+    return path
+
+
+class TestCacheKey:
+    def test_same_bytes_same_settings_same_key(self, pdf_file, tmp_path):
+        copy = tmp_path / "copy.pdf"
+        copy.write_bytes(pdf_file.read_bytes())
+        settings = extraction_settings()
+        assert ExtractionCache.key_for(str(pdf_file), settings) == ExtractionCache.key_for(str(copy), settings)
+
+    def test_settings_change_key(self, pdf_file):
+        settings = extraction_settings()
+        changed = dict(settings, heading_font_size=settings["heading_font_size"] + 1)
+        assert ExtractionCache.key_for(str(pdf_file), settings) != ExtractionCache.key_for(str(pdf_file), changed)
+
+    def test_bytes_change_key(self, pdf_file, tmp_path):
+        other = tmp_path / "other.pdf"
+        other.write_bytes(b"%PDF-1.4 different")
+        settings = extraction_settings()
+        assert ExtractionCache.key_for(str(pdf_file), settings) != ExtractionCache.key_for(str(other), settings)
+
+    def test_in_memory_bytes_share_the_file_key(self, pdf_file):
+        """An upload hits the cache entry of the same PDF extracted from disk."""
+        settings = extraction_settings()
+        assert ExtractionCache.key_for(pdf_file.read_bytes(), settings) == ExtractionCache.key_for(str(pdf_file), settings)
+
+
+class TestEviction:
+    def test_lru_entry_evicted_first(self, tmp_path):
+        cache = ExtractionCache(cache_dir=tmp_path, max_bytes=250)
+        cache.put("a", b"x" * 100)
+        cache.put("b", b"x" * 100)
+        # Make "a" older than "b", then touch it via get() so "b" becomes LRU.
+        os.utime(cache.path_for("a"), (1, 1))
+        os.utime(cache.path_for("b"), (2, 2))
+        assert cache.get("a") is not None
+
+        cache.put("c", b"x" * 100)
+
+        assert cache.path_for("a").exists()
+        assert not cache.path_for("b").exists()
+        assert cache.path_for("c").exists()
+
+    def test_new_entry_never_evicted(self, tmp_path):
+        cache = ExtractionCache(cache_dir=tmp_path, max_bytes=10)
+        path = cache.put("big", b"x" * 100)
+        assert path.exists()
+
+    def test_get_missing_entry_is_a_miss(self, tmp_path):
+        assert ExtractionCache(cache_dir=tmp_path).get("absent") is None
+
+
+class TestRunExtractionCache:
+    @pytest.fixture
+    def mock_extractor(self, sample_extracted_data):
+        extractor = MagicMock()
+        extractor.extract.return_value = sample_extracted_data
+        with patch("src.extract.Registry.get_extractor", return_value=extractor):
+            yield extractor
+
+    def test_repeat_extraction_is_a_lookup(self, pdf_file, tmp_path, mock_extractor):
+        out = tmp_path / "out.json"
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"):
+            first = run_extraction(str(pdf_file), output_path=str(out))
+            out.unlink()
+            second = run_extraction(str(pdf_file), output_path=str(out))
+
+        assert mock_extractor.extract.call_count == 1
+        assert second["sections"] == first["sections"] and second["pages"] == first["pages"]
+        assert load_extraction(out) == second
+
+    def test_hit_reports_current_filename_and_time(self, pdf_file, tmp_path, mock_extractor):
+        """Same bytes under another name: fresh filename / timestamp, cached stats."""
+        renamed = tmp_path / "renamed.pdf"
+        renamed.write_bytes(pdf_file.read_bytes())
+        mock_extractor.extract.return_value["metadata"]["stats"] = {"counters": {"pages": 100}}
+
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"):
+            run_extraction(str(pdf_file), output_path=str(tmp_path / "a.json"))
+            hit = run_extraction(str(renamed), output_path=str(tmp_path / "b.json"))
+
+        assert mock_extractor.extract.call_count == 1
+        assert hit["metadata"]["filename"] == "renamed.pdf"
+        assert hit["metadata"]["extracted_at"] != "2025-01-01T00:00:00Z"
+        assert hit["metadata"]["stats"] == {"counters": {"pages": 100}}
+
+    def test_no_cache_always_extracts(self, pdf_file, tmp_path, mock_extractor):
+        out = tmp_path / "out.json"
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"):
+            run_extraction(str(pdf_file), output_path=str(out), use_cache=False)
+            run_extraction(str(pdf_file), output_path=str(out), use_cache=False)
+
+        assert mock_extractor.extract.call_count == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_corrupt_entry_re_extracts(self, pdf_file, tmp_path, mock_extractor):
+        out = tmp_path / "out.json"
+        cache = ExtractionCache(cache_dir=tmp_path / "cache")
+        cache.put(ExtractionCache.key_for(str(pdf_file), extraction_settings()), b"garbage")
+
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"):
+            run_extraction(str(pdf_file), output_path=str(out))
+
+        assert mock_extractor.extract.call_count == 1
+
+    def test_entry_evicted_after_lookup_re_extracts(self, pdf_file, tmp_path, mock_extractor):
+        """An entry deleted between ``get()`` and the read is treated as a miss."""
+        out = tmp_path / "out.json"
+        cache = ExtractionCache(cache_dir=tmp_path / "cache")
+        key = ExtractionCache.key_for(str(pdf_file), extraction_settings())
+        cache.put(key, b"placeholder")
+
+        original_get = ExtractionCache.get
+
+        def get_then_evict(self, key):
+            path = original_get(self, key)
+            path.unlink()
+            return path
+
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"), \
+                patch.object(ExtractionCache, "get", get_then_evict):
+            run_extraction(str(pdf_file), output_path=str(out))
+
+        assert mock_extractor.extract.call_count == 1
+
+    def test_packed_output_path(self, pdf_file, tmp_path, mock_extractor):
+        out = tmp_path / "out.bin"
+        with patch("src.extraction_cache.EXTRACTION_CACHE_DIR", tmp_path / "cache"):
+            result = run_extraction(str(pdf_file), output_path=str(out))
+
+        assert out.read_bytes()[:4] == b"APXB"
+        assert load_extraction(out) == result
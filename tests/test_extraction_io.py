@@ -0,0 +1,78 @@
+"""Tests for extraction_io.py — on-disk formats and format auto-detection."""
+
+import json
+
+import pytest
+
+from src.extraction_io import (
+    ExtractionFormatError,
+    decode_packed,
+    encode_packed,
+    load_extraction,
+    save_extraction,
+    write_ndjson,
+)
+
+
+class TestLoadExtraction:
+    def test_loads_pretty_json(self, tmp_path, sample_extracted_data):
+        path = tmp_path / "extracted.json"
+        path.write_text(json.dumps(sample_extracted_data, indent=2), encoding="utf-8")
+        assert load_extraction(path) == sample_extracted_data
+
+    def test_loads_compact_json(self, tmp_path, sample_extracted_data):
+        """A single-line JSON document must not be mistaken for NDJSON."""
+        path = tmp_path / "extracted.json"
+        path.write_text(json.dumps(sample_extracted_data), encoding="utf-8")
+        assert load_extraction(path) == sample_extracted_data
+
+    def test_ndjson_round_trip(self, tmp_path, sample_extracted_data):
+        path = tmp_path / "extracted.ndjson"
+        header = {"metadata": sample_extracted_data["metadata"], "sections": sample_extracted_data["sections"]}
+        written = write_ndjson([header, *sample_extracted_data["pages"]], path)
+
+        assert written == len(sample_extracted_data["pages"])
+        assert load_extraction(path) == sample_extracted_data
+
+
+class TestPackedFormat:
+    @pytest.mark.parametrize("codec", ["none", "zlib"])
+    def test_round_trip(self, sample_extracted_data, codec):
+        assert decode_packed(encode_packed(sample_extracted_data, codec=codec)) == sample_extracted_data
+
+    def test_zstd_round_trip(self, sample_extracted_data):
+        pytest.importorskip("zstandard")
+        assert decode_packed(encode_packed(sample_extracted_data, codec="zstd")) == sample_extracted_data
+
+    def test_compressed_smaller_than_json(self, sample_extracted_data):
+        pretty = json.dumps(sample_extracted_data, indent=2).encode("utf-8")
+        assert len(encode_packed(sample_extracted_data, codec="zlib")) < len(pretty)
+
+    def test_unknown_codec_rejected(self, sample_extracted_data):
+        with pytest.raises(ValueError, match="Unknown codec"):
+            encode_packed(sample_extracted_data, codec="lzma")
+
+    def test_major_version_mismatch_rejected(self, sample_extracted_data):
+        data = dict(sample_extracted_data, metadata=dict(sample_extracted_data["metadata"], version="2.0"))
+        with pytest.raises(ExtractionFormatError, match="schema version 2.0"):
+            decode_packed(encode_packed(data))
+
+    def test_corrupt_body_rejected(self, sample_extracted_data):
+        packed = encode_packed(sample_extracted_data, codec="zlib")
+        with pytest.raises(ExtractionFormatError, match="Corrupt"):
+            decode_packed(packed[:-20])
+
+    def test_bad_magic_rejected(self):
+        with pytest.raises(ExtractionFormatError):
+            decode_packed(b"{\"metadata\": {}}" + b"\0" * 16)
+
+
+class TestSaveExtraction:
+    @pytest.mark.parametrize("suffix", [".json", ".ndjson", ".bin"])
+    def test_suffix_round_trip(self, tmp_path, sample_extracted_data, suffix):
+        path = save_extraction(sample_extracted_data, tmp_path / f"extracted{suffix}")
+        assert load_extraction(path) == sample_extracted_data
+
+    def test_page_store_suffix(self, tmp_path, sample_extracted_data):
+        path = save_extraction(sample_extracted_data, tmp_path / "extracted.pages")
+        assert load_extraction(path) == sample_extracted_data
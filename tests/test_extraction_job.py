@@ -0,0 +1,45 @@
+"""Tests for extraction_job.py — background extraction with progress and cancellation."""
+
+import io
+
+from src.extraction_io import load_extraction
+from src.extraction_job import CANCELLED, DONE, FAILED, ExtractionJob
+
+
+class TestExtractionJob:
+    def test_runs_to_completion(self, synthetic_pdf, tmp_path):
+        out = tmp_path / "out.json"
+        job = ExtractionJob(str(synthetic_pdf), output_path=str(out), use_cache=False).start()
+
+        assert job.wait(timeout=60)
+        assert job.state == DONE and not job.running
+        assert job.sections == job.result["sections"]
+        assert job.progress.stage == "done" and job.progress.fraction == 1.0
+        assert load_extraction(out)["pages"] == job.result["pages"]
+
+    def test_upload_buffer_is_read_up_front(self, synthetic_pdf, tmp_path):
+        upload = io.BytesIO(synthetic_pdf.read_bytes())
+        job = ExtractionJob(upload, output_path=str(tmp_path / "out.json"), use_cache=False)
+        upload.close()  # the caller may drop the upload once the job exists
+
+        assert job.start().wait(timeout=60)
+        assert job.state == DONE
+
+    def test_cancel_writes_nothing(self, synthetic_pdf, tmp_path):
+        out = tmp_path / "out.json"
+        job = ExtractionJob(str(synthetic_pdf), output_path=str(out), use_cache=False)
+        job.cancel()  # cancelled before the first page
+        job.start().wait(timeout=60)
+
+        assert job.state == CANCELLED
+        assert job.result is None
+        assert not out.exists()
+
+    def test_failure_is_recorded(self, tmp_path):
+        bad = tmp_path / "broken.pdf"
+        bad.write_bytes(b"this is not a pdf")
+        job = ExtractionJob(str(bad), output_path=str(tmp_path / "out.json"), use_cache=False).start()
+
+        job.wait(timeout=60)
+        assert job.state == FAILED
+        assert job.error
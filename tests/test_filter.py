@@ -1,8 +1,19 @@
 """Tests for filter.py — section resolution logic."""
 
+import random
+
 import pytest
 
-from src.filter import SectionNotFoundError, resolve
+from src.filter import (
+    Passage,
+    SectionIndex,
+    SectionNotFoundError,
+    SourcePassages,
+    format_passages,
+    normalise_title,
+    resolve,
+    section_index,
+)
 
 
 @pytest.fixture
@@ -45,6 +56,20 @@ class TestPageOverrides:
         assert result["Financial Highlights"]["start_page"] == 12
         assert result["Financial Highlights"]["end_page"] == 13
 
+    def test_multi_range_override(self, extracted):
+        """'12-15,40,50-52' covers each listed range; overlapping parts merge."""
+        sections = [{"name": "Mixed", "page_override": "50-52, 12-15,40,14-15"}]
+        passage = resolve(extracted, sections)["Mixed"]
+        assert passage.ranges == [(12, 15), (40, 40), (50, 52)]
+        assert (passage["start_page"], passage["end_page"]) == (12, 52)
+        assert "--- Page 40 ---" in passage["text"]
+        assert "--- Page 30 ---" not in passage["text"]
+
+    @pytest.mark.parametrize("override", ["abc", "15-12", "1-2-3", "4,,5"])
+    def test_invalid_override_raises(self, extracted, override):
+        with pytest.raises(ValueError, match="page"):
+            resolve(extracted, [{"name": "X", "page_override": override}])
+
     def test_single_page_override(self, extracted):
         """'42' resolves to pages 42–42."""
         sections = [{"name": "Sustainability", "page_override": "42"}]
@@ -60,6 +85,15 @@ class TestErrorCases:
         with pytest.raises(SectionNotFoundError, match="Completely Made Up Section"):
             resolve(extracted, sections)
 
+    def test_error_lists_ranked_suggestions(self, extracted):
+        """A near miss names the closest titles, best first, not every title."""
+        sections = [{"name": "Finacial Higlights", "page_override": None}]
+        with pytest.raises(SectionNotFoundError) as err:
+            resolve(extracted, sections)
+        message = str(err.value)
+        assert "Closest matches: 'Financial Highlights' (pp. 10–14)" in message
+        assert "Sustainability" not in message
+
     def test_empty_section_list(self, extracted):
         """Empty input list returns empty result without error."""
         result = resolve(extracted, [])
@@ -87,3 +121,108 @@ class TestTextCollection:
         result = resolve(extracted, sections)
         # 'Revenue' is substring of 'Revenue Breakdown' → match
         assert result["Revenue"]["start_page"] == 11
+
+
+class TestSectionIndex:
+    def test_punctuation_and_control_noise(self, extracted):
+        """Titles and names match through punctuation, case and control chars."""
+        extracted["sections"][4]["title"] = "RISK\x07 MANAGEMENT:"
+        sections = [{"name": "risk-management", "page_override": None}]
+        assert resolve(extracted, sections)["risk-management"]["start_page"] == 70
+
+    def test_index_reused_for_same_sections(self, extracted):
+        assert section_index(extracted["sections"]) is section_index(extracted["sections"])
+
+    def test_matches_linear_scan(self):
+        """The indexed match agrees with a substring scan over every title."""
+        rng = random.Random(7)
+        words = ["risk", "management", "financial", "highlights", "capital", "notes", "q&a", "esg"]
+        secs = [
+            {"title": " ".join(rng.choice(words) for _ in range(rng.randint(1, 3))) + rng.choice(["", ":", " —"]),
+             "start_page": i, "end_page": i}
+            for i in range(300)
+        ]
+
+        def scan(name):
+            query, best, best_overlap = normalise_title(name), None, -1
+            for sec in secs:
+                title = normalise_title(sec["title"])
+                if query in title or title in query:
+                    overlap = min(len(query), len(title))
+                    if overlap > best_overlap:
+                        best, best_overlap = sec, overlap
+            return best
+
+        index = SectionIndex(secs)
+        for _ in range(200):
+            name = " ".join(rng.choice(words)[rng.randint(0, 2):] for _ in range(rng.randint(1, 3)))
+            assert index.match(name) is scan(name)
+
+
+class TestPassageViews:
+    @pytest.fixture
+    def passages(self, extracted):
+        return resolve(extracted, [
+            {"name": "Revenue", "page_override": None},
+            {"name": "Cost Structure", "page_override": None},
+        ])
+
+    def test_passages_are_page_range_views(self, passages):
+        assert isinstance(passages, SourcePassages)
+        revenue = passages["Revenue"]
+        assert isinstance(revenue, Passage)
+        assert revenue._text is None  # nothing joined until asked for
+        assert dict(revenue) == {
+            "start_page": 11,
+            "end_page": 12,
+            "text": "--- Page 11 ---\nContent for page 11\n--- Page 12 ---\nContent for page 12",
+        }
+
+    def test_render_once_and_report_sizes(self, passages):
+        rendered = passages.render()
+        assert passages.render() is rendered
+        assert format_passages(passages) is rendered
+        assert rendered == format_passages({name: dict(p) for name, p in passages.items()})
+
+        sizes = passages.rendered_sizes()
+        assert list(sizes) == ["Revenue", "Cost Structure"]
+        assert sum(sizes.values()) + 2 * len(sizes) - 1 == len(rendered)
+
+
+class TestOverlapResolution:
+    def test_parent_and_children_send_each_page_once(self, extracted):
+        """Financial Highlights (10–14) contains Revenue (11–12) and Cost (13–14)."""
+        passages = resolve(extracted, [
+            {"name": "Financial Highlights", "page_override": None},
+            {"name": "Revenue Breakdown", "page_override": None},
+            {"name": "Cost Structure", "page_override": None},
+        ])
+        rendered = passages.render()
+
+        assert passages.duplicate_pages == 4
+        for pn in range(10, 15):
+            assert rendered.count(f"--- Page {pn} ---") == 1
+        assert "--- Pages 11-12: shown above under section 'Financial Highlights' ---" in rendered
+        # Each section still reads its full page range on its own.
+        assert "--- Page 12 ---" in passages["Revenue Breakdown"]["text"]
+        assert passages.page_sections()[11] == ["Financial Highlights", "Revenue Breakdown"]
+
+    def test_partial_overlap_keeps_new_pages(self, extracted):
+        passages = resolve(extracted, [
+            {"name": "A", "page_override": "10-12"},
+            {"name": "B", "page_override": "12-13"},
+        ])
+        rendered = passages.render()
+
+        assert passages.duplicate_pages == 1
+        assert rendered.count("--- Page 12 ---") == 1
+        assert "--- Page 12: shown above under section 'A' ---" in rendered
+        assert rendered.count("--- Page 13 ---") == 1
+
+    def test_disjoint_selection_removes_nothing(self, extracted):
+        passages = resolve(extracted, [
+            {"name": "Revenue", "page_override": None},
+            {"name": "Sustainability", "page_override": "42"},
+        ])
+        assert passages.duplicate_pages == 0
+        assert "shown above" not in passages.render()
@@ -1,8 +1,11 @@
 """Tests for generate.py — agent loop logic.  All LLM calls are mocked."""
 
+import asyncio
+import gc
 import json
+import threading
 from collections import OrderedDict
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,9 +16,14 @@ from src.generate import (
     run_generation,
 )
 from src.utility.llm_utility import (
+    LLMCallError,
     _llm_call_budget,
+    _run_with_retry,
+    _run_with_retry_async,
     log_llm_call,
+    run_sync,
 )
+from src.utility.token_budget import RESPONSE_RESERVE_TOKENS, estimate_tokens
 
 
 # ── helpers ────────────────────────────────────────────────────────────────
@@ -110,7 +118,7 @@ def _patch_prompts():
 @patch("src.generate.Registry.get_agent")  # prevent real Agent / OpenAI init
 class TestAgentLoop:
     @patch("src.generate.log_llm_call")
-    @patch("src.generate._run_with_retry")
+    @patch("src.generate._run_with_retry_async")
     def test_loop_stops_when_score_meets_threshold(self, mock_run, mock_log, _mock_agent):
         """Loop exits after evaluation returns overall ≥ SCORE_THRESHOLD."""
         mock_run.side_effect = [
@@ -127,7 +135,7 @@ class TestAgentLoop:
         assert mock_run.call_count == 3
 
     @patch("src.generate.log_llm_call")
-    @patch("src.generate._run_with_retry")
+    @patch("src.generate._run_with_retry_async")
     def test_loop_stops_at_max_iterations(self, mock_run, mock_log, _mock_agent):
         """Loop exits after MAX_AGENT_ITERATIONS even if score stays low."""
         max_iter = 2
@@ -146,7 +154,7 @@ class TestAgentLoop:
         assert mock_run.call_count == 2 + max_iter * 2
 
     @patch("src.generate.log_llm_call")
-    @patch("src.generate._run_with_retry")
+    @patch("src.generate._run_with_retry_async")
     def test_improver_not_called_when_score_sufficient(self, mock_run, mock_log, _mock_agent):
         """If first evaluation passes, Improver is never invoked."""
         mock_run.side_effect = [
@@ -162,7 +170,7 @@ class TestAgentLoop:
         assert mock_run.call_count == 3
 
     @patch("src.generate.log_llm_call")
-    @patch("src.generate._run_with_retry")
+    @patch("src.generate._run_with_retry_async")
     def test_generator_called_exactly_once(self, mock_run, mock_log, _mock_agent):
         """Generator runs only at the start, not inside the loop."""
         mock_run.side_effect = [
@@ -181,6 +189,36 @@ class TestAgentLoop:
         # key_points and generator are each called once only.
         assert mock_run.call_count == 5
 
+    @patch("src.generate.log_llm_call")
+    @patch("src.generate._run_with_retry_async")
+    def test_long_script_shrinks_evaluator_and_improver_source(self, mock_run, mock_log, _mock_agent):
+        """Prompts that embed the script budget for its real length, not the reserve."""
+        long_script = "word " * 10_000  # well past SCRIPT_RESERVE_TOKENS
+        mock_run.side_effect = [
+            _mock_result(_mock_key_points()),
+            _mock_result(long_script),
+            _mock_result(_low_scores()),
+            _mock_result("Improved"),
+        ]
+        passages = OrderedDict([
+            ("Section A", {"start_page": 1, "end_page": 5, "text": "--- Page 1 ---\n" + "Revenue grew strongly across every region this year\n" * 4000}),
+        ])
+
+        with patch("src.utility.token_budget.MODEL_CONTEXT_TOKENS", 20_000), \
+             patch("src.generate.MAX_AGENT_ITERATIONS", 1), \
+             patch("src.generate.SCORE_THRESHOLD", 100):
+            run_generation(passages)
+
+        prompts = [c.args[1] for c in mock_run.call_args_list]
+        gen_source = prompts[1].split(" from: ", 1)[1].split(" target: ", 1)[0]
+        eval_source = prompts[2].split(" source: ", 1)[1]
+        imp_source = prompts[3].split(" source: ", 1)[1].split(" checklist: ", 1)[0]
+
+        assert estimate_tokens(eval_source) < estimate_tokens(gen_source)
+        assert estimate_tokens(imp_source) < estimate_tokens(gen_source)
+        for prompt in prompts[2:]:
+            assert estimate_tokens(prompt) <= 20_000 - RESPONSE_RESERVE_TOKENS
+
 
 class TestLLMLog:
     def test_llm_log_entries_written(self, tmp_path):
@@ -201,3 +239,51 @@ class TestLLMLog:
         assert entry["response_length_chars"] == len("test output")
         assert "usage" in entry
         assert entry["scores"] is None
+
+
+class TestAsyncCalls:
+    def test_retry_backs_off_without_blocking(self):
+        """Failures are retried after an awaited asyncio.sleep, not time.sleep."""
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=[RuntimeError("429"), RuntimeError("500"), "ok"])
+
+        with patch("src.utility.llm_utility.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            assert asyncio.run(_run_with_retry_async(agent, "prompt")) == "ok"
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+        agent.run_sync.assert_not_called()
+
+    def test_retry_gives_up(self):
+        agent = MagicMock()
+        agent.run = AsyncMock(side_effect=RuntimeError("down"))
+
+        with patch("src.utility.llm_utility.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(LLMCallError):
+                _run_with_retry(agent, "prompt", max_retries=2)
+        assert agent.run.await_count == 2
+
+    def test_sync_bridge_reuses_one_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    def test_sync_bridge_closes_loop_when_thread_exits(self):
+        """Short-lived callers (Streamlit script runs, workers) do not leak loops."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loops = []
+        worker = threading.Thread(target=lambda: loops.append(run_sync(current_loop())))
+        worker.start()
+        worker.join()
+        gc.collect()
+
+        assert loops[0].is_closed()
+
+    def test_sync_bridge_refuses_running_loop(self):
+        async def nested():
+            return run_generation(_sample_passages())
+
+        with pytest.raises(RuntimeError, match="_async"):
+            asyncio.run(nested())
@@ -1,6 +1,6 @@
 """Integration tests for generate.py using pydantic-ai TestModel.
 
-These tests exercise the real Agent.run_sync → AgentRunResult.output path
+These tests exercise the real Agent.run → AgentRunResult.output path
 without hitting the OpenAI API.  They catch breakage caused by pydantic-ai
 version upgrades (e.g. the 0.x → 1.x rename of .data → .output).
 """
@@ -200,7 +200,7 @@ class TestImproverAgent:
 
         # Evaluator will be called twice: first low, then passing.
         # TestModel is stateless so we need to swap it between calls.
-        # We achieve this by letting _run_with_retry hit the real agents
+        # We achieve this by letting _run_with_retry_async hit the real agents
         # but controlling the evaluator via side-effect on Registry.get_agent.
         eval_call_count = {"n": 0}
         low_eval_agent = _make_agent(
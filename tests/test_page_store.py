@@ -0,0 +1,93 @@
+"""Tests for page_store.py — indexed page store and lazy section resolution."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.extract import run_extraction
+from src.extraction_io import load_extraction
+from src.filter import resolve
+from src.page_store import PageStore, PageStoreError, write_page_store
+
+
+@pytest.fixture
+def store_path(tmp_path, sample_extracted_data):
+    return write_page_store(sample_extracted_data, tmp_path / "extracted.pages")
+
+
+class TestPageStore:
+    def test_round_trip(self, store_path, sample_extracted_data):
+        with PageStore(store_path) as store:
+            assert store.metadata == sample_extracted_data["metadata"]
+            assert store.sections == sample_extracted_data["sections"]
+            assert store.page_dicts() == sample_extracted_data["pages"]
+
+    def test_random_access_decodes_single_page(self, store_path):
+        with PageStore(store_path) as store:
+            assert store[42] == "Content for page 42"
+            assert store.get(999, "") == ""
+            assert store.pages_read == 1
+
+    def test_non_ascii_text(self, tmp_path, sample_extracted_data):
+        data = dict(sample_extracted_data, pages=[{"page_number": 1, "text": "Vestas’ CO₂ — 12 %"}])
+        with PageStore(write_page_store(data, tmp_path / "u.pages")) as store:
+            assert store[1] == "Vestas’ CO₂ — 12 %"
+
+    def test_rejects_json_file(self, tmp_path, sample_extracted_data):
+        path = tmp_path / "extracted.json"
+        path.write_text(json.dumps(sample_extracted_data), encoding="utf-8")
+        with pytest.raises(PageStoreError):
+            PageStore(path)
+
+    @pytest.mark.parametrize("keep", [0, 3, 20, -5], ids=["empty", "preamble", "header", "blobs"])
+    def test_rejects_truncated_file_and_closes_it(self, store_path, tmp_path, keep):
+        data = store_path.read_bytes()
+        path = tmp_path / "truncated.pages"
+        path.write_bytes(data[:keep])
+
+        close = PageStore.close
+        with patch.object(PageStore, "close", autospec=True, side_effect=close) as mock_close:
+            with pytest.raises(PageStoreError, match="truncated|not a page store"):
+                PageStore(path)
+        assert mock_close.call_count == (0 if keep == 0 else 1)  # an empty file is never mapped
+
+
+class TestLazyResolve:
+    def test_load_extraction_reads_store_and_closes_it(self, store_path, sample_extracted_data):
+        close = PageStore.close
+        with patch.object(PageStore, "close", autospec=True, side_effect=close) as mock_close:
+            data = load_extraction(store_path)
+
+        assert data == sample_extracted_data
+        mock_close.assert_called_once()
+
+    def test_lazy_load_returns_open_store(self, store_path):
+        data = load_extraction(store_path, lazy=True)
+        with data["pages"] as store:
+            assert isinstance(store, PageStore)
+            assert store.pages_read == 0
+
+    def test_resolve_reads_only_selected_pages(self, store_path, sample_extracted_data, sample_sections_config):
+        data = load_extraction(store_path, lazy=True)
+        with data["pages"] as store:
+            from_store = resolve(data, sample_sections_config)
+            from_json = resolve(sample_extracted_data, sample_sections_config)
+
+            assert from_store == from_json
+            # Financial Highlights (10–14) + Sustainability override (50–55).
+            assert store.pages_read == 5 + 6
+
+
+class TestRunExtractionPageStore:
+    def test_pages_suffix_writes_store(self, tmp_path, sample_extracted_data):
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 fake")
+        extractor = MagicMock()
+        extractor.extract.return_value = sample_extracted_data
+
+        with patch("src.extract.Registry.get_extractor", return_value=extractor):
+            run_extraction(str(pdf), output_path=str(tmp_path / "out.pages"), use_cache=False)
+
+        with PageStore(tmp_path / "out.pages") as store:
+            assert store.page_dicts() == sample_extracted_data["pages"]
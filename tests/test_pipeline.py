@@ -2,13 +2,15 @@
 file I/O uses a temporary directory.
 """
 
+import asyncio
 import json
 from collections import OrderedDict
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.pipeline import PipelineResult, run_pipeline
+from src.pipeline import PipelineResult, run_pipeline, run_pipeline_async
+from src.utility.token_budget import TokenBudgetError
 
 
 # ── fixtures ───────────────────────────────────────────────────────────────
@@ -41,8 +43,8 @@ def sample_extracted(sample_extracted_data):
 
 
 class TestFullPipeline:
-    @patch("src.pipeline.verify.run_verification")
-    @patch("src.pipeline.generate.run_generation")
+    @patch("src.pipeline.verify.run_verification_async")
+    @patch("src.pipeline.generate.run_generation_async")
     @patch("src.pipeline.section_filter.resolve")
     def test_full_pipeline_writes_all_outputs(
         self, mock_resolve, mock_generate, mock_verify, tmp_path, sample_extracted, mock_resolved_passages, mock_verification
@@ -67,8 +69,8 @@ class TestFullPipeline:
         report_on_disk = json.loads((tmp_path / "verification_report.json").read_text())
         assert report_on_disk == mock_verification
 
-    @patch("src.pipeline.verify.run_verification")
-    @patch("src.pipeline.generate.run_generation")
+    @patch("src.pipeline.verify.run_verification_async")
+    @patch("src.pipeline.generate.run_generation_async")
     @patch("src.pipeline.section_filter.resolve")
     def test_pipeline_result_fields(
         self, mock_resolve, mock_generate, mock_verify, tmp_path, sample_extracted, mock_resolved_passages, mock_verification
@@ -90,8 +92,8 @@ class TestFullPipeline:
         assert result.verification == mock_verification
         assert result.word_count == 5
 
-    @patch("src.pipeline.verify.run_verification")
-    @patch("src.pipeline.generate.run_generation")
+    @patch("src.pipeline.verify.run_verification_async")
+    @patch("src.pipeline.generate.run_generation_async")
     @patch("src.pipeline.section_filter.resolve")
     def test_progress_callback_called(
         self, mock_resolve, mock_generate, mock_verify, tmp_path, sample_extracted, mock_resolved_passages, mock_verification
@@ -121,3 +123,50 @@ class TestFullPipeline:
         # Fractions should be non-decreasing (pipeline-level calls).
         pipeline_fracs = [f for f in fracs if f in (0.0, 0.15, 0.75, 0.9, 1.0)]
         assert pipeline_fracs == sorted(pipeline_fracs)
+
+    @patch("src.pipeline.verify.run_verification_async")
+    @patch("src.pipeline.generate.run_generation_async")
+    def test_oversized_selection_refused_before_llm_calls(
+        self, mock_generate, mock_verify, tmp_path, sample_extracted
+    ):
+        """A selection that cannot fit the prompts fails the token preflight."""
+        with patch("src.utility.token_budget.MODEL_CONTEXT_TOKENS", 2000), patch("src.pipeline.OUTPUT_DIR", tmp_path):
+            with pytest.raises(TokenBudgetError):
+                run_pipeline(sample_extracted, [{"name": "Financial Highlights", "page_override": None}])
+
+        mock_generate.assert_not_called()
+        mock_verify.assert_not_called()
+        assert not (tmp_path / "podcast_script.txt").exists()
+
+
+class TestAsyncPipeline:
+    @patch("src.pipeline.verify.run_verification_async")
+    @patch("src.pipeline.generate.run_generation_async")
+    def test_concurrent_runs_share_the_event_loop(
+        self, mock_generate, mock_verify, tmp_path, sample_extracted, mock_verification
+    ):
+        """Two pipelines awaited together interleave instead of blocking."""
+        order: list[str] = []
+
+        async def slow_generation(source_passages, progress_callback=None):
+            name = next(iter(source_passages))
+            order.append(f"start {name}")
+            await asyncio.sleep(0.01)
+            order.append(f"end {name}")
+            return f"Script about {name}."
+
+        mock_generate.side_effect = slow_generation
+        mock_verify.return_value = mock_verification
+
+        async def both():
+            return await asyncio.gather(
+                run_pipeline_async(sample_extracted, [{"name": "Revenue", "page_override": None}]),
+                run_pipeline_async(sample_extracted, [{"name": "Sustainability", "page_override": "42"}]),
+            )
+
+        with patch("src.pipeline.OUTPUT_DIR", tmp_path):
+            first, second = asyncio.run(both())
+
+        assert first.script == "Script about Revenue."
+        assert second.script == "Script about Sustainability."
+        assert order.index("start Sustainability") < order.index("end Revenue")
@@ -0,0 +1,154 @@
+"""Tests for utility/token_budget.py — estimation, allocation, trimming and preflight."""
+
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pytest
+
+from src.filter import resolve
+from src.utility.token_budget import (
+    GAP_MARKER,
+    SourceBudgeter,
+    TokenBudgetError,
+    budget_source,
+    estimate_tokens,
+    fair_shares,
+    preflight,
+    trim_to_tokens,
+)
+
+
+def _page_text(pages: int, lines: int = 20) -> str:
+    parts = []
+    for p in range(1, pages + 1):
+        parts.append(f"--- Page {p} ---")
+        for i in range(lines):
+            if i % 5 == 4:
+                parts.append(f"Revenue grew to EUR {p}{i},300m and EBIT to {i}.{p}%")
+            else:
+                parts.append(f"Narrative line {i} on page about strategy and the outlook for the business")
+    return "\n".join(parts)
+
+
+class TestEstimation:
+    def test_estimate_counts_words_numbers_and_punctuation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("Revenue grew.") == 3
+        assert estimate_tokens("EUR 17,300m") == 5  # EUR · 17 · , · 300 · m
+        assert estimate_tokens("decarbonisation") == 3
+
+    def test_fair_shares_give_small_demands_everything(self):
+        shares = fair_shares({"a": 100, "b": 5000, "c": 300}, 1000)
+        assert shares == {"a": 100, "b": 600, "c": 300}
+        assert list(shares) == ["a", "b", "c"]
+
+    def test_fair_shares_within_budget(self):
+        shares = fair_shares({"a": 800, "b": 800, "c": 800}, 1000)
+        assert sum(shares.values()) <= 1000
+        assert max(shares.values()) - min(shares.values()) <= 1
+
+
+class TestTrimming:
+    def test_short_text_untouched(self):
+        text = _page_text(1, lines=3)
+        assert trim_to_tokens(text, 10_000) is text
+
+    def test_keeps_start_and_numeric_lines_within_budget(self):
+        text = _page_text(6)
+        trimmed = trim_to_tokens(text, 400)
+
+        assert estimate_tokens(trimmed) <= 400
+        lines = trimmed.split("\n")
+        assert lines[:2] == ["--- Page 1 ---", "Narrative line 0 on page about strategy and the outlook for the business"]
+        assert GAP_MARKER in lines
+        # Past the opening, only number-dense lines survive.
+        last_page = trimmed.split("--- Page 6 ---\n", 1)[1].split("\n")
+        assert any(line.startswith("Revenue grew") for line in last_page)
+        assert not any(line.startswith("Narrative") for line in last_page)
+        assert trim_to_tokens(text, 400) == trimmed  # deterministic
+
+    def test_page_marker_kept_only_with_page_content(self):
+        trimmed = trim_to_tokens(_page_text(6), 200)
+        for line in trimmed.split("\n"):
+            if line.startswith("--- Page"):
+                following = trimmed.split(line + "\n", 1)[1].split("\n", 1)[0]
+                assert not following.startswith("--- Page")
+
+
+class TestBudgetedSource:
+    @pytest.fixture
+    def passages(self):
+        return OrderedDict([
+            ("Big", {"start_page": 1, "end_page": 8, "text": _page_text(8)}),
+            ("Small", {"start_page": 9, "end_page": 9, "text": "--- Page 9 ---\nShort note on 2024."}),
+        ])
+
+    def test_fits_without_trimming(self, passages):
+        budgeted = budget_source(passages, 100_000)
+        assert budgeted.saved_tokens == 0
+        assert "Short note on 2024." in budgeted.text
+
+    def test_over_budget_keeps_small_sections_whole(self, passages):
+        budgeted = budget_source(passages, 600)
+
+        assert budgeted.tokens <= 600 < budgeted.original_tokens
+        assert budgeted.saved_tokens == budgeted.original_tokens - budgeted.tokens
+        assert "=== Section: Big (Pages 1-8) ===" in budgeted.text
+        assert "--- Page 9 ---\nShort note on 2024." in budgeted.text
+
+    def test_budgeter_reuses_text_and_counts_savings_per_call(self, passages):
+        budgeter = SourceBudgeter(passages)
+        with patch.dict("src.utility.token_budget.SOURCE_TOKEN_BUDGETS", {"evaluator": 600}):
+            first = budgeter.for_agent("evaluator", "Evaluate: {{script}} {{source_text}}")
+            second = budgeter.for_agent("evaluator", "Evaluate: {{script}} {{source_text}}")
+        assert first is second
+        saved = estimate_tokens(budget_source(passages, 10**9).text) - estimate_tokens(first)
+        assert budgeter.saved_by_agent == {"evaluator": 2 * saved}
+        assert budgeter.saved_tokens == 2 * saved
+
+    def test_budgeter_measures_source_once(self, sample_extracted_data):
+        """New budgets reuse the rendered source and its token estimate."""
+        passages = resolve(sample_extracted_data, [{"name": "Financial Highlights", "page_override": None}])
+        rendered = passages.render()
+        budgeter = SourceBudgeter(passages)
+
+        with patch("src.utility.token_budget.estimate_tokens", wraps=estimate_tokens) as mock_estimate:
+            texts = [budgeter.for_agent("evaluator", "E {{script}} {{source_text}}", script="x " * n) for n in (1, 2, 3)]
+
+        assert all(text is rendered for text in texts)
+        assert sum(call.args[0] is rendered for call in mock_estimate.call_args_list) == 1
+
+    def test_section_savings_counted_per_call(self):
+        budgeter = SourceBudgeter({})
+        text = _page_text(8)
+        with patch.dict("src.utility.token_budget.SOURCE_TOKEN_BUDGETS", {"coverage": 300}):
+            trimmed = budgeter.for_section("coverage", "Cover {{section_text}}", text)
+            budgeter.for_section("coverage", "Cover {{section_text}}", text)
+
+        assert estimate_tokens(trimmed) <= 300
+        assert budgeter.saved_by_agent == {"coverage": 2 * (estimate_tokens(text) - estimate_tokens(trimmed))}
+
+
+class TestPreflight:
+    def test_passes_and_reports_budgets(self, sample_extracted_data):
+        passages = resolve(sample_extracted_data, [{"name": "Revenue", "page_override": None}])
+        budgets = preflight(passages)
+        assert set(budgets) == {"key_points", "generator", "evaluator", "improver", "claims", "coverage"}
+
+    def test_refuses_selection_that_cannot_fit(self, sample_extracted_data):
+        sample_extracted_data["pages"] = [
+            {"page_number": i, "text": _page_text(1, lines=40)} for i in range(1, 101)
+        ]
+        passages = resolve(sample_extracted_data, [
+            {"name": "Sustainability", "page_override": None},
+            {"name": "Risk Management", "page_override": None},
+        ])
+        with patch.dict("src.utility.token_budget.SOURCE_TOKEN_BUDGETS", {"generator": 300}):
+            with pytest.raises(TokenBudgetError, match=r"generator \(needs \d+ source tokens, budget 300\)"):
+                preflight(passages)
+
+    def test_small_window_refused(self, sample_extracted_data):
+        passages = resolve(sample_extracted_data, [{"name": "Revenue", "page_override": None}])
+        with patch("src.utility.token_budget.MODEL_CONTEXT_TOKENS", 4096):
+            with pytest.raises(TokenBudgetError, match="MODEL_CONTEXT_TOKENS"):
+                preflight(passages)